@@ -0,0 +1,47 @@
+"""
+Benchmark the time it takes to import OpenSCM.
+
+Each module is imported in a fresh interpreter (so that nothing is cached between
+measurements) and the median wall time over several repetitions is reported.
+
+Usage: ``python benchmarks/import_time.py [repetitions]``
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = ["openscm", "openscm.core", "openscm.scmdataframe"]
+
+
+def time_import(module: str, repetitions: int) -> float:
+    """
+    Get the median time (in seconds) to import ``module`` in a fresh interpreter.
+    """
+    # time of starting the interpreter only, to be subtracted
+    baseline = []
+    timings = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        baseline.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import {}".format(module)], check=True)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings) - statistics.median(baseline)
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print("{:<25} {:>10}".format("module", "import [s]"))
+    for module in MODULES:
+        print("{:<25} {:>10.3f}".format(module, time_import(module, repetitions)))
+
+
+if __name__ == "__main__":
+    main()
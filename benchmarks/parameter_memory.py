@@ -0,0 +1,69 @@
+"""
+Benchmark the memory used by the parameters of a parameter set.
+
+Builds a synthetic :class:`openscm.core.ParameterSet` with scalar leaf parameters
+spread over several regions and a three-level parameter hierarchy, and reports the
+memory allocated while building it (as traced by :mod:`tracemalloc`) per parameter.
+
+Usage: ``python benchmarks/parameter_memory.py [leaves]``
+"""
+import sys
+import tracemalloc
+
+from openscm.core import ParameterSet
+from openscm.parameters import ParameterType
+
+N_REGIONS = 10
+"""Number of regions (below the root region) the leaves are spread over"""
+
+N_CHILDREN = 100
+"""Number of children of each non-leaf parameter"""
+
+
+def build(n_leaves: int) -> ParameterSet:
+    """
+    Build a parameter set with ``n_leaves`` scalar leaf parameters.
+    """
+    parameters = ParameterSet()
+    parameters.set_many(
+        [
+            (
+                (
+                    "Group {}".format(i // N_CHILDREN ** 2),
+                    "Parameter {}".format(i // N_CHILDREN % N_CHILDREN),
+                    "Leaf {}".format(i % N_CHILDREN),
+                ),
+                ("World", "Region {}".format(i % N_REGIONS)),
+                "K",
+                ParameterType.SCALAR,
+                1.0,
+            )
+            for i in range(n_leaves)
+        ]
+    )
+    return parameters
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    n_leaves = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    build(N_CHILDREN)  # warm up caches (unit registry etc.)
+
+    tracemalloc.start()
+    parameters = build(n_leaves)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # all (leaf and non-leaf) parameters
+    n_parameters = len(parameters._root._parameter_index)  # pylint: disable=W0212
+    print("{:<25} {:>12}".format("leaves", n_leaves))
+    print("{:<25} {:>12}".format("parameters", n_parameters))
+    print("{:<25} {:>12.1f}".format("total [MB]", used / 1e6))
+    print("{:<25} {:>12.1f}".format("bytes per leaf", used / n_leaves))
+    print("{:<25} {:>12.1f}".format("bytes per parameter", used / n_parameters))
+
+
+if __name__ == "__main__":
+    main()
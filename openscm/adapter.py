@@ -6,9 +6,18 @@ All model adapters in OpenSCM are implemented as subclasses of the
 """
 
 from abc import ABCMeta, abstractmethod
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
 
 from .core import ParameterSet
 
+BatchKey = Tuple[Tuple[str, ...], Tuple[str, ...], str]
+"""
+Parameter in a batch run: :ref:`hierarchical name <parameter-hierarchy>`,
+hierarchical region name and unit
+"""
+
 
 class Adapter(metaclass=ABCMeta):
     """
@@ -35,6 +44,9 @@ class Adapter(metaclass=ABCMeta):
     _parameters: ParameterSet
     """Input parameter set"""
 
+    _shut_down: bool
+    """True if model has been shut down via :func:`shutdown`"""
+
     _start_time: int
     """
     Beginning of the time range to run over (seconds since
@@ -61,13 +73,38 @@ class Adapter(metaclass=ABCMeta):
         self._parameters = input_parameters
         self._output = output_parameters
         self._initialized = False
+        self._shut_down = False
         self._current_time = 0
 
     def __del__(self) -> None:
         """
         Destructor.
         """
-        self._shutdown()
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Shut the model down.
+
+        Does nothing if the model has already been shut down. Otherwise called
+        automatically when the adapter is destroyed, but can be called earlier to free
+        the model's resources deterministically.
+        """
+        if not self._shut_down:
+            self._shut_down = True
+            self._shutdown()
+
+    def initialize_model(self) -> None:
+        """
+        Initialize the model (e.g. load its binaries and configuration).
+
+        Does nothing if the model has already been initialized. Otherwise called
+        automatically before the model input or run parameters are initialized, but
+        can be called earlier to pay the model's start-up cost up front.
+        """
+        if not self._initialized:
+            self._initialize_model()
+            self._initialized = True
 
     def initialize_model_input(self) -> None:
         """
@@ -76,9 +113,7 @@ class Adapter(metaclass=ABCMeta):
         Called before the adapter is used in any way and at most once before a call to
         `run` or `step`.
         """
-        if not self._initialized:
-            self._initialize_model()
-            self._initialized = True
+        self.initialize_model()
         self._initialize_model_input()
 
     def initialize_run_parameters(self, start_time: int, stop_time: int) -> None:
@@ -97,9 +132,7 @@ class Adapter(metaclass=ABCMeta):
             End of the time range to run over (including; seconds since
             ``1970-01-01 00:00:00``)
         """
-        if not self._initialized:
-            self._initialize_model()
-            self._initialized = True
+        self.initialize_model()
         self._start_time = start_time
         self._stop_time = stop_time
         self._initialize_run_parameters()
@@ -120,6 +153,51 @@ class Adapter(metaclass=ABCMeta):
         """
         self._run()
 
+    @classmethod
+    def supports_batch(cls) -> bool:
+        """
+        Check whether the adapter can run several ensemble members at once via
+        :func:`run_batch`
+
+        Returns
+        -------
+        bool
+            True if the adapter implements ``_run_batch``
+        """
+        return cls._run_batch is not Adapter._run_batch
+
+    def run_batch(
+        self, inputs: Dict[BatchKey, np.ndarray], time_points: Sequence[int]
+    ) -> Dict[BatchKey, np.ndarray]:
+        """
+        Run the model over the full time range for several ensemble members at once.
+
+        All members use the input parameter set except for the parameters in
+        ``inputs``. Only available if :func:`supports_batch` is True, ensemble
+        drivers fall back to one :func:`run` per member otherwise.
+
+        Parameters
+        ----------
+        inputs
+            Scalar parameters which differ between members, with one value per
+            member (in the given unit)
+        time_points
+            Time points (seconds since ``1970-01-01 00:00:00``) of the output
+            timeseries
+
+        Returns
+        -------
+        Dict[BatchKey, np.ndarray]
+            Output timeseries (in the given unit) with one row per member and one
+            column per time point
+
+        Raises
+        ------
+        NotImplementedError
+            The adapter does not support batch runs
+        """
+        return self._run_batch(inputs, np.asarray(time_points))
+
     def step(self) -> int:
         """
         Do a single time step.
@@ -176,6 +254,18 @@ class Adapter(metaclass=ABCMeta):
         Run the model over the full time range.
         """
 
+    def _run_batch(
+        self, inputs: Dict[BatchKey, np.ndarray], time_points: np.ndarray
+    ) -> Dict[BatchKey, np.ndarray]:
+        """
+        To be implemented by specific adapters which can vectorise their model across
+        ensemble members.
+
+        Run the model over the full time range for several ensemble members at once,
+        see :func:`run_batch`.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _shutdown(self) -> None:
         """
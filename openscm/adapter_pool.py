@@ -0,0 +1,416 @@
+"""
+Pools of initialized adapters.
+
+Initializing a model (see :func:`openscm.adapter.Adapter.initialize_model`) can be
+expensive, e.g. for compiled models which have to load binaries and configuration
+files. An :class:`AdapterPool` keeps initialized adapters of a model alive between
+runs so that the start-up cost is only paid once per adapter instance.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
+
+from .adapter import Adapter
+from .adapters import load_adapter
+from .core import ParameterSet
+
+
+# the settings and the bookkeeping of the pool are all guarded by the same lock and
+# kept as flat attributes
+class AdapterPool:  # pylint: disable=too-many-instance-attributes
+    """
+    Pool of initialized adapters of a single model.
+
+    Adapters are checked out for a run with :meth:`checkout` (or, preferably, the
+    :meth:`adapter` context manager) and returned with :meth:`checkin`, which resets
+    them for the next run. Hence only new adapters (see :meth:`n_runs`) have to be
+    reset before their first run. Adapters which fail a health check, raised an error or
+    have done ``max_runs`` runs are shut down and discarded instead of being returned
+    to the pool. :meth:`close` (or leaving the pool's ``with`` block) shuts down all
+    adapters.
+
+    The pool is thread-safe. As a pooled adapter is re-used with different parameter
+    sets, adapters must not hold on to views of their parameter sets in
+    ``_initialize_model``.
+
+    .. code:: python
+
+        >>> with AdapterPool("MODELNAME", max_size=4) as pool:
+        ...     with pool.adapter(input_parameters, output_parameters) as adapter:
+        ...         adapter.initialize_model_input()
+        ...         adapter.initialize_run_parameters(start_time, stop_time)
+        ...         if not pool.n_runs(adapter):
+        ...             adapter.reset()
+        ...         adapter.run()
+    """
+
+    _adapter_cls: type
+    """Adapter class of the model"""
+
+    _available: threading.Condition
+    """Condition notified whenever an adapter is checked in"""
+
+    _checked_out: Set[int]
+    """Adapters currently checked out (by ``id``)"""
+
+    _closed: bool
+    """True if the pool has been closed"""
+
+    _health_check: Optional[Callable[[Adapter], bool]]
+    """Function returning False if an adapter should not be re-used"""
+
+    _idle: List[Adapter]
+    """Initialized adapters which are not checked out"""
+
+    _max_runs: Optional[int]
+    """Number of runs after which an adapter is replaced (``None`` for no limit)"""
+
+    _max_size: Optional[int]
+    """Maximum number of adapters alive at once (``None`` for no limit)"""
+
+    _n_alive: int
+    """Number of adapters alive (idle or checked out)"""
+
+    _n_runs: Dict[int, int]
+    """Number of runs done by each adapter (by ``id``)"""
+
+    def __init__(
+        self,
+        model: Union[str, type],
+        max_size: Optional[int] = None,
+        max_runs: Optional[int] = None,
+        health_check: Optional[Callable[[Adapter], bool]] = None,
+    ):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        model
+            Name of the SCM (see :func:`openscm.adapters.load_adapter`) or its adapter
+            class
+        max_size
+            Maximum number of adapters alive at once (``None`` for no limit)
+        max_runs
+            Number of runs after which an adapter is discarded and replaced by a new
+            one (``None`` for no limit)
+        health_check
+            Function called on each checked in adapter, if it returns False the
+            adapter is discarded rather than re-used
+
+        Raises
+        ------
+        AdapterNeedsModuleError
+            Adapter needs a module that is not installed
+        KeyError
+            Adapter/model not found
+        """
+        self._adapter_cls = (
+            load_adapter(model) if isinstance(model, str) else model  # type: ignore
+        )
+        self._available = threading.Condition()
+        self._checked_out = set()
+        self._closed = False
+        self._health_check = health_check
+        self._idle = []
+        self._max_runs = max_runs
+        self._max_size = max_size
+        self._n_alive = 0
+        self._n_runs = {}
+
+    def __len__(self) -> int:
+        """
+        Get the number of adapters alive (idle or checked out)
+        """
+        return self._n_alive
+
+    def __enter__(self) -> "AdapterPool":
+        """
+        Enter the pool's ``with`` block
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Close the pool when leaving its ``with`` block
+        """
+        self.close()
+
+    def _create(self) -> Adapter:
+        """
+        Create and initialize a new adapter
+
+        The adapter has to be counted as alive already. If creating it fails, it is no
+        longer counted.
+
+        Returns
+        -------
+        :class:`openscm.adapter.Adapter`
+            New adapter
+        """
+        created = False
+        try:
+            adapter: Adapter = self._adapter_cls(ParameterSet(), ParameterSet())
+            adapter.initialize_model()
+            created = True
+        finally:
+            if not created:
+                with self._available:
+                    self._n_alive -= 1
+                    self._available.notify()
+
+        self._n_runs[id(adapter)] = 0
+        return adapter
+
+    @staticmethod
+    def _discard(adapter: Adapter) -> None:
+        """
+        Shut down an adapter which is no longer used
+
+        Parameters
+        ----------
+        adapter
+            Adapter to shut down
+        """
+        try:
+            adapter.shutdown()
+        except Exception:  # pylint: disable=broad-except
+            # the adapter is dropped anyway and a failing shutdown must not mask the
+            # error which led to discarding it
+            pass
+
+    def _check_open(self) -> None:
+        """
+        Check that the pool has not been closed (must be called holding the lock)
+
+        Raises
+        ------
+        RuntimeError
+            The pool has been closed
+        """
+        if self._closed:
+            raise RuntimeError("adapter pool is closed")
+
+    def prewarm(self, n: int) -> None:
+        """
+        Create and initialize adapters until at least ``n`` are alive
+
+        Parameters
+        ----------
+        n
+            Number of adapters to have alive (capped by ``max_size``)
+
+        Raises
+        ------
+        RuntimeError
+            The pool has been closed
+        """
+        if self._max_size is not None:
+            n = min(n, self._max_size)
+        while True:
+            with self._available:
+                self._check_open()
+                if self._n_alive >= n:
+                    return
+                self._n_alive += 1
+            adapter = self._create()
+            with self._available:
+                closed = self._closed
+                if closed:
+                    self._n_alive -= 1
+                    del self._n_runs[id(adapter)]
+                else:
+                    self._idle.append(adapter)
+                self._available.notify()
+            if closed:
+                self._discard(adapter)
+
+    def checkout(
+        self,
+        input_parameters: ParameterSet,
+        output_parameters: ParameterSet,
+        timeout: Optional[float] = None,
+    ) -> Adapter:
+        """
+        Get an initialized adapter for a run
+
+        An idle adapter is re-used if there is one. Otherwise a new adapter is created
+        unless there are already ``max_size`` adapters alive, in which case this waits
+        for an adapter to be checked in.
+
+        Parameters
+        ----------
+        input_parameters
+            Input parameter set for the adapter to use
+        output_parameters
+            Output parameter set for the adapter to use
+        timeout
+            Maximum time to wait for an adapter in seconds (``None`` to wait forever)
+
+        Returns
+        -------
+        :class:`openscm.adapter.Adapter`
+            Adapter, which must be returned with :meth:`checkin` after the run
+
+        Raises
+        ------
+        RuntimeError
+            The pool has been closed
+        TimeoutError
+            No adapter became available within ``timeout``
+        """
+        with self._available:
+            self._check_open()
+            if not self._available.wait_for(
+                lambda: self._closed
+                or self._idle
+                or self._max_size is None
+                or self._n_alive < self._max_size,
+                timeout,
+            ):
+                raise TimeoutError("no adapter available")
+            self._check_open()
+            adapter = self._idle.pop() if self._idle else None
+            if adapter is None:
+                self._n_alive += 1
+
+        if adapter is None:
+            adapter = self._create()
+
+        with self._available:
+            self._checked_out.add(id(adapter))
+
+        # pylint: disable=protected-access
+        adapter._parameters = input_parameters
+        adapter._output = output_parameters
+        return adapter
+
+    def checkin(self, adapter: Adapter, healthy: bool = True) -> None:
+        """
+        Return an adapter after a run
+
+        The adapter is reset and made available again unless it is not ``healthy``,
+        fails the health check or resetting it, has done ``max_runs`` runs or the pool
+        has been closed. In these cases it is shut down and discarded.
+
+        Parameters
+        ----------
+        adapter
+            Adapter obtained from :meth:`checkout`
+        healthy
+            If False, the adapter is discarded (e.g. because its run failed)
+
+        Raises
+        ------
+        ValueError
+            ``adapter`` is not checked out from this pool (e.g. because it has already
+            been checked in)
+        """
+        with self._available:
+            if id(adapter) not in self._checked_out:
+                raise ValueError("adapter is not checked out from this pool")
+            self._checked_out.remove(id(adapter))
+
+        self._n_runs[id(adapter)] += 1
+        keep = (
+            not self._closed
+            and healthy
+            and (self._max_runs is None or self._n_runs[id(adapter)] < self._max_runs)
+            and (self._health_check is None or self._health_check(adapter))
+        )
+        if keep:
+            try:
+                adapter.reset()
+            except Exception:  # pylint: disable=broad-except
+                keep = False
+
+        # pylint: disable=protected-access
+        adapter._parameters = adapter._output = ParameterSet()
+        with self._available:
+            keep = keep and not self._closed
+            if keep:
+                self._idle.append(adapter)
+            else:
+                del self._n_runs[id(adapter)]
+                self._n_alive -= 1
+            self._available.notify()
+        if not keep:
+            self._discard(adapter)
+
+    def n_runs(self, adapter: Adapter) -> int:
+        """
+        Get the number of runs a checked out adapter has done
+
+        Parameters
+        ----------
+        adapter
+            Adapter obtained from :meth:`checkout`
+
+        Returns
+        -------
+        int
+            Number of runs the adapter has done (and been reset after) since it was
+            created
+
+        Raises
+        ------
+        ValueError
+            ``adapter`` is not checked out from this pool
+        """
+        with self._available:
+            if id(adapter) not in self._checked_out:
+                raise ValueError("adapter is not checked out from this pool")
+            return self._n_runs[id(adapter)]
+
+    def close(self) -> None:
+        """
+        Close the pool
+
+        Idle adapters are shut down immediately, adapters which are checked out when
+        they are checked in. Adapters can no longer be checked out afterwards.
+        """
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for adapter in idle:
+                del self._n_runs[id(adapter)]
+            self._n_alive -= len(idle)
+            self._available.notify_all()
+        for adapter in idle:
+            self._discard(adapter)
+
+    @contextmanager
+    def adapter(
+        self,
+        input_parameters: ParameterSet,
+        output_parameters: ParameterSet,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Adapter]:
+        """
+        Check out an adapter for the duration of a ``with`` block
+
+        The adapter is checked in when the block is left and discarded if the block
+        raised an error.
+
+        Parameters
+        ----------
+        input_parameters
+            Input parameter set for the adapter to use
+        output_parameters
+            Output parameter set for the adapter to use
+        timeout
+            Maximum time to wait for an adapter in seconds (``None`` to wait forever)
+
+        Yields
+        ------
+        :class:`openscm.adapter.Adapter`
+            Adapter for the run
+        """
+        adapter = self.checkout(input_parameters, output_parameters, timeout=timeout)
+        healthy = False
+        try:
+            yield adapter
+            healthy = True
+        finally:
+            self.checkin(adapter, healthy=healthy)
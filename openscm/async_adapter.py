@@ -0,0 +1,336 @@
+"""
+Adapters whose runs are driven by :mod:`asyncio`.
+
+An adapter wrapping an externally executed model (e.g. a binary started as a
+subprocess) spends most of a run waiting. Subclassing :class:`AsyncAdapter` (or
+:class:`SubprocessAdapter` for models run as a subprocess) lets many such runs wait
+at once in a single thread, see :func:`run_adapters`.
+"""
+
+import asyncio
+from abc import abstractmethod
+from typing import Any, Coroutine, List, Optional, Sequence
+
+from .adapter import Adapter
+from .errors import AdapterRunError
+
+
+def _get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """
+    Get the event loop running in the current thread
+
+    Returns
+    -------
+    Optional[asyncio.AbstractEventLoop]
+        Running event loop (``None`` if none is running)
+    """
+    try:
+        return asyncio.get_running_loop()
+    except AttributeError:  # pragma: no cover
+        # ``asyncio.get_running_loop`` is new in Python 3.7
+        return asyncio.events._get_running_loop()  # pylint: disable=protected-access
+    except RuntimeError:
+        # no running event loop
+        return None
+
+
+def run_sync(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion in a new event loop
+
+    As with :func:`asyncio.run`, the new event loop is set as the event loop of the
+    current thread while running and no event loop is set afterwards.
+
+    Parameters
+    ----------
+    coroutine
+        Coroutine to run
+
+    Returns
+    -------
+    Any
+        Result of the coroutine
+
+    Raises
+    ------
+    RuntimeError
+        An event loop is already running in the current thread
+    """
+    if _get_running_loop() is not None:
+        # avoid a warning about the coroutine never being awaited
+        coroutine.close()
+        raise RuntimeError(
+            "cannot run synchronously while an event loop is running, await "
+            "`AsyncAdapter.run_async`, `AsyncAdapter.step_async` or "
+            "`run_adapters_async` instead"
+        )
+
+    loop = asyncio.new_event_loop()
+    try:
+        # also attaches the child watcher needed for subprocesses to the loop
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coroutine)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+class AsyncAdapter(Adapter):
+    """
+    Base class for adapters which run their model asynchronously.
+
+    The synchronous :func:`run` and :func:`step` still work, they run
+    :func:`run_async` and :func:`step_async` in a new event loop. Within a running
+    event loop (e.g. in Jupyter), :func:`run_async` and :func:`step_async` have to be
+    awaited instead.
+    """
+
+    async def run_async(self) -> None:
+        """
+        Run the model over the full time range.
+        """
+        await self._run_async()
+
+    async def step_async(self) -> int:
+        """
+        Do a single time step.
+
+        Returns
+        -------
+        int
+            Current time (seconds since ``1970-01-01 00:00:00``)
+        """
+        await self._step_async()
+        return self._current_time
+
+    def _run(self) -> None:
+        """
+        Run the model over the full time range in a new event loop.
+        """
+        run_sync(self._run_async())
+
+    def _step(self) -> None:
+        """
+        Do a single time step in a new event loop.
+        """
+        run_sync(self._step_async())
+
+    @abstractmethod
+    async def _run_async(self) -> None:
+        """
+        To be implemented by specific adapters.
+
+        Run the model over the full time range.
+        """
+
+    @abstractmethod
+    async def _step_async(self) -> None:
+        """
+        To be implemented by specific adapters.
+
+        Do a single time step.
+        """
+
+
+class SubprocessAdapter(AsyncAdapter):
+    """
+    Base class for adapters of models which are run as a subprocess.
+
+    Each run starts the command from :func:`_get_command`, passes the bytes from
+    :func:`_get_input` to its standard input and hands its standard output to
+    :func:`_process_output`. Runs cannot be split into steps.
+    """
+
+    @abstractmethod
+    def _get_command(self) -> Sequence[str]:
+        """
+        To be implemented by specific adapters.
+
+        Get the command to run the model (program and arguments).
+
+        Returns
+        -------
+        Sequence[str]
+            Command to run
+        """
+
+    def _get_input(self) -> Optional[bytes]:  # pylint: disable=no-self-use
+        """
+        Get the input passed to the model process on its standard input.
+
+        To be overridden by adapters passing input to their model, by default
+        ``None`` is returned and no input is passed.
+        """
+        return None
+
+    @abstractmethod
+    def _process_output(self, output: bytes) -> None:
+        """
+        To be implemented by specific adapters.
+
+        Write the results of a run to the output parameter set.
+
+        Parameters
+        ----------
+        output
+            Standard output of the model process
+        """
+
+    async def _run_async(self) -> None:
+        """
+        Run the model process and process its output.
+
+        Raises
+        ------
+        AdapterRunError
+            Model process exited with a non-zero exit code
+        """
+        # _get_input is overridden by adapters passing input to their model
+        model_input = self._get_input()  # pylint: disable=assignment-from-none
+        process = await asyncio.create_subprocess_exec(
+            *self._get_command(),
+            # without input the process must not wait for its standard input to close
+            stdin=asyncio.subprocess.PIPE
+            if model_input is not None
+            else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        finished = False
+        try:
+            stdout, stderr = await process.communicate(model_input)
+            finished = True
+        finally:
+            # e.g. cancelled or timed out, do not leave the model process behind
+            if not finished and process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:  # pragma: no cover
+                    pass
+                await process.wait()
+
+        if process.returncode:
+            raise AdapterRunError(
+                "model process exited with code {}: {}".format(
+                    process.returncode, stderr.decode(errors="replace").strip()
+                )
+            )
+
+        self._process_output(stdout)
+
+    async def _step_async(self) -> None:
+        """
+        Do a single time step (not supported for models run as a subprocess).
+
+        Raises
+        ------
+        NotImplementedError
+            Always
+        """
+        raise NotImplementedError
+
+    def _initialize_model(self) -> None:
+        """
+        Nothing to initialize, a new process is started for every run.
+        """
+
+    def _initialize_model_input(self) -> None:
+        """
+        Nothing to initialize, the input is read when the process is started.
+        """
+
+    def _initialize_run_parameters(self) -> None:
+        """
+        Nothing to initialize, the run parameters are read when the process is
+        started.
+        """
+
+    def _reset(self) -> None:
+        """
+        Nothing to reset, a new process is started for every run.
+        """
+
+    def _shutdown(self) -> None:
+        """
+        Nothing to shut down, processes exit at the end of each run.
+        """
+
+
+async def run_adapters_async(
+    adapters: Sequence[AsyncAdapter],
+    max_concurrency: int = 100,
+    return_exceptions: bool = False,
+) -> List[Optional[BaseException]]:
+    """
+    Run many adapters concurrently
+
+    The adapters have to be ready to run, i.e. their model input and run parameters
+    have to be initialized.
+
+    Parameters
+    ----------
+    adapters
+        Adapters to run
+    max_concurrency
+        Maximum number of runs in flight at once
+    return_exceptions
+        If True, errors of failed runs are returned rather than raised. Otherwise the
+        error of the first failed run is raised once all runs have finished.
+
+    Returns
+    -------
+    list of Optional[BaseException]
+        For each adapter, ``None`` if its run succeeded or its error if it failed (only
+        if ``return_exceptions`` is True)
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(adapter: AsyncAdapter) -> None:
+        async with semaphore:
+            await adapter.run_async()
+
+    # let all runs finish, even if some fail, so that no process is left behind
+    res = await asyncio.gather(
+        *(run(adapter) for adapter in adapters), return_exceptions=True
+    )
+    if not return_exceptions:
+        for exc in res:
+            if exc is not None:
+                raise exc
+
+    return list(res)
+
+
+def run_adapters(
+    adapters: Sequence[AsyncAdapter],
+    max_concurrency: int = 100,
+    return_exceptions: bool = False,
+) -> List[Optional[BaseException]]:
+    """
+    Run many adapters concurrently in a new event loop
+
+    See :func:`run_adapters_async`, which has to be awaited instead within a running
+    event loop.
+
+    Parameters
+    ----------
+    adapters
+        Adapters to run
+    max_concurrency
+        Maximum number of runs in flight at once
+    return_exceptions
+        If True, errors of failed runs are returned rather than raised
+
+    Returns
+    -------
+    list of Optional[BaseException]
+        For each adapter, ``None`` if its run succeeded or its error if it failed (only
+        if ``return_exceptions`` is True)
+    """
+    return run_sync(  # type: ignore
+        run_adapters_async(
+            adapters,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+    )
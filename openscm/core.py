@@ -8,8 +8,11 @@ Parts of this API definition seems unpythonic as it is designed to be easily
 implementable in several programming languages.
 """
 
-from typing import Optional, Sequence, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
+import numpy as np
+
+from .errors import ParameterEmptyError, TimeseriesPointsValuesMismatchError
 from .parameter_views import (
     GenericView,
     ScalarView,
@@ -20,7 +23,13 @@ from .parameter_views import (
 )
 from .parameters import ParameterInfo, ParameterType, _Parameter
 from .regions import _Region
-from .timeseries_converter import ExtrapolationType, InterpolationType
+from .timeseries_converter import (
+    ExtrapolationType,
+    InterpolationType,
+    TimeseriesConverter,
+    get_timeseries_converter,
+)
+from .units import UnitConverter
 from .utils import ensure_input_is_tuple
 
 # pylint: disable=too-many-arguments
@@ -29,6 +38,9 @@ from .utils import ensure_input_is_tuple
 class ParameterSet:
     """
     Collates a set of :ref:`parameters <parameters>`.
+
+    Regions and parameters are looked up by their full hierarchical names in flat
+    indices maintained by the region hierarchy, see :class:`openscm.regions._Region`.
     """
 
     _root: _Region
@@ -64,22 +76,22 @@ class ParameterSet:
         ValueError
             If parent region could not be found
         """
-        name_tuple = ensure_input_is_tuple(name)
+        # pylint: disable=protected-access
+        name_tuple = tuple(ensure_input_is_tuple(name))
+        res = self._root._region_index.get(name_tuple, None)
+        if res is not None:
+            return res
+
         if len(name_tuple) > 1:
             p = self._get_or_create_region(name_tuple[:-1])
             return p.get_or_create_subregion(name_tuple[-1])
 
         if len(name_tuple) == 1:
-            name_str = name_tuple[0]
-            root_name = self._root._name  # pylint: disable=protected-access
-            if name_str != root_name:
-                error_msg = (
-                    "Cannot access region {}, root region for this parameter set "
-                    "is {}"
-                ).format(name_str, root_name)
-                raise ValueError(error_msg)
-
-            return self._root
+            # the root region itself is always found in the index
+            error_msg = (
+                "Cannot access region {}, root region for this parameter set is {}"
+            ).format(name_tuple[0], self._root._name)
+            raise ValueError(error_msg)
 
         # len(name_tuple) == 0
         raise ValueError("No region name given")
@@ -98,11 +110,8 @@ class ParameterSet:
         Optional[_Region]
             Region or ``None`` if not found
         """
-        name_tuple = ensure_input_is_tuple(name)
-        if name_tuple[0] != self._root.name:
-            return None
-
-        return self._root.get_subregion(name_tuple[1:])
+        # pylint: disable=protected-access
+        return self._root._region_index.get(tuple(ensure_input_is_tuple(name)), None)
 
     def _get_or_create_parameter(
         self, name: Tuple[str, ...], region: _Region
@@ -127,7 +136,13 @@ class ParameterSet:
         ValueError
             Name not given
         """
-        name_tuple = ensure_input_is_tuple(name)
+        name_tuple = tuple(ensure_input_is_tuple(name))
+        res = region._parameter_index.get(  # pylint: disable=protected-access
+            (region._full_name, name_tuple), None  # pylint: disable=protected-access
+        )
+        if res is not None:
+            return res
+
         if len(name_tuple) > 1:
             p = self._get_or_create_parameter(name_tuple[:-1], region)
             return p.get_or_create_child_parameter(name_tuple[-1])
@@ -400,6 +415,209 @@ class ParameterSet:
         parameter.attempt_write(ParameterType.GENERIC)
         return WritableGenericView(parameter)
 
+    def _get_or_create_parameters(
+        self, keys: Sequence[Tuple[Tuple[str, ...], Tuple[str, ...]]]
+    ) -> List[_Parameter]:
+        """
+        Get many parameters, creating and adding those not found.
+
+        Parameters
+        ----------
+        keys
+            :ref:`Hierarchical name <parameter-hierarchy>` and hierarchical region name
+            of each parameter
+
+        Returns
+        -------
+        list of _Parameter
+            Parameters found or newly created
+
+        Raises
+        ------
+        ValueError
+            Name not given or invalid region
+        """
+        index = self._root._parameter_index  # pylint: disable=protected-access
+        res = []
+        for name, region in keys:
+            parameter = index.get(
+                (
+                    tuple(ensure_input_is_tuple(region)),
+                    tuple(ensure_input_is_tuple(name)),
+                ),
+                None,
+            )
+            if parameter is None:
+                parameter = self._get_or_create_parameter(
+                    name, self._get_or_create_region(region)
+                )
+            res.append(parameter)
+        return res
+
+    def get_many(
+        self,
+        entries: Sequence[
+            Tuple[Tuple[str, ...], Tuple[str, ...], Optional[str], ParameterType]
+        ],
+        time_points: Optional[Sequence[int]] = None,
+        interpolation_type: InterpolationType = InterpolationType.LINEAR,
+        extrapolation_type: ExtrapolationType = ExtrapolationType.NONE,
+    ) -> List[Any]:
+        """
+        Get the values of many parameters at once.
+
+        Equivalent to getting a read-only view of each parameter (see
+        :func:`get_scalar_view`, :func:`get_timeseries_view` and
+        :func:`get_generic_view`) and reading its value, but unit and timeseries
+        converters are shared between all entries with the same units or time points.
+
+        Parameters
+        ----------
+        entries
+            :ref:`Hierarchical name <parameter-hierarchy>`, hierarchical region name,
+            unit (ignored for generic parameters) and type of each parameter
+        time_points
+            Time points of all timeseries (seconds since ``1970-01-01 00:00:00``);
+            only needed for timeseries parameters
+        interpolation_type
+            Interpolation type of all timeseries
+        extrapolation_type
+            Extrapolation type of all timeseries
+
+        Returns
+        -------
+        list
+            Value of each parameter
+
+        Raises
+        ------
+        ParameterAggregationError
+            If a generic parameter has child parameters and thus cannot be aggregated
+        ParameterEmptyError
+            A parameter is empty, i.e. has not yet been written to
+        ParameterTypeError
+            A parameter is not of the given type
+        ValueError
+            Name not given, invalid region, no unit given for a non-generic parameter
+            or no ``time_points`` given for a timeseries parameter
+        """
+        # pylint: disable=protected-access
+        converters = _BulkConverters(
+            time_points, interpolation_type, extrapolation_type
+        )
+        res = []
+        parameters = self._get_or_create_parameters([e[:2] for e in entries])
+        for parameter, (_, _, unit, parameter_type) in zip(parameters, entries):
+            if parameter_type == ParameterType.GENERIC:
+                parameter.attempt_read(parameter_type)
+                res.append(GenericView(parameter).get())
+                continue
+
+            if unit is None:
+                raise ValueError("No unit given for non-generic parameter")
+            converters.check_time_points(parameter_type)
+            parameter.attempt_read(parameter_type, unit, converters.time_points)
+            if parameter._children:
+                # aggregated reads are left to the views
+                if parameter_type == ParameterType.SCALAR:
+                    res.append(ScalarView(parameter, unit).get())
+                else:
+                    res.append(
+                        TimeseriesView(
+                            parameter,
+                            unit,
+                            converters.time_points,
+                            parameter_type,
+                            interpolation_type,
+                            extrapolation_type,
+                        ).get()
+                    )
+            else:
+                if not parameter._has_been_written_to:
+                    raise ParameterEmptyError
+                value = converters.unit_converter(parameter, unit).convert_from(
+                    parameter._data
+                )
+                if parameter_type != ParameterType.SCALAR:
+                    value = converters.timeseries_converter(
+                        parameter, parameter_type
+                    ).convert_from(value)
+                res.append(value)
+
+        return res
+
+    def set_many(
+        self,
+        entries: Sequence[
+            Tuple[Tuple[str, ...], Tuple[str, ...], Optional[str], ParameterType, Any]
+        ],
+        time_points: Optional[Sequence[int]] = None,
+        interpolation_type: InterpolationType = InterpolationType.LINEAR,
+        extrapolation_type: ExtrapolationType = ExtrapolationType.NONE,
+    ) -> None:
+        """
+        Set the values of many parameters at once.
+
+        Equivalent to getting a writable view of each parameter (see
+        :func:`get_writable_scalar_view`, :func:`get_writable_timeseries_view` and
+        :func:`get_writable_generic_view`) and setting its value, but unit and
+        timeseries converters are shared between all entries with the same units or
+        time points.
+
+        Parameters
+        ----------
+        entries
+            :ref:`Hierarchical name <parameter-hierarchy>`, hierarchical region name,
+            unit (ignored for generic parameters), type and value of each parameter
+        time_points
+            Time points of all timeseries (seconds since ``1970-01-01 00:00:00``);
+            only needed for timeseries parameters
+        interpolation_type
+            Interpolation type of all timeseries
+        extrapolation_type
+            Extrapolation type of all timeseries
+
+        Raises
+        ------
+        ParameterReadonlyError
+            A parameter is read-only (e.g. because its parent has been written to)
+        ParameterTypeError
+            A parameter is not of the given type
+        TimeseriesPointsValuesMismatchError
+            Lengths of the values of a timeseries and the time points number mismatch
+        ValueError
+            Name not given, invalid region, no unit given for a non-generic parameter
+            or no ``time_points`` given for a timeseries parameter
+        """
+        # pylint: disable=protected-access
+        converters = _BulkConverters(
+            time_points, interpolation_type, extrapolation_type
+        )
+        parameters = self._get_or_create_parameters([e[:2] for e in entries])
+        for parameter, (_, _, unit, parameter_type, value) in zip(parameters, entries):
+            if parameter_type == ParameterType.GENERIC:
+                parameter.attempt_write(parameter_type)
+                parameter._data = value
+                continue
+
+            if unit is None:
+                raise ValueError("No unit given for non-generic parameter")
+            converters.check_time_points(parameter_type)
+            parameter.attempt_write(parameter_type, unit, converters.time_points)
+            if parameter_type != ParameterType.SCALAR:
+                timeseries_converter = converters.timeseries_converter(
+                    parameter, parameter_type
+                )
+                if len(value) != timeseries_converter.target_length:
+                    raise TimeseriesPointsValuesMismatchError
+                parameter._data = timeseries_converter.convert_to(
+                    converters.unit_converter(parameter, unit).convert_to(value)
+                )
+            else:
+                parameter._data = converters.unit_converter(parameter, unit).convert_to(
+                    value
+                )
+
     def get_parameter_info(
         self, name: Tuple[str, ...], region_name: Tuple[str, ...]
     ) -> Optional[ParameterInfo]:
@@ -431,6 +649,134 @@ class ParameterSet:
         return None
 
 
+class _BulkConverters:
+    """
+    Unit and timeseries converters shared between the entries of a bulk read or
+    write (see :func:`ParameterSet.get_many` and :func:`ParameterSet.set_many`).
+    """
+
+    _extrapolation_type: ExtrapolationType
+    """Extrapolation type of all timeseries"""
+
+    _interpolation_type: InterpolationType
+    """Interpolation type of all timeseries"""
+
+    _timeseries_converters: Dict[Tuple[bytes, ParameterType], TimeseriesConverter]
+    """Timeseries converters by source time points and timeseries type"""
+
+    _unit_converters: Dict[Tuple[str, str], UnitConverter]
+    """Unit converters by source and target unit"""
+
+    time_points: Optional[np.ndarray]
+    """Time points of all timeseries"""
+
+    def __init__(
+        self,
+        time_points: Optional[Sequence[int]],
+        interpolation_type: InterpolationType,
+        extrapolation_type: ExtrapolationType,
+    ):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        time_points
+            Time points of all timeseries
+        interpolation_type
+            Interpolation type of all timeseries
+        extrapolation_type
+            Extrapolation type of all timeseries
+        """
+        self._extrapolation_type = extrapolation_type
+        self._interpolation_type = interpolation_type
+        self._timeseries_converters = {}
+        self._unit_converters = {}
+        self.time_points = None if time_points is None else np.asarray(time_points)
+
+    def check_time_points(self, parameter_type: ParameterType) -> None:
+        """
+        Check that time points are given if ``parameter_type`` is a timeseries type.
+
+        Parameters
+        ----------
+        parameter_type
+            Type of the parameter read or written
+
+        Raises
+        ------
+        ValueError
+            No time points given for a timeseries type
+        """
+        if self.time_points is None and parameter_type in (
+            ParameterType.AVERAGE_TIMESERIES,
+            ParameterType.POINT_TIMESERIES,
+        ):
+            raise ValueError("No time points given for timeseries parameter")
+
+    def unit_converter(self, parameter: _Parameter, unit: str) -> UnitConverter:
+        """
+        Get the converter between the unit of a parameter and ``unit``.
+
+        Parameters
+        ----------
+        parameter
+            Parameter
+        unit
+            Unit of the values read or written
+
+        Returns
+        -------
+        UnitConverter
+            Unit converter
+        """
+        # pylint: disable=protected-access
+        key = (cast(str, parameter._unit), unit)
+        res = self._unit_converters.get(key)
+        if res is None:
+            res = self._unit_converters[key] = UnitConverter(*key)
+        return res
+
+    def timeseries_converter(
+        self, parameter: _Parameter, timeseries_type: ParameterType
+    ) -> TimeseriesConverter:
+        """
+        Get the converter between the time points of a parameter and
+        :attr:`time_points`.
+
+        Parameters
+        ----------
+        parameter
+            Timeseries parameter
+        timeseries_type
+            Timeseries type
+
+        Returns
+        -------
+        TimeseriesConverter
+            Timeseries converter
+
+        Raises
+        ------
+        ValueError
+            No time points given
+        """
+        self.check_time_points(timeseries_type)
+        # pylint: disable=protected-access
+        source_time_points = cast(np.ndarray, parameter._time_points)
+        key = (source_time_points.tobytes(), timeseries_type)
+        res = self._timeseries_converters.get(key)
+        if res is None:
+            res = self._timeseries_converters[key] = get_timeseries_converter(
+                source_time_points,
+                self.time_points,
+                timeseries_type,
+                self._interpolation_type,
+                self._extrapolation_type,
+            )
+        return res
+
+
 class Core:
     """
     OpenSCM core class.
@@ -0,0 +1,427 @@
+"""
+Running ensembles of model runs in parallel.
+
+Each run of an ensemble uses the same base :class:`openscm.core.ParameterSet` with
+some of its parameters overridden. Runs are spread across a pool of worker processes,
+each of which loads the base parameter set only once and keeps a single adapter
+instance alive in an :class:`openscm.adapter_pool.AdapterPool` for all the runs it is
+given. Adapters which support batch runs (see :func:`openscm.adapter.Adapter.run_batch`)
+do all the runs a worker is given in a single call, the results of which are converted
+run by run just like those of single runs.
+
+Failing runs do not stop the ensemble: all other runs are completed before an
+:class:`openscm.errors.EnsembleRunError` reports the failures per run.
+"""
+
+import copy
+import math
+import os
+import pickle  # nosec
+import tempfile
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .adapter_pool import AdapterPool
+from .adapters import load_adapter
+from .core import ParameterSet
+from .errors import EnsembleRunError
+from .parameters import ParameterType
+from .scmdataframe import (
+    ScmDataFrame,
+    ScmDataFrameBuilder,
+    convert_parameterset_to_scmdataframe,
+)
+
+OverrideKey = Tuple[Tuple[str, ...], Tuple[str, ...], Optional[str]]
+"""
+Parameter to override: :ref:`hierarchical name <parameter-hierarchy>`, hierarchical
+region name and unit (``None`` for generic parameters)
+"""
+
+_worker_state: Dict[str, Any] = {}
+"""State of the current worker process (ensemble id, base parameters and pool)"""
+
+
+def _set_override(parameter_set: ParameterSet, key: OverrideKey, value: Any) -> None:
+    """
+    Write an override value into a parameter set
+
+    Parameters
+    ----------
+    parameter_set
+        Parameter set to write into
+    key
+        Parameter to write
+    value
+        Value to write
+    """
+    name, region, unit = key
+    if unit is None:
+        parameter_set.get_writable_generic_view(name, region).set(value)
+    else:
+        parameter_set.get_writable_scalar_view(name, region, unit).set(value)
+
+
+def _get_override(parameter_set: ParameterSet, key: OverrideKey) -> Any:
+    """
+    Read the value of a parameter which may be overridden
+
+    Parameters
+    ----------
+    parameter_set
+        Parameter set to read from
+    key
+        Parameter to read
+
+    Returns
+    -------
+    Any
+        Value of the parameter
+
+    Raises
+    ------
+    ValueError
+        The parameter is not set in ``parameter_set``
+    """
+    name, region, unit = key
+    if parameter_set.get_parameter_info(name, region) is None:
+        raise ValueError(
+            "{} is not overridden by all runs and not set in the base parameters".format(
+                key
+            )
+        )
+    if unit is None:
+        return parameter_set.get_generic_view(name, region).get()
+
+    return parameter_set.get_scalar_view(name, region, unit).get()
+
+
+def _complete_overrides(
+    parameter_set: ParameterSet, overrides: Sequence[Dict[OverrideKey, Any]]
+) -> List[Dict[OverrideKey, Any]]:
+    """
+    Make all overrides set the same parameters, filling in values from the base
+
+    Workers re-use their parameter set between runs so a parameter overridden by one
+    run has to be reset to its base value for runs which do not override it.
+
+    Parameters
+    ----------
+    parameter_set
+        Base parameter set
+    overrides
+        Overrides of each run
+
+    Returns
+    -------
+    list of dict
+        Overrides of each run, all with the same keys
+    """
+    keys = list(dict.fromkeys(k for o in overrides for k in o))
+    missing = [k for k in keys if any(k not in o for o in overrides)]
+    if not missing:
+        return list(overrides)
+
+    # reading marks parameters as read from, keep the caller's parameter set untouched
+    base = copy.deepcopy(parameter_set)
+    defaults = {k: _get_override(base, k) for k in missing}
+    return [{**defaults, **o} for o in overrides]
+
+
+class _Ensemble(NamedTuple):
+    """
+    Settings shared by all runs of an ensemble
+    """
+
+    ensemble_id: str
+    """Unique id of the ensemble"""
+
+    model: Union[str, type]
+    """Name of the SCM to run or its adapter class"""
+
+    batch: bool
+    """True if the adapter supports batch runs"""
+
+    parameters_file: str
+    """Path of the pickled base parameter set (loaded once per worker process)"""
+
+    start_time: int
+    """Beginning of the time range to run over"""
+
+    stop_time: int
+    """End of the time range to run over (including)"""
+
+    time_points: Sequence[int]
+    """Time points of the output timeseries"""
+
+    climate_model: str
+    """Value of the ``climate_model`` metadata of the output"""
+
+
+def _get_worker_pool(ensemble: _Ensemble) -> AdapterPool:
+    """
+    Get the adapter pool of the current worker process, creating it for a new ensemble
+
+    The base parameter set is loaded when a worker process gets its first runs of an
+    ensemble, the pool of a previous ensemble is closed.
+
+    Parameters
+    ----------
+    ensemble
+        Ensemble the runs belong to
+
+    Returns
+    -------
+    :class:`openscm.adapter_pool.AdapterPool`
+        Pool keeping the single adapter of the worker process alive between runs
+    """
+    if _worker_state.get("ensemble_id") != ensemble.ensemble_id:
+        if "pool" in _worker_state:
+            _worker_state["pool"].close()
+        _worker_state.clear()
+        with open(ensemble.parameters_file, "rb") as f:
+            parameters = pickle.load(f)  # nosec
+        _worker_state.update(
+            ensemble_id=ensemble.ensemble_id,
+            parameters=parameters,
+            pool=AdapterPool(ensemble.model, max_size=1),
+        )
+
+    pool: AdapterPool = _worker_state["pool"]
+    return pool
+
+
+# pylint doesn't recognise ',' in returns type definition
+def _run_in_worker(  # pylint: disable=missing-return-doc
+    runs: Sequence[Tuple[int, Dict[OverrideKey, Any]]], ensemble: _Ensemble
+) -> Tuple[List[ScmDataFrame], Dict[int, str]]:
+    """
+    Do runs with the adapter of the current worker process
+
+    A failing run does not stop the other runs, its adapter is discarded by the pool
+    and replaced for the following runs though.
+
+    Parameters
+    ----------
+    runs
+        Id and overrides of each run
+    ensemble
+        Ensemble the runs belong to
+
+    Returns
+    -------
+    list of :obj:`ScmDataFrame`, dict
+        Output timeseries of each successful run and the traceback of each failed run
+        by run id
+    """
+    try:
+        pool = _get_worker_pool(ensemble)
+        if ensemble.batch and all(unit is not None for _, _, unit in runs[0][1]):
+            return _run_batch_in_worker(pool, runs, ensemble), {}
+    except Exception:  # pylint: disable=broad-except
+        return [], {run_id: traceback.format_exc() for run_id, _ in runs}
+
+    parameters = _worker_state["parameters"]
+    res = []
+    failures = {}
+    for run_id, overrides in runs:
+        try:
+            for key, value in overrides.items():
+                _set_override(parameters, key, value)
+
+            # a fresh output parameter set so that no outputs of previous runs are kept
+            output = ParameterSet()
+            with pool.adapter(parameters, output) as adapter:
+                adapter.initialize_model_input()
+                adapter.initialize_run_parameters(
+                    ensemble.start_time, ensemble.stop_time
+                )
+                # the pool resets adapters after each run
+                if not pool.n_runs(adapter):
+                    adapter.reset()
+                adapter.run()
+            res.append(_convert_output(output, run_id, ensemble))
+        except Exception:  # pylint: disable=broad-except
+            failures[run_id] = traceback.format_exc()
+
+    return res, failures
+
+
+def _convert_output(
+    output: ParameterSet, run_id: int, ensemble: _Ensemble
+) -> ScmDataFrame:
+    """
+    Convert the output of a run to an :obj:`ScmDataFrame`
+
+    Parameters
+    ----------
+    output
+        Output parameter set of the run
+    run_id
+        Id of the run
+    ensemble
+        Ensemble the run belongs to
+
+    Returns
+    -------
+    :obj:`ScmDataFrame`
+        Output timeseries of the run
+    """
+    res = convert_parameterset_to_scmdataframe(
+        output, ensemble.time_points, climate_model=ensemble.climate_model
+    )
+    res.set_meta(run_id, name="run_id")
+    return res
+
+
+def _run_batch_in_worker(
+    pool: AdapterPool,
+    runs: Sequence[Tuple[int, Dict[OverrideKey, Any]]],
+    ensemble: _Ensemble,
+) -> List[ScmDataFrame]:
+    """
+    Do runs in a single batch run of the adapter of the current worker process
+
+    Parameters
+    ----------
+    pool
+        Pool of the adapter of the current worker process
+    runs
+        Id and overrides of each run, all overrides being scalar parameters
+    ensemble
+        Ensemble the runs belong to
+
+    Returns
+    -------
+    list of :obj:`ScmDataFrame`
+        Output timeseries of each run
+    """
+    inputs = {
+        key: np.array([overrides[key] for _, overrides in runs], dtype=float)
+        for key in runs[0][1]
+    }
+    # all runs of the batch write the same outputs so they can share one output
+    # parameter set
+    output = ParameterSet()
+    with pool.adapter(_worker_state["parameters"], output) as adapter:
+        adapter.initialize_model_input()
+        adapter.initialize_run_parameters(ensemble.start_time, ensemble.stop_time)
+        # the pool resets adapters after each run
+        if not pool.n_runs(adapter):
+            adapter.reset()
+        outputs = adapter.run_batch(inputs, ensemble.time_points)  # type: ignore
+
+    res = []
+    for i, (run_id, _) in enumerate(runs):
+        # write the outputs of this run as a single run would have
+        output.set_many(
+            [
+                (name, region, unit, ParameterType.POINT_TIMESERIES, values[i])
+                for (name, region, unit), values in outputs.items()
+            ],
+            time_points=ensemble.time_points,
+        )
+        res.append(_convert_output(output, run_id, ensemble))
+
+    return res
+
+
+def run_ensemble(  # pylint: disable=too-many-arguments
+    model: Union[str, type],
+    parameters: ParameterSet,
+    overrides: Sequence[Dict[OverrideKey, Any]],
+    start_time: int,
+    stop_time: int,
+    time_points: Sequence[int],
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> ScmDataFrame:
+    """
+    Run a model once per set of parameter overrides, in parallel
+
+    Parameters
+    ----------
+    model
+        Name of the SCM to run (see :func:`openscm.adapters.load_adapter`) or its
+        adapter class
+    parameters
+        Base parameter set of all runs
+    overrides
+        Parameters to override, one dictionary per run. Keys are (name, region,
+        unit) tuples (unit ``None`` for generic parameters), values the values to set
+    start_time
+        Beginning of the time range to run over (seconds since
+        ``1970-01-01 00:00:00``)
+    stop_time
+        End of the time range to run over (including; seconds since
+        ``1970-01-01 00:00:00``)
+    time_points
+        Time points (seconds since ``1970-01-01 00:00:00``) to which the output
+        timeseries are interpolated
+    max_workers
+        Number of worker processes (default: number of processors)
+    chunksize
+        Number of runs sent to a worker at once. Larger chunks reduce the
+        communication overhead for many short runs. Adapters supporting batch runs do
+        each chunk in a single batch run. By default, runs are sent one by one or, for
+        adapters supporting batch runs, split evenly across the workers.
+
+    Returns
+    -------
+    :obj:`ScmDataFrame`
+        Output timeseries of all runs, with the position of each run in
+        ``overrides`` as ``run_id`` metadata
+
+    Raises
+    ------
+    EnsembleRunError
+        Runs failed (the results of all other runs are available from the error)
+    ValueError
+        ``overrides`` is empty or a parameter is not overridden by all runs and not
+        set in ``parameters``
+    """
+    if not overrides:
+        raise ValueError("no runs given")
+
+    runs = list(enumerate(_complete_overrides(parameters, overrides)))
+    adapter_cls = load_adapter(model) if isinstance(model, str) else model
+    supports_batch = adapter_cls.supports_batch()  # type: ignore
+    if chunksize is None:
+        n_workers = max_workers or os.cpu_count() or 1
+        chunksize = math.ceil(len(runs) / n_workers) if supports_batch else 1
+    builder = ScmDataFrameBuilder()
+    failures: Dict[int, str] = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # the base parameter set is passed on through a file, so that it is only
+        # loaded once per worker process rather than sent along with every chunk
+        ensemble = _Ensemble(
+            ensemble_id=uuid.uuid4().hex,
+            model=model,
+            batch=supports_batch,
+            parameters_file=os.path.join(tmpdir, "parameters.pickle"),
+            start_time=start_time,
+            stop_time=stop_time,
+            time_points=time_points,
+            climate_model=model if isinstance(model, str) else model.__name__,
+        )
+        with open(ensemble.parameters_file, "wb") as f:
+            pickle.dump(parameters, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunks = [runs[i : i + chunksize] for i in range(0, len(runs), chunksize)]
+            for chunk_res, chunk_failures in executor.map(
+                _run_in_worker, chunks, [ensemble] * len(chunks)
+            ):
+                for res in chunk_res:
+                    builder.append(res)
+                failures.update(chunk_failures)
+
+    results = builder.build() if len(failures) < len(runs) else None
+    if failures:
+        raise EnsembleRunError(failures, results)
+
+    return results  # type: ignore
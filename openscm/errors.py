@@ -2,11 +2,57 @@
 Errors/Exceptions defined and used in OpenSCM.
 """
 
+from typing import Any, Dict
+
 
 class AdapterNeedsModuleError(Exception):
     """Exception raised when an adapter needs a module that is not installed."""
 
 
+class AdapterRunError(Exception):
+    """
+    Exception raised when the model run of an adapter fails (e.g. when the process of
+    an externally executed model exits with an error).
+    """
+
+
+class EnsembleRunError(Exception):
+    """
+    Exception raised when runs of an ensemble fail.
+
+    All other runs are completed nonetheless, their results are kept in
+    :attr:`results`.
+    """
+
+    failures: Dict[int, str]
+    """Traceback of each failed run by run id"""
+
+    results: Any
+    """:obj:`ScmDataFrame` of the successful runs (``None`` if all runs failed)"""
+
+    def __init__(self, failures: Dict[int, str], results: Any):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        failures
+            Traceback of each failed run by run id
+        results
+            :obj:`ScmDataFrame` of the successful runs (``None`` if all runs failed)
+        """
+        first_id = min(failures)
+        super().__init__(
+            "{} run(s) failed (run ids: {}), the first with:\n{}".format(
+                len(failures),
+                ", ".join(str(run_id) for run_id in sorted(failures)),
+                failures[first_id],
+            )
+        )
+        self.failures = failures
+        self.results = results
+
+
 class InsufficientDataError(ValueError):
     """
     Exception raised when not enough data is available to convert from one
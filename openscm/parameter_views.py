@@ -13,6 +13,7 @@ from .timeseries_converter import (
     ExtrapolationType,
     InterpolationType,
     TimeseriesConverter,
+    get_timeseries_converter,
 )
 from .units import UnitConverter
 
@@ -69,7 +70,7 @@ class ScalarView(ParameterView):
             Unit for the values in the view
         """
         super().__init__(parameter)
-        self._unit_converter = UnitConverter(cast(str, parameter._info._unit), unit)
+        self._unit_converter = UnitConverter(cast(str, parameter._unit), unit)
 
         def get_data_views_for_children_or_parameter(
             parameter: _Parameter
@@ -174,14 +175,14 @@ class TimeseriesView(ParameterView):
             Extrapolation type
         """
         super().__init__(parameter)
-        self._unit_converter = UnitConverter(cast(str, parameter._info._unit), unit)
-        self._timeseries_converter = TimeseriesConverter(
-            parameter._info._time_points,
+        self._unit_converter = UnitConverter(cast(str, parameter._unit), unit)
+        self._timeseries_converter = get_timeseries_converter(
+            parameter._time_points,
             time_points,
             timeseries_type,
             interpolation_type,
             extrapolation_type,
-        )  # TimeseriesConverter
+        )
 
         def get_data_views_for_children_or_parameter(
             parameter: _Parameter
@@ -3,7 +3,7 @@ Parameter handling.
 """
 
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Union, cast
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -38,6 +38,8 @@ class ParameterInfo:
     Information for a :ref:`parameter <parameters>`.
     """
 
+    __slots__ = ("_name", "_region", "_time_points", "_type", "_unit")
+
     _name: str
     """Name"""
 
@@ -85,7 +87,7 @@ class ParameterInfo:
         return self._type
 
     @property
-    def region(self) -> Tuple[str]:
+    def region(self) -> Tuple[str, ...]:
         """
         Hierarchichal name of the region this parameter belongs to
         """
@@ -99,31 +101,50 @@ class ParameterInfo:
         return self._unit
 
 
-class _Parameter:
+# more than half of the attributes are inherited from ``ParameterInfo``, grouping them
+# would cost a second object per parameter
+class _Parameter(ParameterInfo):  # pylint: disable=too-many-instance-attributes
     """
     Represents a :ref:`parameter <parameters>` in the :ref:`parameter hierarchy
     <parameter-hierarchy>`.
+
+    A parameter is its own :class:`ParameterInfo` so that only one (slotted) object
+    is needed per parameter.
     """
 
-    _children: Dict[str, "_Parameter"]
-    """Child parameters"""
+    __slots__ = (
+        "_children",
+        "_data",
+        "_full_name",
+        "_has_been_read_from",
+        "_has_been_written_to",
+        "_parent",
+    )
+
+    _children: Optional[Dict[str, "_Parameter"]]
+    """Child parameters (``None`` until the first one is added, to save memory)"""
 
     _data: Union[None, bool, float, str, Sequence[float]]
     """Data"""
 
+    _full_name: Tuple[str, ...]
+    """Full :ref:`hierarchical name <parameter-hierarchy>`"""
+
     _has_been_read_from: bool
     """If True, parameter has already been read from"""
 
     _has_been_written_to: bool
     """If True, parameter data has already been changed"""
 
-    _info: ParameterInfo
-    """Information about the parameter"""
-
     _parent: Optional["_Parameter"]
     """Parent parameter"""
 
-    def __init__(self, name: str, region: "regions._Region"):
+    def __init__(
+        self,
+        name: str,
+        region: "regions._Region",
+        parent: Optional["_Parameter"] = None,
+    ):
         """
         Initialize.
 
@@ -131,12 +152,21 @@ class _Parameter:
         ----------
         name
             Name
+        region
+            Region
+        parent
+            Parent parameter (or ``None`` if root parameter)
         """
-        self._children = {}
+        super().__init__(name, region)
+        self._children = None
+        if parent is None:
+            self._full_name = (name,)
+        else:
+            self._full_name = parent._full_name + (name,)
         self._has_been_read_from = False
         self._has_been_written_to = False
-        self._info = ParameterInfo(name, region)
-        self._parent = None
+        self._parent = parent
+        region._parameter_index[(region._full_name, self._full_name)] = self
 
     def get_or_create_child_parameter(self, name: str) -> "_Parameter":
         """
@@ -166,14 +196,15 @@ class _Parameter:
             If the child parameter would need to be added, but this parameter has
             already been written to. In this case a child parameter cannot be added.
         """
-        res = self._children.get(name, None)
+        res = self._children.get(name, None) if self._children else None
         if res is None:
             if self._has_been_written_to:
                 raise ParameterWrittenError
             if self._has_been_read_from:
                 raise ParameterReadError
-            res = _Parameter(name, self._info._region)
-            res._parent = self
+            res = _Parameter(name, self._region, self)
+            if self._children is None:
+                self._children = {}
             self._children[name] = res
         return res
 
@@ -192,14 +223,15 @@ class _Parameter:
         Optional[_Parameter]
             Parameter of ``None`` if not found
         """
-        name = ensure_input_is_tuple(name)
-        if name:
-            res = self._children.get(name[0], None)
-            if res is not None:
-                res = res.get_subparameter(name[1:])
-            return res
+        res: Optional["_Parameter"] = self
+        for n in ensure_input_is_tuple(name):
+            if not res._children:  # type: ignore
+                return None
+            res = res._children.get(n, None)  # type: ignore
+            if res is None:
+                return None
 
-        return self
+        return res
 
     def attempt_read(
         self,
@@ -229,11 +261,11 @@ class _Parameter:
             If parameter has child parameters which cannot be aggregated (for boolean
             and string parameters).
         """
-        if self._info._type is not None and self._info._type != parameter_type:
+        if self._type is not None and self._type != parameter_type:
             raise ParameterTypeError
-        if self._info._type is None:
-            self._info._unit = unit
-            self._info._type = parameter_type
+        if self._type is None:
+            self._unit = unit
+            self._type = parameter_type
             if parameter_type == ParameterType.SCALAR:
                 self._data = float("NaN")
             elif parameter_type == ParameterType.GENERIC:
@@ -249,7 +281,7 @@ class _Parameter:
                     ),
                     float("NaN"),
                 )
-                self._info._time_points = np.array(time_points, copy=True)
+                self._time_points = np.array(time_points, copy=True)
         self._has_been_read_from = True
 
     def attempt_write(
@@ -281,23 +313,18 @@ class _Parameter:
         self._has_been_written_to = True
 
     @property
-    def full_name(self) -> Tuple[str]:
+    def full_name(self) -> Tuple[str, ...]:
         """
         Full :ref:`hierarchical name <parameter-hierarchy>`
         """
-        p: Optional["_Parameter"] = self
-        r = []
-        while p is not None:
-            r.append(p._info._name)
-            p = p._parent
-        return cast(Tuple[str], tuple(reversed(r)))
+        return self._full_name
 
     @property
     def info(self) -> ParameterInfo:
         """
-        Parameter information
+        Parameter information (the parameter itself)
         """
-        return self._info
+        return self
 
     @property
     def parent(self) -> Optional["_Parameter"]:
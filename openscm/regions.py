@@ -2,7 +2,7 @@
 Handling of region information.
 """
 
-from typing import Dict, Optional, Tuple, cast
+from typing import Dict, Optional, Tuple
 
 from . import parameters
 from .errors import RegionAggregatedError
@@ -11,14 +11,30 @@ from .utils import ensure_input_is_tuple
 # pylint: disable=protected-access
 
 
-class _Region:
+# the hierarchy-wide indexes are references shared by all regions rather than state of
+# a single region
+class _Region:  # pylint: disable=too-many-instance-attributes
     """
     Represents a region in the region hierarchy.
     """
 
+    __slots__ = (
+        "_children",
+        "_full_name",
+        "_has_been_aggregated",
+        "_name",
+        "_parameter_index",
+        "_parameters",
+        "_parent",
+        "_region_index",
+    )
+
     _children: Dict[str, "_Region"]
     """Subregions"""
 
+    _full_name: Tuple[str, ...]
+    """Full hierarchical name"""
+
     _has_been_aggregated: bool
     """
     If True, a parameter of this region has already been read in an aggregated way,
@@ -28,13 +44,27 @@ class _Region:
     _name: str
     """Name"""
 
+    _parameter_index: Dict[
+        Tuple[Tuple[str, ...], Tuple[str, ...]], "parameters._Parameter"
+    ]
+    """
+    All parameters of the region hierarchy by full region name and full parameter
+    name (shared by all regions of the hierarchy)
+    """
+
     _parameters: Dict[str, "parameters._Parameter"]
     """Parameters"""
 
     _parent: Optional["_Region"]
     """Parent region (or `None` if root region)"""
 
-    def __init__(self, name: str):
+    _region_index: Dict[Tuple[str, ...], "_Region"]
+    """
+    All regions of the region hierarchy by full name (shared by all regions of the
+    hierarchy)
+    """
+
+    def __init__(self, name: str, parent: Optional["_Region"] = None):
         """
         Initialize
 
@@ -42,12 +72,23 @@ class _Region:
         ----------
         name
             Name
+        parent
+            Parent region (or ``None`` if root region)
         """
         self._name = name
         self._children = {}
         self._has_been_aggregated = False
         self._parameters = {}
-        self._parent = None
+        self._parent = parent
+        if parent is None:
+            self._full_name = (name,)
+            self._parameter_index = {}
+            self._region_index = {}
+        else:
+            self._full_name = parent._full_name + (name,)
+            self._parameter_index = parent._parameter_index
+            self._region_index = parent._region_index
+        self._region_index[self._full_name] = self
 
     def get_or_create_subregion(self, name: str) -> "_Region":
         """
@@ -74,8 +115,7 @@ class _Region:
         if res is None:
             if self._has_been_aggregated:
                 raise RegionAggregatedError
-            res = _Region(name)
-            res._parent = self
+            res = _Region(name, self)
             self._children[name] = res
         return res
 
@@ -93,14 +133,13 @@ class _Region:
         Optional[_Region]
             Subregion or ``None`` if not found
         """
-        name = ensure_input_is_tuple(name)
-        if name:
-            res = self._children.get(name[0], None)
-            if res is not None:
-                return res.get_subregion(name[1:])
-            return None
+        res: Optional["_Region"] = self
+        for n in ensure_input_is_tuple(name):
+            res = res._children.get(n, None)  # type: ignore
+            if res is None:
+                return None
 
-        return self
+        return res
 
     def get_or_create_parameter(self, name: str) -> "parameters._Parameter":
         """
@@ -144,10 +183,7 @@ class _Region:
         name = ensure_input_is_tuple(name)
         if not name:
             raise ValueError("No parameter name given")
-        root_parameter = self._parameters.get(name[0], None)
-        if root_parameter is not None and len(name) > 1:
-            return root_parameter.get_subparameter(name[1:])
-        return root_parameter
+        return self._parameter_index.get((self._full_name, tuple(name)), None)
 
     def attempt_aggregate(self) -> None:
         """
@@ -157,17 +193,11 @@ class _Region:
         self._has_been_aggregated = True
 
     @property
-    def full_name(self) -> Tuple[str]:
+    def full_name(self) -> Tuple[str, ...]:
         """
         Full hierarchical name
         """
-        p = self
-        r = []
-        while p._parent is not None:
-            r.append(p.name)
-            p = p._parent
-        r.append(p.name)
-        return cast(Tuple[str], tuple(reversed(r)))
+        return self._full_name
 
     @property
     def name(self) -> str:
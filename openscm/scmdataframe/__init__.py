@@ -4,15 +4,16 @@ model relevant data. It provides a simple interface for reading/writing,
 subsetting and visualising model data. ScmDataFrames are able to hold
 multiple model runs which aids in analysis of ensembles of model runs.
 """
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 import numpy as np
 
-from openscm.core import Core
+from openscm.core import Core, ParameterSet
 from openscm.parameters import ParameterInfo, ParameterType
 from openscm.utils import convert_openscm_time_to_datetime
 
 from .base import ScmDataFrameBase, df_append  # noqa: F401
+from .builder import ScmDataFrameBuilder  # noqa: F401
 
 
 class ScmDataFrame(ScmDataFrameBase):
@@ -69,10 +70,55 @@ def convert_core_to_scmdataframe(
     :obj:`ScmDataFrame`
         ``ScmDataFrame`` containing the data from ``core``
     """
+    return convert_parameterset_to_scmdataframe(
+        core.parameters,
+        time_points,
+        model=model,
+        scenario=scenario,
+        climate_model=climate_model,
+    )
+
+
+def convert_parameterset_to_scmdataframe(
+    parameter_set: ParameterSet,
+    time_points: Sequence[int],
+    model: str = "unspecified",
+    scenario: str = "unspecified",
+    climate_model: str = "unspecified",
+) -> ScmDataFrame:
+    """
+    Get an ScmDataFrame from a ParameterSet
+
+    See ``convert_core_to_scmdataframe``, which calls this function with the
+    parameters of the core, for details.
+
+    Parameters
+    ----------
+    parameter_set
+        Parameter set containing time series and optional metadata.
+    time_points
+        List of OpenSCM time values to which all timeseries will be interpolated.
+    model
+        Default value for the model metadata value.
+    scenario
+        Default value for the scenario metadata value.
+    climate_model
+        Default value for the climate_model metadata value.
+
+    Raises
+    ------
+    ValueError
+        If a generic parameter cannot be mapped to an ScmDataFrame meta table.
+
+    Returns
+    -------
+    :obj:`ScmDataFrame`
+        ``ScmDataFrame`` containing the data from ``parameter_set``
+    """
     time_points = np.asarray(time_points)
 
     def walk_parameters(  # type: ignore
-        c: Core, para, past=()
+        para, past=()
     ) -> Dict[Tuple, ParameterInfo]:
         md = {}
         full_para_name = past + (para.info.name,)
@@ -81,7 +127,7 @@ def convert_core_to_scmdataframe(
                 _,
                 child_para,
             ) in para._children.items():  # pylint: disable=protected-access
-                md.update(walk_parameters(c, child_para, past=full_para_name))
+                md.update(walk_parameters(child_para, past=full_para_name))
             return md
 
         md[(full_para_name, para.info.region)] = para.info
@@ -104,8 +150,8 @@ def convert_core_to_scmdataframe(
     for (
         _,
         value,
-    ) in core.parameters._root._parameters.items():  # pylint: disable=protected-access
-        root_params.update(walk_parameters(core, value))
+    ) in parameter_set._root._parameters.items():  # pylint: disable=protected-access
+        root_params.update(walk_parameters(value))
 
     for (param_name, region), p_info in root_params.items():
         # All meta values are stored as generic value (AKA no units)
@@ -115,10 +161,10 @@ def convert_core_to_scmdataframe(
                     "Only generic types with Region=World can be extracted"
                 )
             metadata[parameter_name_to_scm(param_name)] = [
-                core.parameters.get_generic_view(param_name, region).get()
+                parameter_set.get_generic_view(param_name, region).get()
             ]
         else:
-            ts = core.parameters.get_timeseries_view(  # type: ignore
+            ts = parameter_set.get_timeseries_view(  # type: ignore
                 param_name, region, p_info.unit, time_points, p_info.parameter_type
             )
             data.append(ts.get())
@@ -5,10 +5,14 @@ from __future__ import annotations
 
 import copy
 import datetime
+import functools
+import gzip
+import json
 import os
+import re
 import warnings
 from logging import getLogger
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 import pandas as pd
@@ -19,7 +23,7 @@ from openscm.timeseries_converter import (
     ExtrapolationType,
     InterpolationType,
     ParameterType,
-    TimeseriesConverter,
+    get_timeseries_converter,
 )
 from openscm.units import UnitConverter
 from openscm.utils import (
@@ -49,9 +53,20 @@ REQUIRED_COLS: List[str] = ["model", "scenario", "region", "variable", "unit"]
 """Minimum metadata columns required by an ScmDataFrame"""
 
 
+DEFAULT_CHUNKSIZE: int = 10000
+"""Number of rows read at once when reading csv files in chunks"""
+
+BINARY_FORMAT_VERSION: int = 1
+"""Version of the binary format written by ``ScmDataFrameBase.save``"""
+
+
 # pylint doesn't recognise return statements if they include ','
 def _read_file(  # pylint: disable=missing-return-doc
-    fnames: str, *args: Any, **kwargs: Any
+    fnames: str,
+    *args: Any,
+    filters: Optional[Dict[str, Any]] = None,
+    separator: str = DEFAULT_SEPARATOR,
+    **kwargs: Any
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Prepare data to initialise ``ScmDataFrameBase`` from a file
@@ -61,8 +76,17 @@ def _read_file(  # pylint: disable=missing-return-doc
     *args
         Passed to ``_read_pandas``.
 
+    filters
+        Filters to apply while reading, see ``_format_chunks``
+
+    separator
+        String used to define different levels in the data hierarchy (used by the
+        filters)
+
     **kwargs
-        Passed to ``_read_pandas``.
+        Passed to ``_read_pandas``. If ``chunksize`` is given (or ``filters`` are
+        given), csv files are read and formatted in chunks of ``chunksize`` rows
+        (default :attr:`DEFAULT_CHUNKSIZE`).
 
     Returns
     -------
@@ -71,7 +95,18 @@ def _read_file(  # pylint: disable=missing-return-doc
     """
     _logger.info("Reading %s", fnames)
 
-    return _format_data(_read_pandas(fnames, *args, **kwargs))
+    if filters is None and "chunksize" not in kwargs:
+        return _format_data(_read_pandas(fnames, *args, **kwargs))
+
+    if fnames.endswith(("csv", "csv.gz")):
+        kwargs.setdefault("chunksize", DEFAULT_CHUNKSIZE)
+        chunks = _read_pandas(fnames, *args, **kwargs)
+    else:
+        # excel files cannot be read in chunks
+        kwargs.pop("chunksize", None)
+        chunks = [_read_pandas(fnames, *args, **kwargs)]
+
+    return _format_chunks(chunks, {} if filters is None else filters, separator)
 
 
 def _read_pandas(fname: str, *args: Any, **kwargs: Any) -> pd.DataFrame:
@@ -84,17 +119,18 @@ def _read_pandas(fname: str, *args: Any, **kwargs: Any) -> pd.DataFrame:
         Path from which to read data
 
     *args
-        Passed to ``pd.read_csv`` if ``fname`` ends with '.csv', otherwise
-        passed to ``pd.read_excel``.
+        Passed to ``pd.read_csv`` if ``fname`` ends with '.csv' (or '.csv.gz'),
+        otherwise passed to ``pd.read_excel``.
 
     **kwargs
-        Passed to ``pd.read_csv`` if ``fname`` ends with '.csv', otherwise
-        passed to ``pd.read_excel``.
+        Passed to ``pd.read_csv`` if ``fname`` ends with '.csv' (or '.csv.gz'),
+        otherwise passed to ``pd.read_excel``.
 
     Returns
     -------
     :obj:`pd.DataFrame`
-        Read data
+        Read data (an iterator over ``pd.DataFrame`` chunks if ``chunksize`` is
+        passed to ``pd.read_csv``)
 
     Raises
     ------
@@ -103,7 +139,7 @@ def _read_pandas(fname: str, *args: Any, **kwargs: Any) -> pd.DataFrame:
     """
     if not os.path.exists(fname):
         raise OSError("no data file `{}` found!".format(fname))
-    if fname.endswith("csv"):
+    if fname.endswith(("csv", "csv.gz")):
         df = pd.read_csv(fname, *args, **kwargs)
     else:
         xl = pd.ExcelFile(fname)
@@ -166,6 +202,194 @@ def _format_data(  # pylint: disable=missing-return-doc
     return df, meta
 
 
+# pylint doesn't recognise ',' in returns type definition
+def _factorize_meta_col(  # pylint: disable=missing-return-doc
+    meta_col: pd.Series
+) -> Tuple[pd.Series, np.ndarray]:
+    """
+    Get the distinct values of a meta column and the position of each row's value
+
+    Parameters
+    ----------
+    meta_col
+        Meta column
+
+    Returns
+    -------
+    :obj:`pd.Series`, :obj:`np.ndarray`
+        Distinct values in the column (including ``np.nan`` as last value if the
+        column contains nan) and, for each row, the position of its value in the
+        distinct values
+    """
+    codes, uniques = pd.factorize(meta_col)
+    if (codes == -1).any():
+        codes[codes == -1] = len(uniques)
+        uniques = np.append(np.asarray(uniques, dtype=object), np.nan)
+
+    return pd.Series(uniques, name=meta_col.name), codes
+
+
+def _match_meta_filters(
+    meta: pd.DataFrame, filters: Dict[str, Any], separator: str = DEFAULT_SEPARATOR
+) -> np.ndarray:
+    """
+    Determine the rows of metadata matching filters
+
+    Patterns are only matched against the distinct values of each column.
+
+    Parameters
+    ----------
+    meta
+        Metadata
+
+    filters
+        Filters as for ``ScmDataFrameBase.filter``, restricted to metadata columns and
+        ``level`` (and ``regexp``)
+
+    separator
+        String used to define different levels in the data hierarchy
+
+    Returns
+    -------
+    :obj:`np.array` of :obj:`bool`
+        Array where True indicates a match
+
+    Raises
+    ------
+    ValueError
+        Filtering cannot be performed on requested column.
+    """
+    filters = dict(filters)
+    regexp = filters.pop("regexp", False)
+    keep = np.ones(len(meta), dtype=bool)
+    for col, values in filters.items():
+        if col == "level":
+            if "variable" in filters:
+                continue  # level handled in variable filtering
+            col, values, level = "variable", "*", values
+        elif col in meta.columns:
+            level = filters.get("level", None) if col == "variable" else None
+        else:
+            raise ValueError("filter by `{}` not supported".format(col))
+
+        distinct, codes = _factorize_meta_col(meta[col])
+        matches = pattern_match(
+            distinct, values, level, regexp, has_nan=True, separator=separator
+        )
+        keep &= np.asarray(matches, dtype=bool)[codes]
+
+    return keep
+
+
+# pylint doesn't recognise ',' in returns type definition
+def _format_chunks(  # pylint: disable=missing-return-doc,too-many-locals
+    chunks: Iterable[pd.DataFrame],
+    filters: Dict[str, Any],
+    separator: str = DEFAULT_SEPARATOR,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Prepare data to initialise ``ScmDataFrameBase`` from chunks of rows of a file
+
+    Rows which do not match ``filters`` are dropped from each chunk straight away. For
+    wide format data, the values of each chunk are appended to a single value array,
+    which is grown as needed, so that neither the whole file nor copies of the
+    result are held in memory at once. Long format data is filtered chunk by chunk
+    and then formatted with ``_format_data``.
+
+    Parameters
+    ----------
+    chunks
+        Chunks of rows, all with the same columns
+
+    filters
+        Filters as for ``ScmDataFrameBase.filter``, restricted to metadata columns and
+        ``level`` (and ``regexp``)
+
+    separator
+        String used to define different levels in the data hierarchy
+
+    Returns
+    -------
+    :obj:`pd.DataFrame`, :obj:`pd.DataFrame`
+        First dataframe is the data. Second dataframe is metadata.
+
+    Raises
+    ------
+    ValueError
+        Not all required metadata columns are present, the time axis cannot be
+        understood or the filters cannot be applied
+    """
+    values = np.empty((0, 0))
+    nrows = 0
+    metas = []
+    long_chunks = []
+    time_cols = None  # type: Optional[List[Any]]
+    for chunk in chunks:
+        chunk.rename(
+            columns={c: str(c).lower() for c in chunk.columns if is_str(c)},
+            inplace=True,
+        )
+        if list(chunk.index.names) != [None]:
+            chunk.reset_index(inplace=True)
+
+        if not set(REQUIRED_COLS).issubset(set(chunk.columns)):
+            missing = list(set(REQUIRED_COLS) - set(chunk.columns))
+            raise ValueError("missing required columns `{}`!".format(missing))
+
+        if filters:
+            keep = _match_meta_filters(chunk, filters, separator)
+            if not keep.all():
+                chunk = chunk[keep]
+
+        if "value" in chunk.columns:
+            long_chunks.append(chunk)
+            continue
+
+        if time_cols is None:
+            extra_cols = [
+                c
+                for c in dict.fromkeys(chunk.columns)
+                if c not in REQUIRED_COLS and not _is_time_col(c)
+            ]
+            time_cols = [
+                c for c in chunk.columns if c not in REQUIRED_COLS + extra_cols
+            ]
+            if not time_cols:
+                raise ValueError(
+                    "invalid column format, must contain some time (int, float or "
+                    "datetime) columns!"
+                )
+            # sort the time axis once rather than every chunk
+            time_order = np.argsort(
+                TimeIndex(py_dt=time_cols).as_openscm(), kind="stable"
+            )
+            time_cols = [time_cols[i] for i in time_order]
+            values = np.empty((0, len(time_cols)))
+
+        if nrows + len(chunk) > len(values):
+            # grow geometrically so that appending is amortised O(1) per row
+            values.resize(
+                (max(nrows + len(chunk), 2 * len(values)), len(time_cols)),
+                refcheck=False,
+            )
+        values[nrows : nrows + len(chunk)] = chunk[time_cols].values
+        nrows += len(chunk)
+        metas.append(chunk[REQUIRED_COLS + extra_cols])
+
+    if time_cols is None:
+        return _format_data(
+            pd.concat(long_chunks, ignore_index=True)
+            if long_chunks
+            else pd.DataFrame(columns=REQUIRED_COLS)
+        )
+
+    values.resize((nrows, len(time_cols)), refcheck=False)
+    meta = pd.concat(metas, ignore_index=True)
+    df = pd.DataFrame(values.T, index=pd.Index(time_cols, name="time"), copy=False)
+
+    return df, meta
+
+
 def _format_long_data(df):
     # check if time column is given as `year` (int) or `time` (datetime)
     cols = set(df.columns)
@@ -185,35 +409,81 @@ def _format_long_data(df):
     return df, meta
 
 
-def _format_wide_data(df):
-    orig = df.copy()
+_FLOAT_REGEXP = re.compile(r"^\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*$")
+"""Strings which can definitely be cast to float (e.g. years)"""
 
-    cols = set(df.columns) - set(REQUIRED_COLS)
-    time_cols, extra_cols = False, []
-    for i in cols:
-        # if in wide format, check if columns are years (int) or datetime
-        if is_floatlike(i) or isinstance(i, datetime.datetime):
-            time_cols = True
-        else:
+_ISO_DATETIME_REGEXP = re.compile(r"^\d{4}-\d{2}-\d{2}( \d{2}:\d{2}:\d{2})?$")
+"""Strings which are likely ISO dates, optionally with time"""
+
+
+@functools.lru_cache(maxsize=16384)
+def _is_time_col(col: Any) -> bool:
+    """
+    Determine whether a column of wide format data holds a time point
+
+    Cheap checks for the common year, float and ISO formats are done first, only if
+    they fail ``dateutil.parser.parse`` is tried. Results are cached per column name
+    as the same names show up again and again (e.g. when reading many files).
+
+    Parameters
+    ----------
+    col
+        Column name
+
+    Returns
+    -------
+    bool
+        True if the column holds a time point, False otherwise
+    """
+    if isinstance(col, str):
+        if _FLOAT_REGEXP.match(col):
+            return True
+        match = _ISO_DATETIME_REGEXP.match(col)
+        if match:
             try:
-                try:
-                    # most common format
-                    datetime.datetime.strptime(i, "%Y-%m-%d %H:%M:%S")
-                    time_cols = True
-                except ValueError:
-                    # this is super slow so avoid if possible
-                    parser.parse(str(i))  # if no ValueError, this is datetime
-                    time_cols = True
+                datetime.datetime.strptime(
+                    col, "%Y-%m-%d %H:%M:%S" if match.group(1) else "%Y-%m-%d"
+                )
+                return True
             except ValueError:
-                extra_cols.append(i)  # some other string
+                pass  # check thoroughly below
+
+    # if in wide format, check if columns are years (int) or datetime
+    if is_floatlike(col) or isinstance(col, datetime.datetime):
+        return True
+
+    try:
+        try:
+            # most common format
+            datetime.datetime.strptime(col, "%Y-%m-%d %H:%M:%S")
+            return True
+        except ValueError:
+            # this is super slow so avoid if possible
+            parser.parse(str(col))  # if no ValueError, this is datetime
+            return True
+    except ValueError:
+        return False  # some other string
+
+
+def _format_wide_data(df):
+    extra_cols = []
+    time_cols = False
+    for col in dict.fromkeys(df.columns):
+        if col in REQUIRED_COLS:
+            continue
+        if _is_time_col(col):
+            time_cols = True
+        else:
+            extra_cols.append(col)
 
     if not time_cols:
         msg = "invalid column format, must contain some time (int, float or datetime) columns!"
         raise ValueError(msg)
 
+    meta = df[REQUIRED_COLS + extra_cols]
     df = df.drop(REQUIRED_COLS + extra_cols, axis="columns").T
     df.index.name = "time"
-    meta = orig[REQUIRED_COLS + extra_cols].set_index(df.columns)
+    meta = meta.set_index(df.columns)
 
     return df, meta
 
@@ -269,6 +539,67 @@ def _from_ts(  # pylint: disable=missing-return-doc
     return df, meta
 
 
+def _to_indexer(mask: np.ndarray) -> Union[slice, np.ndarray]:
+    """
+    Convert a boolean mask to a slice if possible, otherwise to integer indices
+
+    Parameters
+    ----------
+    mask
+        Boolean mask (a slice is returned unchanged)
+
+    Returns
+    -------
+    Union[slice, :obj:`np.ndarray`]
+        Slice if the selected elements are contiguous, integer indices otherwise
+    """
+    if isinstance(mask, slice):
+        return mask
+
+    idx = np.flatnonzero(mask)
+    if idx.size and idx[-1] - idx[0] + 1 == idx.size:
+        return slice(idx[0], idx[-1] + 1)
+
+    return idx
+
+
+def _take(
+    values: np.ndarray,
+    rows: Union[slice, np.ndarray],
+    columns: Union[slice, np.ndarray],
+) -> np.ndarray:
+    """
+    Select rows and columns of a 2D array
+
+    Contiguous selections are taken as views, other selections are copied in one go
+    so that no intermediate array larger than the result is created.
+
+    Parameters
+    ----------
+    values
+        Array to select from
+
+    rows
+        Boolean mask or slice of rows to select
+
+    columns
+        Boolean mask or slice of columns to select
+
+    Returns
+    -------
+    :obj:`np.ndarray`
+        Selected values
+    """
+    rows = _to_indexer(rows)
+    columns = _to_indexer(columns)
+    if isinstance(rows, slice):
+        return values[rows][:, columns]
+    if isinstance(columns, slice):
+        return values[:, columns][rows]
+
+    return values[np.ix_(rows, columns)]
+
+
 class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
     """
     Base of OpenSCM's custom DataFrame implementation.
@@ -286,6 +617,18 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
     from coal would be "Emissions|CO2|Energy|Coal".
     """
 
+    _values: np.ndarray
+    """Timeseries values as contiguous float array (timeseries x time points)"""
+
+    _time_index: TimeIndex
+    """Time points of the timeseries"""
+
+    _meta_frame: pd.DataFrame
+    """Metadata, one row per timeseries (aligned by position with ``_values``)"""
+
+    _meta_index: Dict[str, Tuple[pd.Series, np.ndarray]]
+    """Cache of distinct values and the code of each row's value per meta column"""
+
     def __init__(
         self,
         data: Union[
@@ -343,7 +686,11 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
                 )
 
         **kwargs:
-            Additional parameters passed to `pyam.core._read_file` to read files
+            Additional parameters passed to ``_read_file`` to read files. Passing
+            ``chunksize`` reads csv files in chunks of this many rows. Passing
+            ``filters`` (a dictionary of arguments as for :func:`filter`, restricted
+            to metadata columns and ``level``) discards timeseries which do not match
+            while reading so that they are never held in memory.
 
         Raises
         ------
@@ -355,15 +702,18 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         TypeError
             Timeseries cannot be read from ``data``
         """
+        if isinstance(data, ScmDataFrameBase) and columns is None:
+            # pylint: disable=protected-access
+            self._values = data._values.copy()
+            self._time_index = data._time_index  # immutable
+            self._meta = data._meta.copy()
+            self._sort_meta_cols()
+            return
+
+        # values read from a file are not referenced anywhere else
+        owned = False
         if columns is not None:
             (_df, _meta) = _from_ts(data, index=index, **columns)
-        elif isinstance(data, ScmDataFrameBase):
-            # turn off mypy type checking here as ScmDataFrameBase isn't defined
-            # when mypy does type checking
-            (_df, _meta) = (
-                data._data.copy(),  # type: ignore # pylint: disable=protected-access
-                data._meta.copy(),  # type: ignore # pylint: disable=protected-access
-            )
         elif isinstance(data, (pd.DataFrame, pd.Series)):
             (_df, _meta) = _format_data(data.copy())
         elif isinstance(data, IamDataFrame) and data is not None:
@@ -378,14 +728,188 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
                 error_msg = "Cannot load {} from {}".format(type(self), type(data))
                 raise TypeError(error_msg)
             # mypy doesn't recognise type control in `if` statements
-            (_df, _meta) = _read_file(data, **kwargs)  # type: ignore
+            (_df, _meta) = _read_file(
+                cast(str, data), separator=self.data_hierarchy_separator, **kwargs
+            )
+            owned = True
         self._time_index = TimeIndex(py_dt=_df.index.values)
-        _df.index = self._time_index.as_pd_index()
-        _df = _df.astype(float)
-
-        self._data, self._meta = (_df, _meta)
+        # otherwise copy, the transposed values may share memory with ``data``
+        self._values = np.array(_df.values.T, dtype=float, order="C", copy=not owned)
+        self._meta = _meta
         self._sort_meta_cols()
 
+    @property
+    def _data(self) -> pd.DataFrame:
+        """
+        Timeseries values as ``pd.DataFrame`` (time points x timeseries)
+
+        The returned frame is a view of the underlying values, it is only materialised
+        for interoperability with pandas.
+        """
+        return pd.DataFrame(
+            self._writable_values().T,
+            index=self._time_index.as_pd_index(),
+            columns=self._meta.index,
+            copy=False,
+        )
+
+    @_data.setter
+    def _data(self, value: pd.DataFrame) -> None:
+        """
+        Set timeseries values (and time points) from a ``pd.DataFrame``
+
+        Parameters
+        ----------
+        value
+            ``pd.DataFrame`` with time points as index and timeseries as columns
+        """
+        self._time_index = TimeIndex(py_dt=value.index.values)
+        self._values = np.ascontiguousarray(value.values.T, dtype=float)
+
+    @property
+    def _meta(self) -> pd.DataFrame:
+        """
+        Metadata, one row per timeseries (aligned by position with ``_values``)
+
+        Setting the metadata invalidates the cached meta column indexes. Columns of the
+        metadata must only be modified in place with :meth:`_set_meta_column`, which
+        discards the column's cached index.
+        """
+        return self._meta_frame
+
+    @_meta.setter
+    def _meta(self, value: pd.DataFrame) -> None:
+        """
+        Set metadata
+
+        Parameters
+        ----------
+        value
+            New metadata
+        """
+        self._meta_frame = value
+        self._meta_index = {}
+
+    # pylint doesn't recognise ',' in returns type definition
+    def _get_meta_index(  # pylint: disable=missing-return-doc
+        self, col: str
+    ) -> Tuple[pd.Series, np.ndarray]:
+        """
+        Get the index of a meta column, building it if it is not cached yet
+
+        Parameters
+        ----------
+        col
+            Meta column
+
+        Returns
+        -------
+        :obj:`pd.Series`, :obj:`np.ndarray`
+            Distinct values in the column (including ``np.nan`` as last value if the
+            column contains nan) and, for each row, the position of its value in the
+            distinct values
+        """
+        try:
+            return self._meta_index[col]
+        except KeyError:
+            pass
+
+        res = self._meta_index[col] = _factorize_meta_col(self._meta[col])
+        return res
+
+    def _set_meta_column(self, col: str, values: Any, rows: Any = None) -> None:
+        """
+        Set (some rows of) a meta column and discard its cached index
+
+        Parameters
+        ----------
+        col
+            Meta column (added if it does not exist yet)
+
+        values
+            New values
+
+        rows
+            Labels or boolean mask of the rows to set, if None the whole column is set
+        """
+        if rows is None:
+            self._meta[col] = values
+        else:
+            self._meta.loc[rows, col] = values
+        self._meta_index.pop(col, None)
+
+    def _match_meta(  # pylint: disable=too-many-arguments
+        self,
+        col: str,
+        values: Any,
+        level: Optional[Union[str, int]] = None,
+        regexp: bool = False,
+        has_nan: bool = True,
+    ) -> np.ndarray:
+        """
+        Find the rows whose value in a meta column match a filter
+
+        The filter is only applied to the distinct values of the column, see
+        :func:`pattern_match` for details of the arguments.
+
+        Returns
+        -------
+        :obj:`np.array` of :obj:`bool`
+            Array where True indicates a match
+        """
+        distinct, codes = self._get_meta_index(col)
+        matches = pattern_match(
+            distinct,
+            values,
+            level,
+            regexp,
+            has_nan=has_nan,
+            separator=self.data_hierarchy_separator,
+        )
+        return np.asarray(matches, dtype=bool)[codes]
+
+    def _writable_values(self) -> np.ndarray:
+        """
+        Get the values for writing, copying them first if they are shared
+
+        Returns
+        -------
+        :obj:`np.ndarray`
+            Values which are not shared with any other instance
+        """
+        if not self._values.flags.writeable:
+            self._values = self._values.copy()
+
+        return self._values
+
+    def _new_like(
+        self, values: np.ndarray, time_index: TimeIndex, meta: pd.DataFrame
+    ) -> ScmDataFrameBase:
+        """
+        Create a new instance of the same class with the given data
+
+        Parameters
+        ----------
+        values
+            Timeseries values (timeseries x time points), not copied
+
+        time_index
+            Time points of the timeseries
+
+        meta
+            Metadata of the timeseries, not copied
+
+        Returns
+        -------
+        :obj:`ScmDataFrameBase`
+            New instance holding the given data
+        """
+        ret = copy.copy(self)
+        ret._values = values  # pylint: disable=protected-access
+        ret._time_index = time_index  # pylint: disable=protected-access
+        ret._meta = meta  # pylint: disable=protected-access
+        return ret
+
     def copy(self) -> ScmDataFrameBase:
         """
         Return a ``copy.deepcopy`` of self
@@ -422,11 +946,13 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         """
         _key_check = [key] if is_str(key) or not isinstance(key, Iterable) else key
         if key == "time":
-            return pd.Series(self._time_index.as_pd_index(), dtype="object")
+            return pd.Series(
+                self._time_index.as_py().copy(), dtype="object", name="time"
+            )
         if key == "year":
-            return pd.Series(self._time_index.years())
-        if set(_key_check).issubset(self.meta.columns):
-            return self.meta.__getitem__(key)
+            return pd.Series(self._time_index.years().copy())
+        if set(_key_check).issubset(self._meta.columns):
+            return self._meta[key].copy()
 
         raise KeyError("I don't know what to do with key: {}".format(key))
 
@@ -442,7 +968,6 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         if key == "time":
             # TODO: double check if this will actually do what we want
             self._time_index = TimeIndex(py_dt=value)
-            self._data.index = self._time_index.as_pd_index()
             return value
         return self.set_meta(value, name=key)
 
@@ -479,9 +1004,7 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
 
         core = Core(climate_model, self.time_points.min(), self.time_points.max())
 
-        for i in self._data:
-            vals = self._data[i]
-            metadata = self._meta.loc[i]
+        for vals, (_, metadata) in zip(self._values, self._meta.iterrows()):
             variable = metadata.pop("variable")
             region = metadata.pop("region")
             unit = metadata.pop("unit")
@@ -494,7 +1017,7 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
                 unit,
                 self.time_points,
                 ParameterType.POINT_TIMESERIES,
-            ).set(vals.values)
+            ).set(vals)
 
         for k, v in meta_values.iteritems():
             core.parameters.get_writable_generic_view(k, ("World",)).set(v)
@@ -535,25 +1058,35 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         ValueError
             If the metadata are not unique between timeseries
         """
-        d = self._data.copy()
         meta_subset = self._meta if meta is None else self._meta[meta]
         if meta_subset.duplicated().any():
             raise ValueError("Duplicated meta values")
 
-        d.columns = pd.MultiIndex.from_arrays(
-            meta_subset.values.T, names=meta_subset.columns
+        return pd.DataFrame(
+            self._values.copy(),
+            index=pd.MultiIndex.from_arrays(
+                meta_subset.values.T, names=meta_subset.columns
+            ),
+            columns=self._time_index.as_pd_index(),
         )
 
-        return d.T
-
     @property
     def values(self) -> np.ndarray:
         """
         Return timeseries values without metadata
 
-        Calls ``self.timeseries()``
+        Same as ``self.timeseries().values`` (timeseries as rows, time points as
+        columns) but without building the ``pd.DataFrame``
+
+        Raises
+        ------
+        ValueError
+            If the metadata are not unique between timeseries
         """
-        return self.timeseries().values
+        if self._meta.duplicated().any():
+            raise ValueError("Duplicated meta values")
+
+        return self._values.copy()
 
     @property
     def meta(self) -> pd.DataFrame:
@@ -572,6 +1105,10 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         """
         Return a filtered ScmDataFrame (i.e., a subset of the data).
 
+        The values of the returned instance are selected directly and, if the
+        selection is contiguous, share memory with ``self`` until either of the two
+        is written to (copy-on-write).
+
         Parameters
         ----------
         keep
@@ -616,32 +1153,58 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         AssertionError
             Data and meta become unaligned.
         """
+        # pylint: disable=protected-access
         _keep_ts, _keep_cols = self._apply_filters(kwargs, has_nan)
-        idx = _keep_ts[:, np.newaxis] & _keep_cols
-        if not idx.shape == self._data.shape:
+        if not (_keep_cols.shape + _keep_ts.shape) == self._values.shape:
             raise AssertionError(
                 "Index shape does not match data shape"
             )  # pragma: no cover  # don't think it's possible to get here...
-        idx = idx if keep else ~idx
-
-        ret = self.copy() if not inplace else self
-        d = ret._data.where(idx)  # pylint: disable=protected-access
-        ret._data = d.dropna(  # pylint: disable=protected-access
-            axis=1, how="all"
-        ).dropna(axis=0, how="all")
-        ret._meta = ret._meta[  # pylint: disable=protected-access
-            (~d.isna()).sum(axis=0) > 0
-        ]
-        ret["time"] = ret._data.index.values  # pylint: disable=protected-access
 
-        if not (
-            len(ret._data.columns) == len(ret._meta)  # pylint: disable=protected-access
-        ):
+        if keep:
+            rows, times = _keep_cols, _keep_ts
+            values = _take(self._values, rows, times)
+        elif _keep_ts.all():
+            rows, times = ~_keep_cols, _keep_ts
+            values = _take(self._values, rows, times)
+        elif _keep_cols.all():
+            rows, times = _keep_cols, ~_keep_ts
+            values = _take(self._values, rows, times)
+        else:
+            # only part of the selected timeseries is dropped so we have to mask
+            rows = times = slice(None)
+            values = self._values.copy()
+            values[np.ix_(_keep_cols, _keep_ts)] = np.nan
+
+        meta = self._meta.iloc[_to_indexer(rows)]
+        time_index = self._time_index[_to_indexer(times)]
+
+        # drop timeseries and time points which only contain nan
+        not_nan = ~np.isnan(values)
+        keep_series = not_nan.any(axis=1)
+        keep_times = not_nan.any(axis=0)
+        if not (keep_series.all() and keep_times.all()):
+            values = _take(values, keep_series, keep_times)
+            meta = meta.iloc[_to_indexer(keep_series)]
+            time_index = time_index[_to_indexer(keep_times)]
+
+        # meta is small compared to the values, copying it avoids any aliasing
+        meta = meta.copy()
+        if inplace:
+            ret = self
+            ret._values, ret._time_index, ret._meta = values, time_index, meta
+        else:
+            if np.may_share_memory(values, self._values):
+                # share the buffer until either side writes to it
+                values.flags.writeable = False
+                self._values.flags.writeable = False
+            ret = self._new_like(values, time_index, meta)
+
+        if not values.shape[0] == len(ret._meta):
             raise AssertionError(
                 "Data and meta have become unaligned"
             )  # pragma: no cover  # don't think it's possible to get here...
 
-        if not ret._meta.shape[0]:  # pylint: disable=protected-access
+        if not ret._meta.shape[0]:
             _logger.warning("Filtered ScmDataFrame is empty!")
 
         if not inplace:
@@ -682,29 +1245,20 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
             Filtering cannot be performed on requested column.
         """
         regexp = filters.pop("regexp", False)
-        keep_ts = np.array([True] * len(self._data))
-        keep_meta = np.array([True] * len(self.meta))
+        keep_ts = np.ones(self._values.shape[1], dtype=bool)
+        keep_meta = np.ones(len(self._meta), dtype=bool)
 
         # filter by columns and list of values
         for col, values in filters.items():
             if col == "variable":
                 level = filters["level"] if "level" in filters else None
-                keep_meta &= pattern_match(
-                    self.meta[col],
-                    values,
-                    level,
-                    regexp,
-                    has_nan=has_nan,
-                    separator=self.data_hierarchy_separator,
-                ).values
-            elif col in self.meta.columns:
-                keep_meta &= pattern_match(
-                    self.meta[col],
-                    values,
-                    regexp=regexp,
-                    has_nan=has_nan,
-                    separator=self.data_hierarchy_separator,
-                ).values
+                keep_meta &= self._match_meta(
+                    col, values, level, regexp, has_nan=has_nan
+                )
+            elif col in self._meta.columns:
+                keep_meta &= self._match_meta(
+                    col, values, regexp=regexp, has_nan=has_nan
+                )
             elif col == "year":
                 keep_ts &= years_match(self._time_index.years(), values)
 
@@ -722,14 +1276,9 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
 
             elif col == "level":
                 if "variable" not in filters.keys():
-                    keep_meta &= pattern_match(
-                        self.meta["variable"],
-                        "*",
-                        values,
-                        regexp=regexp,
-                        has_nan=has_nan,
-                        separator=self.data_hierarchy_separator,
-                    ).values
+                    keep_meta &= self._match_meta(
+                        "variable", "*", values, regexp=regexp, has_nan=has_nan
+                    )
                 # else do nothing as level handled in variable filtering
 
             else:
@@ -826,9 +1375,8 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         for col, _mapping in mapping.items():
             if col not in self.meta.columns:
                 raise ValueError("Renaming by {} not supported!".format(col))
-            ret._meta[col] = ret._meta[col].replace(  # pylint: disable=protected-access
-                _mapping
-            )
+            # pylint: disable=protected-access
+            ret._set_meta_column(col, ret._meta[col].replace(_mapping))
             if ret._meta.duplicated().any():  # pylint: disable=protected-access
                 raise ValueError("Renaming to non-unique metadata for {}!".format(col))
 
@@ -880,7 +1428,7 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         if hasattr(meta, "index") and hasattr(meta.index, "names"):  # type: ignore
             index = meta.index  # type: ignore # mypy doesn't recognise if
         if index is None:
-            self._meta[name] = meta
+            self._set_meta_column(name, meta)
             return
 
         # turn dataframe to index if index arg is a DataFrame
@@ -958,11 +1506,7 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         target_times_openscm = np.asarray(target_times_openscm)
         target_times_dt = np.asarray(target_times_dt)
 
-        # Need to keep an object index or pandas will not be able to handle a wide
-        # time range
-        timeseries_index = pd.Index(target_times_dt, dtype="object", name="time")
-
-        res = self.copy()
+        res = self._new_like(self._values, self._time_index, self._meta.copy())
 
         def _to_param_type(p: Union[ParameterType, str]) -> ParameterType:
             if isinstance(p, ParameterType):
@@ -976,74 +1520,72 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
 
         # Add in a parameter_type column if it doesn't exist
         if "parameter_type" not in res._meta:
-            res._meta["parameter_type"] = None
+            res._set_meta_column("parameter_type", None)
             res._sort_meta_cols()
 
-        def guess(r):
-            if r.parameter_type is None:
-                warnings.warn(
-                    "`parameter_type` metadata not available. Guessing parameter types where unavailable."
-                )
-                parameter_type = guess_parameter_type(r.variable, r.unit)
-                r.parameter_type = (
+        unknown_parameter_type = np.array(
+            [p is None for p in res._meta["parameter_type"]], dtype=bool
+        )
+        if unknown_parameter_type.any():
+            warnings.warn(
+                "`parameter_type` metadata not available. Guessing parameter types where unavailable."
+            )
+            # only guess once per distinct variable and unit
+            to_guess = res._meta.loc[unknown_parameter_type, ["variable", "unit"]]
+            guesses = {
+                (v, u): (
                     "average"
-                    if parameter_type == ParameterType.AVERAGE_TIMESERIES
+                    if guess_parameter_type(v, u) == ParameterType.AVERAGE_TIMESERIES
                     else "point"
                 )
-            return r
-
-        res._meta.apply(guess, axis=1)
+                for v, u in to_guess.drop_duplicates().itertuples(index=False)
+            }
+            res._set_meta_column(
+                "parameter_type",
+                [guesses[(v, u)] for v, u in to_guess.itertuples(index=False)],
+                unknown_parameter_type,
+            )
 
-        # Resize dataframe to new index length
-        old_data = res._data
-        res._data = pd.DataFrame(index=timeseries_index, columns=res._data.columns)
+        # Resize data to new index length
+        new_data = np.full((len(self._values), len(target_times_openscm)), np.nan)
 
         for parameter_type, grp in res._meta.groupby("parameter_type"):
             p_type = _to_param_type(parameter_type)
             time_points = self.time_points
+            target_time_points = target_times_openscm
 
             if p_type == ParameterType.AVERAGE_TIMESERIES:
                 # With an average time series we are making the assumption that the last value is the
                 # average value between t[-1] and (t[-1] - t[-2]). This will ensure that both the
                 # point and average timeseries can use the same time grid.
-                delta_t = target_times_openscm[-1] - target_times_openscm[-2]
-                target_times_openscm = np.concatenate(
-                    (target_times_openscm, [target_times_openscm[-1] + delta_t])
+                delta_t = target_time_points[-1] - target_time_points[-2]
+                target_time_points = np.concatenate(
+                    (target_time_points, [target_time_points[-1] + delta_t])
                 )
 
                 delta_t = time_points[-1] - time_points[-2]
                 time_points = np.concatenate((time_points, [time_points[-1] + delta_t]))
 
-            timeseries_converter = TimeseriesConverter(
+            timeseries_converter = get_timeseries_converter(
                 time_points,
-                target_times_openscm,
+                target_time_points,
                 p_type,
                 interpolation_type,
                 extrapolation_type,
             )
 
-            res._data[grp.index] = old_data[
-                grp.index
-            ].apply(  # pylint: disable=protected-access
-                lambda col: pd.Series(
-                    timeseries_converter.convert_from(  # pylint: disable=cell-var-from-loop
-                        col.values
-                    ),
-                    index=timeseries_index,
-                )
-            )
+            # convert all timeseries of this parameter type at once
+            rows = res._meta.index.get_indexer(grp.index)
+            new_data[rows] = timeseries_converter.convert_from(self._values[rows])
 
             # Convert from ParameterType to str
             parameter_type_str = (
-                "average"
-                if parameter_type == ParameterType.AVERAGE_TIMESERIES
-                else "point"
-            )
-            res._meta.loc[grp.index] = res._meta.loc[grp.index].assign(
-                parameter_type=parameter_type_str
+                "average" if p_type == ParameterType.AVERAGE_TIMESERIES else "point"
             )
+            res._set_meta_column("parameter_type", parameter_type_str, grp.index)
 
-        res["time"] = timeseries_index
+        res._values = new_data
+        res["time"] = target_times_dt
         return res
 
     def resample(self, rule: str = "AS", **kwargs: Any) -> ScmDataFrameBase:
@@ -1216,7 +1758,10 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         """
         Convert the units of a selection of timeseries.
 
-        Uses :obj:`openscm.units.UnitConverter` to perform the conversion.
+        Uses :obj:`openscm.units.UnitConverter` to perform the conversion. The
+        selected timeseries may be in different source units, e.g. ``"Mt CO2/yr"``
+        and ``"kt CH4/yr"``. A scaling factor and offset is determined once for each
+        distinct source unit and then applied to all selected timeseries at once.
 
         Parameters
         ----------
@@ -1244,17 +1789,38 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
         ret = self if inplace else self.copy()
 
         if "unit_context" not in ret._meta:
-            ret._meta["unit_context"] = None
+            ret._set_meta_column("unit_context", None)
             ret._sort_meta_cols()
 
-        to_convert = ret.filter(**kwargs)
-        for orig_unit, grp in to_convert._meta.groupby("unit"):  # type: ignore
-            uc = UnitConverter(orig_unit, unit, context=context)
-            ret._data[grp.index] = ret._data[grp.index].apply(uc.convert_from)
-            # TODO: Check if unit_context has changed
-            ret._meta.loc[grp.index] = ret._meta.loc[grp.index].assign(
-                unit=unit, unit_context=context
+        # same selection as ``ret.filter(**kwargs)`` but without copying any data
+        keep_ts, keep_meta = ret._apply_filters(kwargs)
+        keep_meta &= ~np.isnan(ret._values[:, keep_ts]).all(axis=1)
+        if not keep_meta.any():
+            _logger.warning("Filtered ScmDataFrame is empty!")
+        else:
+            # sorted so that units are converted in the same order as by a groupby
+            codes, orig_units = pd.factorize(
+                ret._meta.loc[keep_meta, "unit"], sort=True
+            )
+            # timeseries without a unit (code -1) cannot be converted
+            has_unit = codes != -1
+            keep_meta[keep_meta] = has_unit
+            codes = codes[has_unit]
+            to_convert = ret._meta.index[keep_meta]
+            converters = [
+                UnitConverter(orig_unit, unit, context=context)
+                for orig_unit in orig_units
+            ]
+            scaling = np.array([uc.scaling for uc in converters])[codes]
+            offset = np.array([uc.offset for uc in converters])[codes]
+
+            values = ret._writable_values()
+            values[keep_meta] = (
+                values[keep_meta] * scaling[:, np.newaxis] + offset[:, np.newaxis]
             )
+            # TODO: Check if unit_context has changed
+            ret._set_meta_column("unit", unit, to_convert)
+            ret._set_meta_column("unit_context", context, to_convert)
 
         if not inplace:
             return ret
@@ -1374,16 +1940,218 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
 
         return LongDatetimeIamDataFrame(self.timeseries())
 
-    def to_csv(self, path: str, **kwargs: Any) -> None:
+    def to_csv(
+        self,
+        path: str,
+        float_format: Optional[str] = None,
+        compression: Optional[str] = "infer",
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        **kwargs: Any
+    ) -> None:
         """
         Write timeseries data to a csv file
 
+        The data is written in wide IAMC format (metadata columns followed by one
+        column per time point), ``chunksize`` timeseries at a time so that memory use
+        does not grow with the size of the data.
+
         Parameters
         ----------
         path
             Path to write the file into
+
+        float_format
+            Format string for the values, e.g. ``"%.6g"`` (default: full precision)
+
+        compression
+            Either ``"gzip"``, ``None`` or ``"infer"``. If ``"infer"``, the file is
+            compressed with gzip if ``path`` ends with '.gz'.
+
+        chunksize
+            Number of timeseries written at once
+
+        **kwargs
+            Passed to ``pd.DataFrame.to_csv``
+
+        Raises
+        ------
+        ValueError
+            ``compression`` is not supported
+        """
+        if compression == "infer":
+            compression = "gzip" if path.endswith(".gz") else None
+        if compression == "gzip":
+            fh = gzip.open(path, "wt", newline="")
+        elif compression is None:
+            fh = open(path, "w", newline="")
+        else:
+            raise ValueError("unsupported compression `{}`".format(compression))
+
+        columns = [str(c).title() for c in self._meta.columns] + [
+            str(t) for t in self._time_index.as_py()
+        ]
+        with fh:
+            for start in range(0, max(len(self), 1), chunksize):
+                rows = slice(start, start + chunksize)
+                chunk = pd.concat(
+                    [
+                        self._meta.iloc[rows].reset_index(drop=True),
+                        pd.DataFrame(self._values[rows]),
+                    ],
+                    axis="columns",
+                )
+                chunk.columns = columns
+                chunk.to_csv(
+                    fh,
+                    header=not start,
+                    index=False,
+                    float_format=float_format,
+                    **kwargs
+                )
+
+    def save(self, path: str) -> None:
+        """
+        Write timeseries data to a directory in OpenSCM's binary format
+
+        The directory holds the values as a raw float64 block (``values.npy``), the
+        time points as int64 OpenSCM times (``time.npy``), the metadata encoded as
+        codes into each column's distinct values (``meta_codes.npy``) and a header
+        (``header.json``). The distinct values of numeric and datetime columns are
+        kept with their dtype (``meta_values_<column number>.npy``), those of other
+        columns are written to the header. Use :meth:`load` to read it.
+
+        Parameters
+        ----------
+        path
+            Path of the directory to write into (created if it does not exist)
+
+        Raises
+        ------
+        TypeError
+            A meta column of mixed type holds values other than str, int, float, bool
+            or None (e.g. ``pd.Timestamp`` or numpy scalars)
+        """
+        meta_cols = list(self._meta.columns)
+        meta_codes = np.empty((len(meta_cols), len(self)), dtype=np.int64)
+        distinct_values = []  # type: List[Any]
+        typed_values = {}
+        for i, col in enumerate(meta_cols):
+            distinct, meta_codes[i] = self._get_meta_index(col)
+            dtype = self._meta[col].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+                has_nan = bool(self._meta[col].isnull().any())
+                # drop the nan appended by ``_factorize_meta_col`` to restore the dtype
+                typed_values[i] = np.asarray(
+                    distinct.values[:-1] if has_nan else distinct.values, dtype=dtype
+                )
+                distinct_values.append({"has_nan": has_nan})
+                continue
+
+            unsupported = {
+                type(v).__name__
+                for v in distinct
+                if v is not None and not isinstance(v, (str, bool, int, float))
+            }
+            if unsupported:
+                raise TypeError(
+                    "cannot save meta column `{}` with values of type {}".format(
+                        col, ", ".join(sorted(unsupported))
+                    )
+                )
+            distinct_values.append(distinct.tolist())
+
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "values.npy"), self._values)
+        np.save(os.path.join(path, "time.npy"), self._time_index.as_openscm())
+        np.save(os.path.join(path, "meta_codes.npy"), meta_codes)
+        for i, values in typed_values.items():
+            np.save(
+                os.path.join(path, "meta_values_{}.npy".format(i)),
+                values,
+                allow_pickle=False,
+            )
+        with open(os.path.join(path, "header.json"), "w") as fh:
+            json.dump(
+                {
+                    "version": BINARY_FORMAT_VERSION,
+                    "meta_columns": meta_cols,
+                    "meta_values": distinct_values,
+                },
+                fh,
+            )
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> ScmDataFrameBase:
+        """
+        Read timeseries data written by :meth:`save`
+
+        Parameters
+        ----------
+        path
+            Path of the directory to read from
+
+        mmap
+            If True, the values are memory-mapped rather than read so that opening is
+            instant and only the parts of the file which are accessed are read from
+            disk. Modifications are never written back to the file.
+
+        Returns
+        -------
+        :obj:`ScmDataFrameBase`
+            Loaded data
+
+        Raises
+        ------
+        ValueError
+            The data was written in an unsupported version of the format
         """
-        self.to_iamdataframe().to_csv(path, **kwargs)
+        with open(os.path.join(path, "header.json")) as fh:
+            header = json.load(fh)
+        if header["version"] != BINARY_FORMAT_VERSION:
+            raise ValueError(
+                "unsupported binary format version `{}`".format(header["version"])
+            )
+
+        meta_codes = np.load(os.path.join(path, "meta_codes.npy"))
+        meta_index = {}
+        dtypes = {}
+        for i, (col, values, codes) in enumerate(
+            zip(header["meta_columns"], header["meta_values"], meta_codes)
+        ):
+            if isinstance(values, dict):
+                typed_values = np.load(
+                    os.path.join(path, "meta_values_{}.npy".format(i)),
+                    allow_pickle=False,
+                )
+                dtypes[col] = typed_values.dtype
+                values = (
+                    np.append(np.asarray(typed_values, dtype=object), np.nan)
+                    if values["has_nan"]
+                    else typed_values
+                )
+            meta_index[col] = (pd.Series(values, name=col), codes)
+
+        ret: ScmDataFrameBase = cls.__new__(cls)
+        # copy-on-write mapping, writes stay in memory rather than going to the file
+        ret._values = np.asarray(  # pylint: disable=protected-access
+            np.load(os.path.join(path, "values.npy"), mmap_mode="c" if mmap else None)
+        )
+        ret._time_index = TimeIndex(  # pylint: disable=protected-access
+            openscm_dt=np.load(os.path.join(path, "time.npy"))
+        )
+        ret._meta = pd.DataFrame(  # pylint: disable=protected-access
+            {
+                col: pd.Series(
+                    meta_index[col][0].values[meta_index[col][1]],
+                    dtype=dtypes.get(col, None),
+                )
+                for col in meta_index
+            },
+            columns=header["meta_columns"],
+        )
+        ret._meta_index = meta_index  # pylint: disable=protected-access
+
+        return ret
 
     def line_plot(self, x: str = "time", y: str = "value", **kwargs: Any) -> Axes:
         """
@@ -1430,7 +2198,7 @@ class ScmDataFrameBase:  # pylint: disable=too-many-public-methods
 
 
 def df_append(
-    dfs: List[
+    dfs: Sequence[
         Union[ScmDataFrameBase, IamDataFrame, pd.DataFrame, pd.Series, np.ndarray, str]
     ],
     inplace: bool = False,
@@ -1443,7 +2211,9 @@ def df_append(
     with a list of ScmDataFrames, than using ``ScmDataFrame.append`` multiple times.
     If timeseries with duplicate metadata are found, the timeseries are appended and
     values falling on the same timestep are averaged. [TODO: decide whether to raise
-    a warning, which can be silenced, when this happens].
+    a warning, which can be silenced, when this happens]. Timeseries keep the order
+    in which they appear in ``dfs``, averaged timeseries take the position of their
+    first occurrence.
 
     Parameters
     ----------
@@ -1476,72 +2246,204 @@ def df_append(
     ValueError
         ``duplicate_msg`` option is not recognised
     """
+    # pylint: disable=protected-access
     scm_dfs = [
         df if isinstance(df, ScmDataFrameBase) else ScmDataFrameBase(df) for df in dfs
     ]
-    joint_dfs = [d.copy() for d in scm_dfs]
-    joint_meta = []  # type: List[str]
-    for df in joint_dfs:
-        joint_meta += df.meta.columns.tolist()
-
-    joint_meta_set = set(joint_meta)
-
-    # should probably solve this https://github.com/pandas-dev/pandas/issues/3729
-    na_fill_value = -999
-    for i, _ in enumerate(joint_dfs):
-        for col in joint_meta_set:
-            if col not in joint_dfs[i].meta:
-                joint_dfs[i].set_meta(na_fill_value, name=col)
-
-    # we want to put data into timeseries format and pass into format_ts instead of
-    # _format_data
-    data = pd.concat(
-        [d.timeseries().reorder_levels(joint_meta_set) for d in joint_dfs], sort=False
-    )
-
-    data = data.reset_index()
-    data[list(joint_meta_set)] = data[joint_meta_set].replace(
-        to_replace=np.nan, value=na_fill_value
-    )
-    data = data.set_index(list(joint_meta_set))
-    if duplicate_msg and data.index.duplicated().any():
-        if duplicate_msg == "warn":
-            warn_msg = (
-                "Duplicate time points detected, the output will be the average of "
-                "the duplicates. Set `dulicate_msg='return'` to examine the joint "
-                "timeseries (the duplicates can be found by looking at "
-                "`res[res.index.duplicated(keep=False)].sort_index()`. Set "
-                "`duplicate_msg=False` to silence this message."
-            )
-            warnings.warn(warn_msg)
-        elif duplicate_msg == "return":
-            warnings.warn("returning a `pd.DataFrame`, not an `ScmDataFrame`")
-            return data  # type: ignore  # only for special use case
-        else:
-            raise ValueError("Unrecognised value for duplicate_msg")
+    time_index, values, meta = _join_timeseries(scm_dfs)
+
+    if duplicate_msg == "return" and _factorize_meta_rows(meta)[1] < len(meta):
+        warnings.warn("returning a `pd.DataFrame`, not an `ScmDataFrame`")
+        # should probably solve this https://github.com/pandas-dev/pandas/issues/3729
+        na_fill_value = -999
+        return pd.DataFrame(  # type: ignore  # only for special use case
+            values,
+            index=pd.MultiIndex.from_frame(meta.fillna(na_fill_value)),
+            columns=time_index.as_pd_index(),
+        )
 
-    data = data.groupby(data.index.names).mean()
+    values, meta = _merge_duplicates(values, meta, duplicate_msg)
 
     if inplace:
         if not isinstance(dfs[0], ScmDataFrameBase):
             raise TypeError("Can only append inplace to an ScmDataFrameBase")
         ret = dfs[0]
+        ret._values = values
+        ret._time_index = time_index
+        ret._meta = meta
     else:
-        ret = scm_dfs[0].copy()
-
-    ret._data = data.reset_index(drop=True).T  # pylint: disable=protected-access
-    ret._data = ret._data.sort_index()  # pylint: disable=protected-access
-    ret["time"] = ret._data.index.values  # pylint: disable=protected-access
-    ret._data = ret._data.astype(float)  # pylint: disable=protected-access
+        ret = scm_dfs[0]._new_like(values, time_index, meta)
 
-    ret._meta = (  # pylint: disable=protected-access
-        data.index.to_frame()
-        .reset_index(drop=True)
-        .replace(to_replace=na_fill_value, value=np.nan)
-    )
-    ret._sort_meta_cols()  # pylint: disable=protected-access
+    ret._sort_meta_cols()
 
     if not inplace:
         return ret
 
     return None
+
+
+# pylint doesn't recognise ',' in returns type definition
+def _join_timeseries(  # pylint: disable=missing-return-doc
+    scm_dfs: Sequence[ScmDataFrameBase]
+) -> Tuple[TimeIndex, np.ndarray, pd.DataFrame]:
+    """
+    Join the timeseries of many ``ScmDataFrameBase`` onto the union of their time axes
+
+    Parameters
+    ----------
+    scm_dfs
+        Data to join
+
+    Returns
+    -------
+    :obj:`TimeIndex`, :obj:`np.ndarray`, :obj:`pd.DataFrame`
+        Union of the time axes, values (timeseries x time points, nan where a
+        timeseries has no value) and metadata (union of the meta columns, missing meta
+        is filled with nan) of all timeseries in order
+    """
+    # pylint: disable=protected-access
+    # union of the time axes, re-using the first one if they all agree
+    time_index = scm_dfs[0]._time_index
+    times = [d._time_index.as_openscm() for d in scm_dfs]
+    if any(not np.array_equal(t, times[0]) for t in times[1:]):
+        time_index = TimeIndex(openscm_dt=np.unique(np.concatenate(times)))
+    all_times = time_index.as_openscm()
+
+    meta = pd.concat([d._meta for d in scm_dfs], ignore_index=True, sort=False)
+
+    values = np.full((len(meta), len(all_times)), np.nan)
+    start = 0
+    for df, df_times in zip(scm_dfs, times):
+        rows = slice(start, start + len(df))
+        if np.array_equal(df_times, all_times):
+            values[rows] = df._values
+        else:
+            values[rows, np.searchsorted(all_times, df_times)] = df._values
+        start += len(df)
+
+    return time_index, values, meta
+
+
+# pylint doesn't recognise ',' in returns type definition
+def _merge_duplicates(  # pylint: disable=missing-return-doc
+    values: np.ndarray, meta: pd.DataFrame, duplicate_msg: Union[str, bool]
+) -> Tuple[np.ndarray, pd.DataFrame]:
+    """
+    Average timeseries with the same metadata, warning about them if requested
+
+    Parameters
+    ----------
+    values
+        Timeseries values (timeseries x time points)
+
+    meta
+        Metadata of the timeseries
+
+    duplicate_msg
+        If "warn", raise a warning if duplicate data is detected. If ``False``, do not
+        raise a warning.
+
+    Returns
+    -------
+    :obj:`np.ndarray`, :obj:`pd.DataFrame`
+        Values and metadata with one timeseries per distinct metadata
+
+    Raises
+    ------
+    ValueError
+        ``duplicate_msg`` option is not recognised
+    """
+    codes, n_groups = _factorize_meta_rows(meta)
+    if n_groups == len(meta):
+        return values, meta
+
+    if duplicate_msg == "warn":
+        warn_msg = (
+            "Duplicate time points detected, the output will be the average of "
+            "the duplicates. Set `dulicate_msg='return'` to examine the joint "
+            "timeseries (the duplicates can be found by looking at "
+            "`res[res.index.duplicated(keep=False)].sort_index()`. Set "
+            "`duplicate_msg=False` to silence this message."
+        )
+        warnings.warn(warn_msg)
+    elif duplicate_msg:
+        raise ValueError("Unrecognised value for duplicate_msg")
+
+    return _average_duplicates(values, meta, codes, n_groups)
+
+
+# pylint doesn't recognise ',' in returns type definition
+def _factorize_meta_rows(  # pylint: disable=missing-return-doc
+    meta: pd.DataFrame
+) -> Tuple[np.ndarray, int]:
+    """
+    Group timeseries whose metadata is equal in all columns (nan equal to nan)
+
+    Parameters
+    ----------
+    meta
+        Metadata of the timeseries
+
+    Returns
+    -------
+    :obj:`np.ndarray`, int
+        Group of each timeseries (groups are numbered in order of first appearance)
+        and number of groups
+    """
+    codes = np.zeros(len(meta), dtype=np.int64)
+    n_groups = min(len(meta), 1)
+    for col in meta:
+        uniques, col_codes = _factorize_meta_col(meta[col])
+        # combined codes are below len(meta) ** 2 so cannot overflow
+        codes, groups = pd.factorize(codes * len(uniques) + col_codes)
+        n_groups = len(groups)
+
+    return codes, n_groups
+
+
+# pylint doesn't recognise ',' in returns type definition
+def _average_duplicates(  # pylint: disable=missing-return-doc
+    values: np.ndarray, meta: pd.DataFrame, codes: np.ndarray, n_groups: int
+) -> Tuple[np.ndarray, pd.DataFrame]:
+    """
+    Average timeseries with the same metadata
+
+    Only the timeseries which collide with others are touched. The first timeseries
+    of each group keeps its position.
+
+    Parameters
+    ----------
+    values
+        Timeseries values (timeseries x time points)
+
+    meta
+        Metadata of the timeseries
+
+    codes
+        Group of each timeseries, groups are numbered in order of first appearance
+
+    n_groups
+        Number of groups
+
+    Returns
+    -------
+    :obj:`np.ndarray`, :obj:`pd.DataFrame`
+        Values and metadata with one timeseries per group
+    """
+    _, first, counts = np.unique(codes, return_index=True, return_counts=True)
+    collided = np.flatnonzero(counts[codes] > 1)
+    groups = codes[collided]
+    collided_values = values[collided]
+    present = ~np.isnan(collided_values)
+
+    sums = np.zeros((n_groups, values.shape[1]))
+    n_present = np.zeros((n_groups, values.shape[1]))
+    np.add.at(sums, groups, np.where(present, collided_values, 0))
+    np.add.at(n_present, groups, present)
+
+    values = values[first]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        averaged = np.unique(groups)
+        values[averaged] = sums[averaged] / n_present[averaged]
+
+    return values, meta.iloc[first].reset_index(drop=True)
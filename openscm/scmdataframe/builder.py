@@ -0,0 +1,144 @@
+"""
+Accumulation of many small ScmDataFrames, e.g. the outputs of individual model runs
+"""
+from typing import Any, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .base import ScmDataFrameBase, df_append
+from .timeindex import TimeIndex
+
+
+class ScmDataFrameBuilder:
+    """
+    Buffer which collects timeseries and builds a single ``ScmDataFrameBase`` once
+
+    Appending to an ``ScmDataFrameBase`` merges all of its data each time so that
+    building up a result from many small dataframes is quadratic in their number.
+    The builder instead copies each appended block into a value array which grows
+    geometrically (amortised O(1) per block) and only merges time axes and
+    deduplicates metadata once, in :meth:`build`.
+
+    .. code:: python
+
+        >>> builder = ScmDataFrameBuilder()
+        >>> for run_id in range(100):
+        ...     builder.append(run_model(run_id))
+        >>> res = builder.build()
+    """
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize
+
+        Parameters
+        ----------
+        capacity
+            Number of timeseries for which space is reserved initially
+        """
+        self._initial_capacity = capacity
+        self._segments = []  # type: List[ScmDataFrameBase]
+        self._template = None  # type: Optional[ScmDataFrameBase]
+        self._time_index = None  # type: Optional[TimeIndex]
+        self._values = np.empty((0, 0))
+        self._n_timeseries = 0
+        self._metas = []  # type: List[pd.DataFrame]
+
+    def __len__(self) -> int:
+        """
+        Get the number of timeseries appended so far (including duplicates)
+        """
+        return sum(len(s) for s in self._segments) + self._n_timeseries
+
+    def append(
+        self,
+        other: Union[ScmDataFrameBase, pd.DataFrame, pd.Series, np.ndarray, str],
+        **kwargs: Any
+    ) -> None:
+        """
+        Append timeseries
+
+        The data is copied so ``other`` can be modified or discarded afterwards.
+
+        Parameters
+        ----------
+        other
+            Data to append. If not an ``ScmDataFrameBase``, it is cast to
+            ``ScmDataFrameBase`` first.
+
+        **kwargs
+            Passed to the ``ScmDataFrameBase`` constructor if ``other`` is cast
+        """
+        # pylint: disable=protected-access
+        if not isinstance(other, ScmDataFrameBase):
+            other = ScmDataFrameBase(other, **kwargs)
+
+        if self._time_index is None or not np.array_equal(
+            other._time_index.as_openscm(), self._time_index.as_openscm()
+        ):
+            self._flush()
+            self._template = other
+            self._time_index = other._time_index
+            self._values = np.empty((self._initial_capacity, len(other._time_index)))
+
+        end = self._n_timeseries + len(other)
+        if end > len(self._values):
+            self._values.resize(
+                (max(end, 2 * len(self._values)), len(self._time_index)), refcheck=False
+            )
+        self._values[self._n_timeseries : end] = other._values
+        self._metas.append(other._meta.copy())
+        self._n_timeseries = end
+
+    def _flush(self) -> None:
+        """
+        Turn the buffered timeseries into a segment with a single time axis
+        """
+        template, time_index = self._template, self._time_index
+        if not self._n_timeseries or template is None or time_index is None:
+            return
+
+        self._values.resize((self._n_timeseries, len(time_index)), refcheck=False)
+        self._segments.append(
+            template._new_like(  # pylint: disable=protected-access
+                self._values,
+                time_index,
+                pd.concat(self._metas, ignore_index=True, sort=False),
+            )
+        )
+        self._template = None
+        self._time_index = None
+        self._values = np.empty((0, 0))
+        self._n_timeseries = 0
+        self._metas = []
+
+    def build(self, duplicate_msg: Union[str, bool] = "warn") -> ScmDataFrameBase:
+        """
+        Build a dataframe from all timeseries appended so far
+
+        The builder is left empty so it can be re-used.
+
+        Parameters
+        ----------
+        duplicate_msg
+            How to handle timeseries with duplicate metadata, see ``df_append``
+
+        Returns
+        -------
+        :obj:`ScmDataFrameBase`
+            Built dataframe, of the same class as the first appended data (or a
+            ``pd.DataFrame`` if ``duplicate_msg == "return"`` and duplicates are
+            found)
+
+        Raises
+        ------
+        ValueError
+            Nothing has been appended
+        """
+        self._flush()
+        if not self._segments:
+            raise ValueError("no timeseries appended")
+
+        segments, self._segments = self._segments, []
+        return df_append(segments, duplicate_msg=duplicate_msg)  # type: ignore
@@ -2,18 +2,34 @@
 OpenSCM's time index, used for ``ScmDataFrameBase``, and helper functions.
 """
 import datetime
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from dateutil import parser
 
-from openscm.utils import (
-    convert_datetime_to_openscm_time,
-    convert_openscm_time_to_datetime,
-    is_floatlike,
+from openscm.utils import OPENSCM_REFERENCE_TIME, is_floatlike
+
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+_REFERENCE_TIME_US = (
+    OPENSCM_REFERENCE_TIME - datetime.datetime(1970, 1, 1)
+) // _ONE_MICROSECOND
+"""int: ``OPENSCM_REFERENCE_TIME`` in microseconds since 1970-01-01"""
+
+_REFERENCE_DAYS, _REFERENCE_SECONDS = divmod(
+    _REFERENCE_TIME_US // 10 ** 6, _SECONDS_PER_DAY
 )
 
+_MIN_OPENSCM_TIME = (
+    datetime.datetime.min - OPENSCM_REFERENCE_TIME
+) // datetime.timedelta(seconds=1)
+_MAX_OPENSCM_TIME = (
+    datetime.datetime.max - OPENSCM_REFERENCE_TIME
+) // datetime.timedelta(seconds=1)
+
 
 def to_int(x: np.ndarray) -> np.ndarray:
     """
@@ -43,6 +59,9 @@ def to_int(x: np.ndarray) -> np.ndarray:
             "For our own sanity, this method only works with np.ndarray input. "
             "x is type: {}".format(type(x))
         )
+    if x.dtype.kind in "iu":
+        return x.astype(np.int64)
+
     cols = np.array([int(v) for v in x])
     invalid_vals = x[cols != x]
     if invalid_vals.size:
@@ -130,30 +149,301 @@ def _format_datetime(dts: List[Any]) -> List[datetime.datetime]:
     return dts
 
 
+def _trunc_divide(x: np.ndarray, divisor: int) -> np.ndarray:
+    """
+    Integer division rounding towards zero (like ``int(x / divisor)``)
+
+    Parameters
+    ----------
+    x
+        Dividends
+
+    divisor
+        Positive divisor
+
+    Returns
+    -------
+    :obj:`np.array` of :obj:`int`
+        Quotients rounded towards zero
+    """
+    return np.sign(x) * (np.abs(x) // divisor)
+
+
+def _datetimes_to_microseconds(dts: List[datetime.datetime]) -> np.ndarray:
+    """
+    Convert ``datetime.datetime``'s to microseconds since ``OPENSCM_REFERENCE_TIME``
+
+    Parameters
+    ----------
+    dts
+        Values to convert
+
+    Returns
+    -------
+    :obj:`np.array` of :obj:`int`
+        Microseconds since ``OPENSCM_REFERENCE_TIME`` of each value
+    """
+    # much faster than numpy's conversion of objects to ``np.datetime64``
+    return np.array(
+        [(dt - OPENSCM_REFERENCE_TIME) // _ONE_MICROSECOND for dt in dts],
+        dtype=np.int64,
+    )
+
+
+def datetimes_to_openscm(dts: List[datetime.datetime]) -> np.ndarray:
+    """
+    Convert ``datetime.datetime``'s to OpenSCM times
+
+    Vectorised equivalent of :func:`openscm.utils.convert_datetime_to_openscm_time`.
+
+    Parameters
+    ----------
+    dts
+        Values to convert
+
+    Returns
+    -------
+    :obj:`np.array` of :obj:`int`
+        OpenSCM time of each value
+    """
+    return _trunc_divide(_datetimes_to_microseconds(dts), 10 ** 6)
+
+
+def _as_array(values: Any) -> np.ndarray:
+    """
+    Convert input to a ``np.ndarray``
+
+    Sequences of ``datetime.datetime``'s are put into an object array directly as
+    ``np.asarray`` is very slow at inferring their type.
+
+    Parameters
+    ----------
+    values
+        Input to convert
+
+    Returns
+    -------
+    :obj:`np.ndarray`
+        Input as array
+    """
+    if (
+        isinstance(values, (list, tuple))
+        and values
+        and isinstance(values[0], datetime.datetime)
+    ):
+        res = np.empty(len(values), dtype=object)
+        res[:] = values
+        return res
+
+    return np.asarray(values)
+
+
+def _days_from_civil(
+    year: np.ndarray, month: np.ndarray, day: np.ndarray
+) -> np.ndarray:
+    """
+    Convert proleptic Gregorian dates to days since 1970-01-01
+
+    Inverse of :func:`_civil_from_days` (Howard Hinnant's ``days_from_civil``
+    algorithm).
+
+    Parameters
+    ----------
+    year
+        Year of each date
+
+    month
+        Month of each date
+
+    day
+        Day of each date
+
+    Returns
+    -------
+    :obj:`np.array` of :obj:`int`
+        Days since 1970-01-01
+    """
+    year = year - (month <= 2)
+    era = year // 400
+    yoe = year - era * 400  # year of era [0, 399]
+    doy = (153 * np.where(month > 2, month - 3, month + 9) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy  # day of era [0, 146096]
+
+    return era * 146097 + doe - 719468
+
+
+def _is_number(value: Any) -> bool:
+    """
+    Check if a value is an int or float (but not a bool)
+
+    Parameters
+    ----------
+    value
+        Value to check
+
+    Returns
+    -------
+    bool
+        True if ``value`` is an int or float
+    """
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(
+        value, bool
+    )
+
+
+def _years_to_microseconds(years: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Convert integer or fractional years to microseconds since
+    ``OPENSCM_REFERENCE_TIME``
+
+    Vectorised equivalent of converting the years to ``datetime.datetime`` with
+    :func:`_format_datetime` and then to OpenSCM times. Fractional years are
+    converted using the length of the respective year (i.e. 2000.5 is half-way
+    through the leap year 2000).
+
+    Parameters
+    ----------
+    years
+        Years to convert
+
+    Returns
+    -------
+    Optional[:obj:`np.array` of :obj:`int`]
+        Microseconds since ``OPENSCM_REFERENCE_TIME`` or ``None`` if ``years`` are
+        not all (valid) numbers, in which case :func:`_format_datetime` has to be
+        used
+    """
+    kind = years.dtype.kind
+    if kind == "O" and years.size and all(_is_number(v) for v in years):
+        is_int = isinstance(years[0], (int, np.int64))
+        years = years.astype(float)
+    elif kind in "iuf" and years.size:
+        is_int = kind != "f"
+    else:
+        return None
+
+    # leave nan and years datetime.datetime cannot represent to _format_datetime
+    if not (
+        np.isfinite(years).all()
+        and years.min() >= datetime.MINYEAR
+        and years.max() < datetime.MAXYEAR
+    ):
+        return None
+
+    year = np.trunc(years).astype(np.int64)
+
+    reference_seconds = _REFERENCE_TIME_US // 10 ** 6
+    ones = np.ones_like(year)
+    start = _days_from_civil(year, ones, ones) * _SECONDS_PER_DAY - reference_seconds
+    if is_int:
+        if (year != years).any():
+            return None  # let _format_datetime raise the error
+
+        return start * 10 ** 6
+
+    # mimic ``datetime.timedelta(seconds=...)``, which rounds to microseconds
+    year_length = _SECONDS_PER_DAY * (
+        _days_from_civil(year + 1, ones, ones) - _days_from_civil(year, ones, ones)
+    )
+    offset = year_length.astype(float) * (years - year)
+    offset_seconds = np.trunc(offset)
+    offset_microseconds = np.round((offset - offset_seconds) * 10 ** 6)
+
+    return (
+        start + offset_seconds.astype(np.int64)
+    ) * 10 ** 6 + offset_microseconds.astype(np.int64)
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    """
+    Make an array read-only
+
+    Arrays held by a :class:`TimeIndex` are returned without copying and shared
+    between dataframes so they must not be modified.
+
+    Parameters
+    ----------
+    values
+        Array to make read-only
+
+    Returns
+    -------
+    :obj:`np.ndarray`
+        ``values`` (no copy)
+    """
+    values.flags.writeable = False
+    return values
+
+
+# pylint doesn't recognise ',' in returns type definition
+def _civil_from_days(  # pylint: disable=missing-return-doc
+    days: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert days since 1970-01-01 to proleptic Gregorian dates
+
+    Uses Howard Hinnant's ``civil_from_days`` algorithm, which is valid for any date
+    representable with the input integers (so also outside of the range supported by
+    ``datetime.datetime`` or pandas).
+
+    Parameters
+    ----------
+    days
+        Days since 1970-01-01
+
+    Returns
+    -------
+    :obj:`np.array` of :obj:`int`, :obj:`np.array` of :obj:`int`, :obj:`np.array` of :obj:`int`
+        Year, month and day of each date
+    """
+    z = days + 719468  # days since 0000-03-01
+    era = z // 146097
+    doe = z - era * 146097  # day of era [0, 146096]
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365  # [0, 399]
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)  # day of year from March [0, 365]
+    mp = (5 * doy + 2) // 153  # month from March [0, 11]
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+
+    return year, month, day
+
+
 class TimeIndex:
     """
     Keeps track of both datetime and openscm datetimes and knows how to convert between the two formats
+
+    Time points are stored as OpenSCM times (int64 seconds since
+    ``OPENSCM_REFERENCE_TIME``). Python datetimes and calendar fields are only
+    calculated when requested and then cached.
     """
 
+    _openscm: np.ndarray
+    """Time points as OpenSCM times"""
+
+    _cache: Dict[str, Any]
+    """Cache of derived representations of the time points"""
+
     def __init__(self, py_dt=None, openscm_dt=None):
         if not (py_dt is not None or openscm_dt is not None):
             raise AssertionError("One of `py_dt` or `openscm_dt` must be supplied")
 
+        object.__setattr__(self, "_cache", {})
         if py_dt is not None:
-            py_dt = _format_datetime(np.asarray(py_dt))
-            object.__setattr__(self, "_py", np.asarray(py_dt))
-            object.__setattr__(
-                self,
-                "_openscm",
-                np.asarray([convert_datetime_to_openscm_time(dt) for dt in py_dt]),
-            )
+            py_dt = _as_array(py_dt)
+            microseconds = _years_to_microseconds(py_dt)
+            if microseconds is None:
+                py_dt = _format_datetime(py_dt)
+                microseconds = _datetimes_to_microseconds(py_dt)
+                # keep the original datetimes as they may have sub-second resolution
+                self._cache["py"] = np.empty(len(py_dt), dtype=object)
+                self._cache["py"][:] = py_dt
+                _read_only(self._cache["py"])
+            self._cache["microseconds"] = _read_only(microseconds)
+            openscm = _trunc_divide(microseconds, 10 ** 6)
         else:
-            object.__setattr__(
-                self,
-                "_py",
-                np.asarray([convert_openscm_time_to_datetime(dt) for dt in openscm_dt]),
-            )
-            object.__setattr__(self, "_openscm", np.asarray(openscm_dt))
+            openscm = np.array(openscm_dt, dtype=np.int64)
+        object.__setattr__(self, "_openscm", _read_only(openscm))
 
     def __setattr__(self, key: str, value: Any) -> None:
         """
@@ -174,6 +464,128 @@ class TimeIndex:
         """
         raise AttributeError("TimeIndex is immutable")
 
+    def __getitem__(self, key: Any) -> "TimeIndex":
+        """
+        Get a subset of the time points without converting them again
+
+        Parameters
+        ----------
+        key
+            Slice, integer indices or boolean mask of the time points to select
+
+        Returns
+        -------
+        :obj:`TimeIndex`
+            Selected time points
+        """
+        res: TimeIndex = object.__new__(TimeIndex)
+        object.__setattr__(res, "_openscm", _read_only(self._openscm[key]))
+        object.__setattr__(
+            res,
+            "_cache",
+            {
+                k: _read_only(v[key])
+                for k, v in self._cache.items()
+                if isinstance(v, np.ndarray)  # pd.Index is not carried over
+            },
+        )
+        return res
+
+    def __len__(self) -> int:
+        """
+        Get the number of time points
+        """
+        return len(self._openscm)
+
+    def _get_cached(self, key: str, func: Any) -> Any:
+        """
+        Get a cached value, calculating and caching it if not available yet
+
+        Parameters
+        ----------
+        key
+            Cache key
+
+        func
+            Function which calculates the value
+
+        Returns
+        -------
+        Any
+            (Cached) value
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            res = self._cache[key] = func()
+            return res
+
+    def _calc_calendar_fields(self) -> None:
+        """
+        Calculate and cache the calendar fields of the time points
+        """
+        microseconds = self._cache.get("microseconds", None)
+        # OpenSCM times are truncated towards zero, calendar fields have to be based on
+        # the floored (exact) times to match the datetimes before 1970
+        days, seconds = divmod(
+            self._openscm if microseconds is None else microseconds // 10 ** 6,
+            _SECONDS_PER_DAY,
+        )
+        days += _REFERENCE_DAYS + (seconds + _REFERENCE_SECONDS) // _SECONDS_PER_DAY
+        seconds = (seconds + _REFERENCE_SECONDS) % _SECONDS_PER_DAY
+
+        year, month, day = _civil_from_days(days)
+        self._cache["years"] = _read_only(year)
+        self._cache["months"] = _read_only(month)
+        self._cache["days"] = _read_only(day)
+        self._cache["hours"] = _read_only(seconds // 3600)
+        # 1970-01-01 was a Thursday
+        self._cache["weekdays"] = _read_only((days + 3) % 7)
+
+    def _get_calendar_field(self, field: str) -> np.ndarray:
+        """
+        Get a (cached) calendar field of the time points
+
+        Parameters
+        ----------
+        field
+            Field to get
+
+        Returns
+        -------
+        :obj:`np.array` of :obj:`int`
+            Field of each time point
+        """
+        if field not in self._cache:
+            self._calc_calendar_fields()
+
+        return self._cache[field]
+
+    def _calc_py(self) -> np.ndarray:
+        """
+        Calculate the Python datetimes of the time points
+
+        Returns
+        -------
+        :obj:`np.array` of :obj:`datetime.datetime`
+            Datetime representation of each time point
+
+        Raises
+        ------
+        OverflowError
+            Time points cannot be represented by ``datetime.datetime``
+        """
+        if self._openscm.size and (
+            self._openscm.min() < _MIN_OPENSCM_TIME
+            or self._openscm.max() > _MAX_OPENSCM_TIME
+        ):
+            raise OverflowError("date value out of range")
+
+        microseconds = self._cache.get("microseconds", self._openscm * 10 ** 6)
+        return _read_only(
+            (microseconds + _REFERENCE_TIME_US).astype("datetime64[us]").astype(object)
+        )
+
     def as_openscm(self) -> np.ndarray:
         """
         Get time points as OpenSCM times
@@ -186,8 +598,7 @@ class TimeIndex:
         :obj:`np.array` of :obj:`int`
             Datetime representation of each time point
         """
-        # mypy and pylint aren't smart enough to work out ``._py`` attribute exists
-        return self._openscm  # type: ignore # pylint: disable=no-member
+        return self._openscm
 
     def as_py(self) -> np.ndarray:
         """
@@ -198,8 +609,7 @@ class TimeIndex:
         :obj:`np.array` of :obj:`datetime.datetime`
             Datetime representation of each time point
         """
-        # mypy and pylint aren't smart enough to work out ``._py`` attribute exists
-        return self._py  # type: ignore # pylint: disable=no-member
+        return self._get_cached("py", self._calc_py)
 
     def as_pd_index(self) -> pd.Index:
         """
@@ -210,7 +620,9 @@ class TimeIndex:
         :obj:`pd.Index`
             pd.Index of dtype "object" with name "time" made from the time points
         """
-        return pd.Index(self.as_py(), dtype="object", name="time")
+        return self._get_cached(
+            "pd_index", lambda: pd.Index(self.as_py(), dtype="object", name="time")
+        )
 
     def years(self) -> np.ndarray:
         """
@@ -221,7 +633,7 @@ class TimeIndex:
         :obj:`np.array` of :obj:`int`
             Year of each time point
         """
-        return np.array([dt.year for dt in self.as_py()])
+        return self._get_calendar_field("years")
 
     def months(self) -> np.ndarray:
         """
@@ -232,7 +644,7 @@ class TimeIndex:
         :obj:`np.array` of :obj:`int`
             Month of each time point
         """
-        return np.array([dt.month for dt in self.as_py()])
+        return self._get_calendar_field("months")
 
     def days(self) -> np.ndarray:
         """
@@ -243,7 +655,7 @@ class TimeIndex:
         :obj:`np.array` of :obj:`int`
             Day of each time point
         """
-        return np.array([dt.day for dt in self.as_py()])
+        return self._get_calendar_field("days")
 
     def hours(self) -> np.ndarray:
         """
@@ -254,7 +666,7 @@ class TimeIndex:
         :obj:`np.array` of :obj:`int`
             Hour of each time point
         """
-        return np.array([dt.hour for dt in self.as_py()])
+        return self._get_calendar_field("hours")
 
     def weekdays(self) -> np.ndarray:
         """
@@ -265,4 +677,4 @@ class TimeIndex:
         :obj:`np.array` of :obj:`int`
             Day of the week of each time point
         """
-        return np.array([dt.weekday() for dt in self.as_py()])
+        return self._get_calendar_field("weekdays")
@@ -8,14 +8,16 @@ this module. A thorough explaination of the procedure used is given in a dedicat
 <https://github.com/openclimatedata/openscm/blob/master/notebooks/timeseries.ipynb>`_.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
 from enum import Enum
-from typing import Any, Callable, Dict
+from typing import Optional, Tuple
 
 import numpy as np
-import scipy.integrate as integrate
-import scipy.interpolate as interpolate
+import scipy.sparse as sparse
 
-from .errors import InsufficientDataError
+from .errors import InsufficientDataError, TimeseriesPointsValuesMismatchError
 from .parameters import ParameterType
 
 # pylint: disable=too-many-arguments
@@ -72,41 +74,6 @@ def create_time_points(
     return np.linspace(start_time, end_time_output, points_num_output)
 
 
-def _calc_interval_averages(
-    continuous_representation: Callable[[float], float], target_intervals: np.ndarray
-) -> np.ndarray:
-    """
-    Calculate the interval averages of a continuous function.
-
-    Here interval average is calculated as the integral over the period divided by
-    the period length.
-
-    Parameters
-    ----------
-    continuous_representation
-        Continuous function from which to calculate the interval averages. Should be
-        calculated using
-        :func:`openscm.timeseries_converter.TimeseriesConverter._calc_continuous_representation`.
-    target_intervals
-        Intervals to calculate the average of.
-
-    Returns
-    -------
-    np.ndarray
-        Array of the interval/period averages
-    """
-    # TODO: numerical integration here could be very expensive
-    # TODO: update to include caching and/or analytic solutions depending on
-    # TODO:     interpolation choice
-    int_averages = [np.nan] * len(target_intervals[:-1])
-    for i, l in enumerate(target_intervals[:-1]):
-        u = target_intervals[i + 1]
-        y, _ = integrate.quad(continuous_representation, l, u)
-        int_averages[i] = y / (u - l)
-
-    return np.array(int_averages)
-
-
 def _calc_integral_preserving_linear_interpolation(values: np.ndarray) -> np.ndarray:
     """
     Calculate the "linearization" values of the array ``values`` which is assumed to
@@ -117,37 +84,223 @@ def _calc_integral_preserving_linear_interpolation(values: np.ndarray) -> np.nda
     Parameters
     ----------
     values
-        Timeseries values of period averages
+        Timeseries values of period averages (along the last axis)
 
     Returns
     -------
     np.ndarray
-        Values of linearization (of length ``2 * len(values) + 1``)
+        Values of linearization (of length ``2 * values.shape[-1] + 1`` along the last
+        axis)
     """
-    edge_point_values = (values[1:] + values[:-1]) / 2
+    edge_point_values = (values[..., 1:] + values[..., :-1]) / 2
     middle_point_values = (
-        4 * values[1:-1] - edge_point_values[:-1] - edge_point_values[1:]
+        4 * values[..., 1:-1] - edge_point_values[..., :-1] - edge_point_values[..., 1:]
     ) / 2
     # values = (
     #   1 / 2 * (edges_lower + middle_point_values) * 1 /2
     #   + 1 / 2 * (middle_point_values + edges_upper)
     # ) / 2
     first_edge_point_value = (
-        2 * values[0] - edge_point_values[0]
+        2 * values[..., :1] - edge_point_values[..., :1]
     )  # values[0] = (first_edge_point_value + edge_point_values[0]) / 2
     last_edge_point_value = (
-        2 * values[-1] - edge_point_values[-1]
+        2 * values[..., -1:] - edge_point_values[..., -1:]
     )  # values[-1] = (last_edge_point_value + edge_point_values[-1]) / 2
     return np.concatenate(
         (
-            np.array(
+            np.stack(
                 [
-                    np.concatenate(([first_edge_point_value], edge_point_values)),
-                    np.concatenate(([values[0]], middle_point_values, [values[-1]])),
-                ]
-            ).T.reshape(2 * len(values)),
-            [last_edge_point_value],
+                    np.concatenate(
+                        (first_edge_point_value, edge_point_values), axis=-1
+                    ),
+                    np.concatenate(
+                        (values[..., :1], middle_point_values, values[..., -1:]),
+                        axis=-1,
+                    ),
+                ],
+                axis=-1,
+            ).reshape(values.shape[:-1] + (2 * values.shape[-1],)),
+            last_edge_point_value,
+        ),
+        axis=-1,
+    )
+
+
+def _calc_linearization_points(time_points: np.ndarray) -> np.ndarray:
+    """
+    Calculate the time points of the "linearization" of an average timeseries (see
+    :func:`openscm.timeseries_converter._calc_integral_preserving_linear_interpolation`),
+    i.e. the period edges ``time_points`` interleaved with the period middles.
+
+    Parameters
+    ----------
+    time_points
+        Time points of the timeseries (period edges)
+
+    Returns
+    -------
+    np.ndarray
+        Time points of linearization (of length ``2 * len(time_points) - 1``)
+    """
+    return (
+        np.concatenate(
+            (
+                # [time_points[0] - (time_points[1] - time_points[0]) / 2],
+                time_points,
+                (time_points[1:] + time_points[:-1]) / 2,
+                [0],
+            )
         )
+        .reshape((2, len(time_points)))
+        .T.flatten()[:-1]
+    )
+
+
+def _calc_linear_interpolation_operator(
+    source_time_points: np.ndarray,
+    target_time_points: np.ndarray,
+    extrapolation_type: ExtrapolationType,
+) -> sparse.csr_matrix:
+    """
+    Calculate the sparse operator linearly interpolating a point timeseries.
+
+    Each target point only depends on the two source points enclosing it (or the
+    outermost two if extrapolated).
+
+    Parameters
+    ----------
+    source_time_points
+        Source timeseries time points (must be strictly increasing)
+    target_time_points
+        Target timeseries time points
+    extrapolation_type
+        Extrapolation type used outside of ``source_time_points``
+
+    Returns
+    -------
+    sparse.csr_matrix
+        Operator of shape (target length, source length)
+    """
+    x = source_time_points
+    t = target_time_points
+    idx = np.clip(np.searchsorted(x, t, side="right") - 1, 0, len(x) - 2)
+    weights = (t - x[idx]) / (x[idx + 1] - x[idx])
+    if extrapolation_type == ExtrapolationType.CONSTANT:
+        weights = np.clip(weights, 0, 1)
+
+    rows = np.arange(len(t))
+    return sparse.csr_matrix(
+        (
+            np.concatenate((1 - weights, weights)),
+            (np.concatenate((rows, rows)), np.concatenate((idx, idx + 1))),
+        ),
+        shape=(len(t), len(x)),
+    )
+
+
+def _calc_linear_interval_integral_operator(
+    linearization_points: np.ndarray,
+    target_intervals: np.ndarray,
+    extrapolation_type: ExtrapolationType,
+) -> sparse.csr_matrix:
+    """
+    Calculate the sparse operator integrating a piecewise linear function over
+    intervals.
+
+    Only the linear segments overlapping a target interval contribute to its row, so
+    the operator has about as many entries as there are segments and intervals
+    together. Outside of ``linearization_points`` the outermost segments are extended if
+    ``extrapolation_type`` is ``ExtrapolationType.LINEAR``, otherwise nothing is
+    integrated there.
+
+    Parameters
+    ----------
+    linearization_points
+        Time points of the piecewise linear function (must be strictly increasing)
+    target_intervals
+        Intervals to integrate over
+    extrapolation_type
+        Extrapolation type used outside of ``linearization_points``
+
+    Returns
+    -------
+    sparse.csr_matrix
+        Operator of shape (number of intervals, number of linearization points)
+    """
+    x = linearization_points
+    lower = target_intervals[:-1]
+    upper = target_intervals[1:]
+
+    # all segments overlapping each interval, flattened interval by interval
+    first = np.clip(np.searchsorted(x, lower, side="right") - 1, 0, len(x) - 2)
+    last = np.clip(np.searchsorted(x, upper, side="left") - 1, 0, len(x) - 2)
+    counts = np.maximum(last - first + 1, 1)
+    rows = np.repeat(np.arange(len(lower)), counts)
+    segments = np.arange(counts.sum()) + np.repeat(
+        first - np.cumsum(counts) + counts, counts
+    )
+
+    segment_lower = x[segments]
+    segment_upper = x[segments + 1]
+    if extrapolation_type == ExtrapolationType.LINEAR:
+        segment_lower = np.where(segments > 0, segment_lower, -np.inf)
+        segment_upper = np.where(segments == len(x) - 2, np.inf, segment_upper)
+    start = np.maximum(lower[rows], segment_lower)
+    end = np.minimum(upper[rows], segment_upper)
+    lengths = np.maximum(end - start, 0)
+
+    # the integral of a linear function is the length times its value at the middle
+    middle_weights = ((start + end) / 2 - x[segments]) / (x[segments + 1] - x[segments])
+    res = sparse.csr_matrix(
+        (
+            np.concatenate((lengths * (1 - middle_weights), lengths * middle_weights)),
+            (np.concatenate((rows, rows)), np.concatenate((segments, segments + 1))),
+        ),
+        shape=(len(lower), len(x)),
+    )
+    res.eliminate_zeros()
+    return res
+
+
+def _calc_integral_preserving_linear_interpolation_operator(
+    length: int
+) -> sparse.csr_matrix:
+    """
+    Calculate the sparse operator of
+    :func:`openscm.timeseries_converter._calc_integral_preserving_linear_interpolation`.
+
+    Parameters
+    ----------
+    length
+        Length of the timeseries of period averages (at least 2)
+
+    Returns
+    -------
+    sparse.csr_matrix
+        Operator of shape (``2 * length + 1``, ``length``)
+    """
+    i = np.arange(1, length)
+    inner = np.arange(1, length - 1)
+    rows, cols, weights = zip(
+        # first and last edge
+        ([0, 0], [0, 1], [1.5, -0.5]),
+        ([2 * length] * 2, [length - 1, length - 2], [1.5, -0.5]),
+        # inner edges are the mean of the adjacent periods
+        (2 * i, i - 1, np.full(len(i), 0.5)),
+        (2 * i, i, np.full(len(i), 0.5)),
+        # middles of the first and last period
+        ([1, 2 * length - 1], [0, length - 1], [1.0, 1.0]),
+        # middles of the inner periods
+        (2 * inner + 1, inner - 1, np.full(len(inner), -0.25)),
+        (2 * inner + 1, inner, np.full(len(inner), 1.5)),
+        (2 * inner + 1, inner + 1, np.full(len(inner), -0.25)),
+    )
+    return sparse.csr_matrix(
+        (
+            np.concatenate(weights),
+            (np.concatenate(rows).astype(int), np.concatenate(cols).astype(int)),
+        ),
+        shape=(2 * length + 1, length),
     )
 
 
@@ -155,6 +308,11 @@ class TimeseriesConverter:
     """
     Converts timeseries and their points between two timeseriess (each defined by a time
     of the first point and a period length).
+
+    As all supported conversions are linear in the timeseries values, each conversion
+    direction is represented by a sparse weight matrix (target length x source length),
+    which is calculated on first use. Subsequent conversions then only need a sparse
+    matrix-vector product.
     """
 
     _source: np.ndarray
@@ -172,6 +330,12 @@ class TimeseriesConverter:
     _extrapolation_type: ExtrapolationType
     """Extrapolation type"""
 
+    _convert_from_operator: Optional[sparse.csr_matrix]
+    """Conversion operator from source to target time points (created on first use)"""
+
+    _convert_to_operator: Optional[sparse.csr_matrix]
+    """Conversion operator from target to source time points (created on first use)"""
+
     def __init__(
         self,
         source_time_points: np.ndarray,
@@ -206,107 +370,26 @@ class TimeseriesConverter:
         self._timeseries_type = timeseries_type
         self._interpolation_type = interpolation_type
         self._extrapolation_type = extrapolation_type
+        self._convert_from_operator = None
+        self._convert_to_operator = None
 
         if (
             source_time_points[0] > target_time_points[1]
         ):  # TODO Consider extrapolation type
             raise InsufficientDataError
 
-    def _calc_continuous_representation(
-        # TODO remove when NotImplementedError removed:
-        # pylint: disable=missing-raises-doc
-        self,
-        time_points: np.ndarray,
-        values: np.ndarray,
-    ) -> Callable[[float], float]:
+    def _calc_operator(
+        self, source_time_points: np.ndarray, target_time_points: np.ndarray
+    ) -> sparse.csr_matrix:
         """
-        Calculate a "continuous" representation of a timeseries (see
-        :func:`openscm.timeseries_converter._calc_integral_preserving_linear_interpolation`)
-        with the time points ``time_points`` and values ``values``.
+        Calculate the sparse linear operator converting timeseries data for timeseries
+        time points ``source_time_points`` to the time points ``target_time_points``.
 
-        Parameters
-        ----------
-        time_points
-            Time points of the timeseries
-        values
-            Values of the timeseries
-
-        Returns
-        -------
-        Callable[[float], float]
-            Function that represents the interpolated timeseries. It takes a single
-            argument, time ("x-value"), and returns a single float, the value of the
-            interpolated timeseries at that point in time ("y-value").
-        """
-        if (self._timeseries_type == ParameterType.AVERAGE_TIMESERIES) and (
-            self._interpolation_type == InterpolationType.LINEAR
-        ):
-            # our custom implementation of a mean preserving linear interpolation
-            linearization_points = (
-                np.concatenate(
-                    (
-                        # [time_points[0] - (time_points[1] - time_points[0]) / 2],
-                        time_points,
-                        (time_points[1:] + time_points[:-1]) / 2,
-                        [0],
-                    )
-                )
-                .reshape((2, len(time_points)))
-                .T.flatten()[:-1]
-            )
-            linearization_values = _calc_integral_preserving_linear_interpolation(
-                values
-            )
-            res_average = interpolate.interp1d(
-                linearization_points,
-                linearization_values,
-                kind=self._get_scipy_interpolation_arg(),
-                **self._get_scipy_extrapolation_args(values),
-            )  # type: Callable[[float], float]
-            return res_average
-
-        if self._timeseries_type == ParameterType.POINT_TIMESERIES:
-            res_point = interpolate.interp1d(
-                time_points,
-                values,
-                kind=self._get_scipy_interpolation_arg(),
-                **self._get_scipy_extrapolation_args(values),
-            )  # type: Callable[[float], float]
-            return res_point
-
-        raise NotImplementedError
-
-    def _get_scipy_extrapolation_args(self, values: np.ndarray) -> Dict[str, Any]:
-        if self._extrapolation_type == ExtrapolationType.LINEAR:
-            return {"fill_value": "extrapolate"}
-        if self._extrapolation_type == ExtrapolationType.CONSTANT:
-            return {"fill_value": (values[0], values[-1]), "bounds_error": False}
-        # TODO: add cubic support
-        return {}
-
-    def _get_scipy_interpolation_arg(self) -> str:
-        if self._interpolation_type == InterpolationType.LINEAR:
-            return "linear"
-        # TODO: add cubic support
-        raise NotImplementedError
-
-    def _convert(
-        self,
-        values: np.ndarray,
-        source_time_points: np.ndarray,
-        target_time_points: np.ndarray,
-    ) -> np.ndarray:
-        """
-        Wrap ``self._convert_unsafe`` to provide proper error handling.
-
-        ``self._convert_unsafe`` converts time period average timeseries data
-        ``values`` for timeseries time points ``source_time_points`` to the time
-        points ``target_time_points``.
+        The weights are derived directly from the time points, so that building the
+        operator takes time and memory linear in the lengths of the timeseries.
 
         Parameters
         ----------
-        values
-            Array of data to convert
         source_time_points
             Source timeseries time points
         target_time_points
@@ -321,63 +404,103 @@ class TimeseriesConverter:
             Target time points are outside the source time points and
             ``self._extrapolation_type`` is ``ExtrapolationType.None``
 
+        NotImplementedError
+            The timeseries or interpolation type is not recognised
+
         Returns
         -------
-        np.ndarray
-            Converted time period average data for timeseries ``target``
+        sparse.csr_matrix
+            Conversion operator of shape (target length, source length)
         """
-        if len(values) < 3:
+        source_length = len(source_time_points) - (
+            1 if self._timeseries_type == ParameterType.AVERAGE_TIMESERIES else 0
+        )
+        if source_length < 3:
             raise InsufficientDataError
 
-        try:
-            return self._convert_unsafe(values, source_time_points, target_time_points)
-        except ValueError:
+        if self._extrapolation_type == ExtrapolationType.NONE and (
+            np.min(target_time_points) < source_time_points[0]
+            or np.max(target_time_points) > source_time_points[-1]
+        ):
             error_msg = (
                 "Target time points are outside the source time points, use an "
                 "extrapolation type other than None"
             )
             raise InsufficientDataError(error_msg)
 
-    def _convert_unsafe(
-        self,
-        values: np.ndarray,
-        source_time_points: np.ndarray,
-        target_time_points: np.ndarray,
-    ) -> np.ndarray:
+        if self._interpolation_type != InterpolationType.LINEAR:
+            raise NotImplementedError
+
+        if self._timeseries_type == ParameterType.POINT_TIMESERIES:
+            return _calc_linear_interpolation_operator(
+                source_time_points, target_time_points, self._extrapolation_type
+            )
+
+        if self._timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+            integrals = _calc_linear_interval_integral_operator(
+                _calc_linearization_points(source_time_points),
+                target_time_points,
+                self._extrapolation_type,
+            ).dot(
+                _calc_integral_preserving_linear_interpolation_operator(source_length)
+            )
+            if self._extrapolation_type == ExtrapolationType.CONSTANT:
+                # the first and last period averages are used outside of the source
+                lower = target_time_points[:-1]
+                upper = target_time_points[1:]
+                integrals = integrals + sparse.csr_matrix(
+                    (
+                        np.concatenate(
+                            (
+                                np.maximum(
+                                    np.minimum(upper, source_time_points[0]) - lower, 0
+                                ),
+                                np.maximum(
+                                    upper - np.maximum(lower, source_time_points[-1]), 0
+                                ),
+                            )
+                        ),
+                        (
+                            np.tile(np.arange(len(lower)), 2),
+                            np.repeat([0, source_length - 1], len(lower)),
+                        ),
+                    ),
+                    shape=integrals.shape,
+                )
+            return sparse.csr_matrix(
+                sparse.diags(1 / np.diff(target_time_points)).dot(integrals)
+            )
+
+        raise NotImplementedError
+
+    @staticmethod
+    def _apply_operator(operator: sparse.csr_matrix, values: np.ndarray) -> np.ndarray:
         """
-        Convert time period average timeseries data ``values`` for timeseries time
-        points ``source_time_points`` to the time points ``target_time_points``.
+        Apply a conversion operator to ``values``.
 
         Parameters
         ----------
+        operator
+            Conversion operator (see
+            :func:`openscm.timeseries_converter.TimeseriesConverter._calc_operator`)
         values
-            Array of data to convert
-        source_time_points
-            Source timeseries time points
-        target_time_points
-            Target timeseries time points
+            Array of data to convert (one timeseries or a 2-D array of shape (number of
+            timeseries, source length))
 
         Raises
         ------
-        NotImplementedError
-            The timeseries type is not recognised
+        TimeseriesPointsValuesMismatchError
+            Length of ``values`` does not match the source of ``operator``
 
         Returns
         -------
         np.ndarray
-            Converted time period average data for timeseries ``target``
+            Converted array (of the same dimensionality as ``values``)
         """
-        if self._timeseries_type == ParameterType.AVERAGE_TIMESERIES:
-            return _calc_interval_averages(
-                self._calc_continuous_representation(source_time_points, values),
-                target_time_points,
-            )
-        if self._timeseries_type == ParameterType.POINT_TIMESERIES:
-            return self._calc_continuous_representation(source_time_points, values)(
-                target_time_points
-            )
-
-        raise NotImplementedError
+        values = np.asarray(values, dtype=float)
+        if values.shape[-1] != operator.shape[1]:
+            raise TimeseriesPointsValuesMismatchError
+        return operator.dot(values.T).T
 
     def convert_from(self, values: np.ndarray) -> np.ndarray:
         """
@@ -387,14 +510,19 @@ class TimeseriesConverter:
         Parameters
         ----------
         values
-            Value
+            Value (one timeseries or a 2-D array of shape (number of timeseries, source
+            length) to convert many timeseries at once)
 
         Returns
         -------
         np.ndarray
             Converted array
         """
-        return self._convert(values, self._source, self._target)
+        if self._convert_from_operator is None:
+            self._convert_from_operator = self._calc_operator(
+                self._source, self._target
+            )
+        return self._apply_operator(self._convert_from_operator, values)
 
     def convert_to(self, values: np.ndarray) -> np.ndarray:
         """
@@ -404,14 +532,17 @@ class TimeseriesConverter:
         Parameters
         ----------
         values
-            Value
+            Value (one timeseries or a 2-D array of shape (number of timeseries, target
+            length) to convert many timeseries at once)
 
         Returns
         -------
         np.ndarray
             Converted array
         """
-        return self._convert(values, self._target, self._source)
+        if self._convert_to_operator is None:
+            self._convert_to_operator = self._calc_operator(self._target, self._source)
+        return self._apply_operator(self._convert_to_operator, values)
 
     @property
     def source_length(self) -> int:
@@ -430,3 +561,220 @@ class TimeseriesConverter:
         return len(self._target) - (
             1 if self._timeseries_type == ParameterType.AVERAGE_TIMESERIES else 0
         )
+
+
+_TimePointsKey = Tuple[int, float, float, bytes]
+_ConverterKey = Tuple[
+    _TimePointsKey, _TimePointsKey, ParameterType, InterpolationType, ExtrapolationType
+]
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+"""Statistics of a :class:`TimeseriesConverterCache`"""
+
+
+def _time_points_key(time_points: np.ndarray) -> _TimePointsKey:
+    """
+    Calculate a cheap hashable key for timeseries time points.
+
+    Parameters
+    ----------
+    time_points
+        Timeseries time points
+
+    Returns
+    -------
+    Tuple[int, float, float, bytes]
+        Length, first and last time point and a digest of all time points
+    """
+    time_points = np.ascontiguousarray(time_points, dtype=float)
+    return (
+        len(time_points),
+        float(time_points[0]),
+        float(time_points[-1]),
+        hashlib.blake2b(time_points.tobytes(), digest_size=16).digest(),
+    )
+
+
+class TimeseriesConverterCache:
+    """
+    Least recently used cache of :class:`TimeseriesConverter` instances.
+
+    Converters are keyed by their source and target time points, timeseries type,
+    interpolation type and extrapolation type so that views and interpolations on the
+    same time grids share one converter (and hence its conversion operators). The cache
+    can be shared between threads.
+    """
+
+    _converters: "OrderedDict[_ConverterKey, TimeseriesConverter]"
+    """Cached converters, least recently used first"""
+
+    _lock: threading.Lock
+    """Lock guarding :attr:`_converters` and the statistics"""
+
+    hits: int
+    """Number of requests served from the cache"""
+
+    maxsize: Optional[int]
+    """Maximum number of cached converters (``None`` for no limit, 0 disables caching)"""
+
+    misses: int
+    """Number of requests which required a new converter"""
+
+    def __init__(self, maxsize: Optional[int] = 128):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        maxsize
+            Maximum number of cached converters (``None`` for no limit, 0 disables
+            caching)
+        """
+        self._converters = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.maxsize = maxsize
+        self.misses = 0
+
+    def get(
+        self,
+        source_time_points: np.ndarray,
+        target_time_points: np.ndarray,
+        timeseries_type: ParameterType,
+        interpolation_type: InterpolationType,
+        extrapolation_type: ExtrapolationType,
+    ) -> TimeseriesConverter:
+        """
+        Get a converter from the cache or create (and cache) it if not found.
+
+        Parameters
+        ----------
+        source_time_points
+            Source timeseries time points
+        target_time_points
+            Target timeseries time points
+        timeseries_type
+            Time series type
+        interpolation_type
+            Interpolation type
+        extrapolation_type
+            Extrapolation type
+
+        Returns
+        -------
+        TimeseriesConverter
+            Converter for the given time points and types
+
+        Raises
+        ------
+        InsufficientDataError
+            Timeseries too short to extrapolate
+        """
+        key = (
+            _time_points_key(source_time_points),
+            _time_points_key(target_time_points),
+            timeseries_type,
+            interpolation_type,
+            extrapolation_type,
+        )
+        with self._lock:
+            res = self._converters.get(key, None)
+            if res is not None:
+                self.hits += 1
+                self._converters.move_to_end(key)
+                return res
+            self.misses += 1
+
+        # build outside the lock so that other lookups are not blocked meanwhile
+        res = TimeseriesConverter(
+            source_time_points,
+            target_time_points,
+            timeseries_type,
+            interpolation_type,
+            extrapolation_type,
+        )
+        if self.maxsize is None or self.maxsize > 0:
+            with self._lock:
+                # another thread may have cached an equivalent converter meanwhile
+                res = self._converters.setdefault(key, res)
+                self._converters.move_to_end(key)
+                self._evict()
+        return res
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used converters until at most ``maxsize`` are cached.
+
+        The caller must hold :attr:`_lock`.
+        """
+        if self.maxsize is not None:
+            while len(self._converters) > self.maxsize:
+                self._converters.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all cached converters and reset the statistics.
+        """
+        with self._lock:
+            self._converters.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Get cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+            Number of hits and misses, maximum and current size of the cache
+        """
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._converters)
+            )
+
+
+timeseries_converter_cache = TimeseriesConverterCache()
+"""
+Process-wide cache of converters used by parameter views and
+:meth:`openscm.scmdataframe.base.ScmDataFrameBase.interpolate`; set its ``maxsize`` to
+configure how many converters are kept.
+"""
+
+
+def get_timeseries_converter(
+    source_time_points: np.ndarray,
+    target_time_points: np.ndarray,
+    timeseries_type: ParameterType,
+    interpolation_type: InterpolationType,
+    extrapolation_type: ExtrapolationType,
+) -> TimeseriesConverter:
+    """
+    Get a (shared) converter from :data:`timeseries_converter_cache`.
+
+    Parameters
+    ----------
+    source_time_points
+        Source timeseries time points
+    target_time_points
+        Target timeseries time points
+    timeseries_type
+        Time series type
+    interpolation_type
+        Interpolation type
+    extrapolation_type
+        Extrapolation type
+
+    Returns
+    -------
+    TimeseriesConverter
+        Converter for the given time points and types
+    """
+    return timeseries_converter_cache.get(
+        source_time_points,
+        target_time_points,
+        timeseries_type,
+        interpolation_type,
+        extrapolation_type,
+    )
@@ -102,11 +102,17 @@ prevent inadvertent conversions from 'NOx' to e.g. 'N2O', the conversion 'NOx' <
     >>> uc.convert_from(1)
     0.9565217391304348
 """
+import hashlib
+import pickle  # nosec
+import threading
 import warnings
-from typing import Dict, Optional, Sequence, Union
+from os import path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
+import pandas as pd
 import pint
+from pint.definitions import Definition
 from pint.errors import (  # noqa: F401 # pylint: disable=unused-import
     DimensionalityError,
     UndefinedUnitError,
@@ -243,24 +249,28 @@ class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
 
     _contexts_loaded: bool = False
 
-    def add_standards(self):
+    def add_standards(self, cache_file: Optional[str] = None) -> None:
         """
         Add standard units.
 
         Has to be done separately because of pint's weird initializing.
-        """
-        self._add_gases(_standard_gases)
 
-        self.define("a = 1 * year = annum = yr")
-        self.define("h = hour")
-        self.define("d = day")
-        self.define("degreeC = degC")
-        self.define("degreeF = degF")
-        self.define("kt = 1000 * t")  # since kt is used for "knot" in the defaults
+        Parameters
+        ----------
+        cache_file
+            File with the pre-parsed standard definitions (see
+            :func:`write_unit_registry_cache`). Parsing the definitions is the most
+            expensive part of adding them, so this speeds up creating the registry. The
+            file is ignored if it does not exist or has been written for other
+            definitions or another version of Pint.
+        """
+        definitions = self.get_standard_definitions()
+        parsed_definitions = None
+        if cache_file is not None:
+            parsed_definitions = _load_parsed_definitions(cache_file, definitions)
 
-        self.define("ppt = [concentrations]")
-        self.define("ppb = 1000 * ppt")
-        self.define("ppm = 1000 * ppb")
+        for definition in parsed_definitions or definitions:
+            self.define(definition)
 
     def enable_contexts(self, *names_or_contexts, **kwargs):
         """
@@ -272,9 +282,32 @@ class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
         self._contexts_loaded = True
         super().enable_contexts(*names_or_contexts, **kwargs)
 
-    def _add_mass_emissions_joint_version(self, symbol: str) -> None:
+    @classmethod
+    def get_standard_definitions(cls) -> List[str]:
+        """
+        Get the definitions of the standard units.
+
+        Returns
+        -------
+        List[str]
+            Unit definitions in Pint's definition syntax
+        """
+        return cls._get_gas_definitions(_standard_gases) + [
+            "a = 1 * year = annum = yr",
+            "h = hour",
+            "d = day",
+            "degreeC = degC",
+            "degreeF = degF",
+            "kt = 1000 * t",  # since kt is used for "knot" in the defaults
+            "ppt = [concentrations]",
+            "ppb = 1000 * ppt",
+            "ppm = 1000 * ppb",
+        ]
+
+    @staticmethod
+    def _get_mass_emissions_joint_version_definitions(symbol: str) -> List[str]:
         """
-        Add a unit which is the combination of mass and emissions.
+        Get the definitions of units which are the combination of mass and emissions.
 
         This allows users to units like e.g. ``"tC"`` rather than requiring a space
         between the mass and the emissions i.e. ``"t C"``
@@ -283,29 +316,44 @@ class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
         ----------
         symbol
             The unit to add a joint version for
-        """
-        self.define("g{symbol} = g * {symbol}".format(symbol=symbol))
-        self.define("t{symbol} = t * {symbol}".format(symbol=symbol))
 
-    def _add_gases(self, gases: Dict[str, Union[str, Sequence[str]]]) -> None:
+        Returns
+        -------
+        List[str]
+            Unit definitions in Pint's definition syntax
+        """
+        return [
+            "g{symbol} = g * {symbol}".format(symbol=symbol),
+            "t{symbol} = t * {symbol}".format(symbol=symbol),
+        ]
+
+    @classmethod
+    def _get_gas_definitions(
+        cls, gases: Dict[str, Union[str, Sequence[str]]]
+    ) -> List[str]:
+        definitions = []
         for symbol, value in gases.items():
             if isinstance(value, str):
                 # symbol is base unit
-                self.define("{} = [{}]".format(symbol, value))
+                definitions.append("{} = [{}]".format(symbol, value))
                 if value != symbol:
-                    self.define("{} = {}".format(value, symbol))
+                    definitions.append("{} = {}".format(value, symbol))
             else:
                 # symbol has conversion and aliases
-                self.define("{} = {}".format(symbol, value[0]))
+                definitions.append("{} = {}".format(symbol, value[0]))
                 for alias in value[1:]:
-                    self.define("{} = {}".format(alias, symbol))
+                    definitions.append("{} = {}".format(alias, symbol))
 
-            self._add_mass_emissions_joint_version(symbol)
+            definitions += cls._get_mass_emissions_joint_version_definitions(symbol)
 
             # Add alias for upper case symbol:
             if symbol.upper() != symbol:
-                self.define("{} = {}".format(symbol.upper(), symbol))
-                self._add_mass_emissions_joint_version(symbol.upper())
+                definitions.append("{} = {}".format(symbol.upper(), symbol))
+                definitions += cls._get_mass_emissions_joint_version_definitions(
+                    symbol.upper()
+                )
+
+        return definitions
 
     def _load_contexts(self) -> None:
         """
@@ -352,9 +400,6 @@ class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
 
         This is done only when contexts are needed to avoid reading files on import.
         """
-        import pandas as pd
-        from os import path
-
         metric_conversions = pd.read_csv(
             path.join(path.dirname(path.abspath(__file__)), "metric_conversions.csv"),
             skiprows=1,  # skip source row
@@ -439,13 +484,307 @@ class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
             self.add_context(tc)
 
 
-_unit_registry = ScmUnitRegistry()
+def _get_definitions_digest(definitions: Sequence[str]) -> str:
+    """
+    Get a digest identifying unit definitions and the Pint version parsing them.
+
+    Parameters
+    ----------
+    definitions
+        Unit definitions in Pint's definition syntax
+
+    Returns
+    -------
+    str
+        Digest of the definitions and the Pint version
+    """
+    return hashlib.sha256(
+        "\n".join([pint.__version__] + list(definitions)).encode("utf-8")
+    ).hexdigest()
+
+
+def _load_parsed_definitions(
+    cache_file: str, definitions: Sequence[str]
+) -> Optional[List[Definition]]:
+    """
+    Load pre-parsed unit definitions from a cache file.
+
+    Parameters
+    ----------
+    cache_file
+        File written by :func:`write_unit_registry_cache`
+    definitions
+        Unit definitions the cache file has to match
+
+    Returns
+    -------
+    Optional[List[Definition]]
+        Parsed definitions or ``None`` if the cache file does not exist or does not
+        match ``definitions`` and the installed Pint version
+    """
+    if not path.isfile(cache_file):
+        return None
+
+    try:
+        with open(cache_file, "rb") as f:
+            digest, parsed_definitions = pickle.load(f)  # nosec
+    except (OSError, pickle.UnpicklingError, ValueError, AttributeError, EOFError):
+        return None
+
+    if digest != _get_definitions_digest(definitions):
+        return None
+
+    return cast(List[Definition], parsed_definitions)
+
+
+unit_registry_cache_file = path.join(
+    path.dirname(path.abspath(__file__)), "standard_definitions.pickle"
+)
+"""
+Cache file with the pre-parsed standard unit definitions, which is used (if it exists)
+when the unit registry is created (see :func:`write_unit_registry_cache`)
+"""
+
+
+def write_unit_registry_cache(cache_file: Optional[str] = None) -> None:
+    """
+    Write the pre-parsed standard unit definitions to a cache file.
+
+    The cache file is only valid for the installed version of Pint. A cache file for the
+    default location (``unit_registry_cache_file``) can be created when building the
+    package with ``make unit-registry-cache``.
+
+    Parameters
+    ----------
+    cache_file
+        File to write to; if ``None``, ``unit_registry_cache_file`` is used
+    """
+    definitions = ScmUnitRegistry.get_standard_definitions()
+    with open(cache_file or unit_registry_cache_file, "wb") as f:
+        pickle.dump(
+            (
+                _get_definitions_digest(definitions),
+                [Definition.from_string(d) for d in definitions],
+            ),
+            f,
+        )
+
+
+_unit_registry_lock = threading.Lock()
+"""Lock ensuring the standard unit registry is only created once"""
+
+
+class _LazyUnitRegistry:
+    """
+    Proxy for the OpenSCM standard unit registry which is only created when it is first
+    used.
+
+    Creating the registry and adding the standard units takes a considerable amount of
+    time, which hence is not spent on importing OpenSCM (e.g. in worker processes which
+    never convert units).
+    """
+
+    _registry: Optional[ScmUnitRegistry] = None
+    """Unit registry (``None`` until first used)"""
+
+    def _get_registry(self) -> ScmUnitRegistry:
+        """
+        Get the unit registry, creating it if necessary.
+
+        Returns
+        -------
+        ScmUnitRegistry
+            OpenSCM standard unit registry
+        """
+        if self._registry is None:
+            with _unit_registry_lock:
+                # another thread may have created the registry while we waited
+                if self._registry is None:
+                    registry = ScmUnitRegistry()
+                    registry.add_standards(cache_file=unit_registry_cache_file)
+                    self._registry = registry
+        return self._registry
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._get_registry()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_registry(), name)
+
+
+_unit_registry = _LazyUnitRegistry()
 """
 OpenSCM standard unit registry
 
-The unit registry contains all of the recognised units.
+The unit registry contains all of the recognised units. It is created when first used.
 """
-_unit_registry.add_standards()
+
+_unit_conversion_factors: Dict[Tuple[str, str, Optional[str]], Tuple[float, float]] = {}
+"""
+Memoised scaling factors and offsets of unit conversions, keyed by source unit, target
+unit and context (see :func:`_get_scaling_and_offset`)
+"""
+
+_common_mass_units = ("g", "kg", "t", "kt", "Mt", "Gt")
+"""Mass units for which conversions are precomputed by :func:`precompute_unit_conversions`"""
+
+_common_time_units = ("yr",)
+"""Time units for which conversions are precomputed by :func:`precompute_unit_conversions`"""
+
+
+def _calc_scaling_and_offset(
+    source: str, target: str, context: Optional[str] = None
+) -> Tuple[float, float]:
+    """
+    Calculate the scaling factor and offset to convert from ``source`` to ``target``.
+
+    Parameters
+    ----------
+    source
+        Unit to convert **from**
+    target
+        Unit to convert **to**
+    context
+        Context to use for the conversion
+
+    Returns
+    -------
+    Tuple[float, float]
+        Scaling factor and offset
+
+    Raises
+    ------
+    pint.errors.DimensionalityError
+        Units cannot be converted into each other.
+    pint.errors.UndefinedUnitError
+        Unit undefined.
+    """
+    source_unit = _unit_registry.Unit(source)
+    target_unit = _unit_registry.Unit(target)
+
+    s1 = _unit_registry.Quantity(1, source_unit)
+    s2 = _unit_registry.Quantity(-1, source_unit)
+
+    if context is None:
+        t1 = s1.to(target_unit)
+        t2 = s2.to(target_unit)
+    else:
+        with _unit_registry.context(context):
+            t1 = s1.to(target_unit)
+            t2 = s2.to(target_unit)
+
+    scaling = float(t2.m - t1.m) / float(s2.m - s1.m)
+    return scaling, t1.m - scaling * s1.m
+
+
+def _get_scaling_and_offset(
+    source: str, target: str, context: Optional[str] = None
+) -> Tuple[float, float]:
+    """
+    Get the scaling factor and offset to convert from ``source`` to ``target``.
+
+    Results are memoised in :data:`_unit_conversion_factors` unless contexts are
+    enabled on the unit registry itself (in which case the result depends on more than
+    the arguments).
+
+    Parameters
+    ----------
+    source
+        Unit to convert **from**
+    target
+        Unit to convert **to**
+    context
+        Context to use for the conversion
+
+    Returns
+    -------
+    Tuple[float, float]
+        Scaling factor and offset
+    """
+    if _unit_registry._active_ctx:  # pylint: disable=protected-access
+        return _calc_scaling_and_offset(source, target, context)
+
+    key = (source, target, context)
+    res = _unit_conversion_factors.get(key, None)
+    if res is None:
+        res = _calc_scaling_and_offset(source, target, context)
+        _unit_conversion_factors[key] = res
+    return res
+
+
+def precompute_unit_conversions(
+    context: Optional[str] = None,
+    mass_units: Sequence[str] = _common_mass_units,
+    time_units: Sequence[str] = _common_time_units,
+) -> None:
+    """
+    Precompute the conversions between the emissions units of all standard gases.
+
+    For every standard gas, conversions between all combinations of ``mass_units``
+    (e.g. "Mt CO2" to "kt CO2") and of ``mass_units`` per ``time_units`` (e.g. "Mt CO2
+    / yr" to "kt CO2 / yr") are stored. If ``context`` is given, the conversions of all
+    gases to the corresponding CO2 units are stored as well. Afterwards, creating a
+    :class:`UnitConverter` for any of these conversions does not require Pint.
+
+    As these units have no offsets, the conversions are derived from one conversion per
+    mass unit and per gas rather than running Pint for every combination. Nothing is
+    precomputed while contexts are enabled on the unit registry itself.
+
+    Parameters
+    ----------
+    context
+        Context to use for the conversions
+    mass_units
+        Mass units to combine with the gases
+    time_units
+        Time units to combine with the masses of gases
+    """
+    if _unit_registry._active_ctx:  # pylint: disable=protected-access
+        return
+
+    mass_scalings = {
+        m: _get_scaling_and_offset(m, mass_units[0])[0] for m in mass_units
+    }
+    unit_templates = ["{mass} {gas}"] + [
+        "{{mass}} {{gas}} / {}".format(t) for t in time_units
+    ]
+    target_gases: List[Optional[str]] = [None] if context is None else [None, "CO2"]
+
+    # enabling a context is expensive so do it only once
+    with _unit_registry.context(*([] if context is None else [context])):
+        for gas in _standard_gases:
+            for template in unit_templates:
+                for target_gas in target_gases:
+                    target_gas = target_gas or gas
+                    # convert between different masses as Pint skips the conversion
+                    # (and hence any checks) for identical units
+                    try:
+                        gas_scaling = (
+                            _calc_scaling_and_offset(
+                                template.format(mass=mass_units[0], gas=gas),
+                                template.format(mass=mass_units[-1], gas=target_gas),
+                            )[0]
+                            * mass_scalings[mass_units[-1]]
+                        )
+                    except (DimensionalityError, UndefinedUnitError):
+                        continue
+                    if np.isnan(gas_scaling):
+                        # no conversion available
+                        continue
+
+                    for source_mass in mass_units:
+                        source = template.format(mass=source_mass, gas=gas)
+                        for target_mass in mass_units:
+                            target = template.format(mass=target_mass, gas=target_gas)
+                            _unit_conversion_factors.setdefault(
+                                (source, target, context),
+                                (
+                                    mass_scalings[source_mass]
+                                    * gas_scaling
+                                    / mass_scalings[target_mass],
+                                    0.0,
+                                ),
+                            )
 
 
 class UnitConverter:
@@ -489,31 +828,15 @@ class UnitConverter:
         """
         self._source = source
         self._target = target
+        self._scaling, self._offset = _get_scaling_and_offset(source, target, context)
 
-        source_unit = _unit_registry.Unit(source)
-        target_unit = _unit_registry.Unit(target)
-
-        s1 = _unit_registry.Quantity(1, source_unit)
-        s2 = _unit_registry.Quantity(-1, source_unit)
-
-        if context is None:
-            t1 = s1.to(target_unit)
-            t2 = s2.to(target_unit)
-        else:
-            with _unit_registry.context(context):
-                t1 = s1.to(target_unit)
-                t2 = s2.to(target_unit)
-
-        if np.isnan(t1) or np.isnan(t2):
+        if np.isnan(self._scaling) or np.isnan(self._offset):
             warn_msg = (
                 "No conversion from {} to {} available, nan will be returned "
                 "upon conversion".format(source, target)
             )
             warnings.warn(warn_msg)
 
-        self._scaling = float(t2.m - t1.m) / float(s2.m - s1.m)
-        self._offset = t1.m - self._scaling * s1.m
-
     def convert_from(self, v: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Convert value **from** source unit to target unit.
@@ -546,6 +869,20 @@ class UnitConverter:
         """
         return (v - self._offset) / self._scaling
 
+    @property
+    def scaling(self) -> float:
+        """
+        Scaling factor applied when converting from source to target unit
+        """
+        return self._scaling
+
+    @property
+    def offset(self) -> float:
+        """
+        Offset added when converting from source to target unit
+        """
+        return self._offset
+
     @property
     def contexts(self) -> Sequence[str]:
         """
@@ -568,4 +905,4 @@ class UnitConverter:
         ScmUnitRegistry
             Unit registry used by this unit converter
         """
-        return _unit_registry
+        return _unit_registry._get_registry()  # pylint: disable=protected-access
@@ -1,4 +1,8 @@
+import json
+
+import numpy as np
 import pandas as pd
+import pytest
 
 from openscm.scmdataframe import ScmDataFrame
 
@@ -12,3 +16,144 @@ def test_write_read_datafile(test_pd_df, tmp_path):
     rdf = ScmDataFrame(tfile)
 
     pd.testing.assert_frame_equal(tdf.timeseries(), rdf.timeseries())
+
+
+@pytest.mark.parametrize("fname", ["testfile.csv", "testfile.csv.gz"])
+@pytest.mark.parametrize("chunksize", [1, 2, 1000])
+def test_write_read_datafile_chunked(test_pd_df, tmp_path, fname, chunksize):
+    test_pd_df["run_id"] = [1, 2, np.nan]
+    tfile = str(tmp_path / fname)
+    tdf = ScmDataFrame(test_pd_df)
+
+    tdf.to_csv(tfile, chunksize=chunksize)
+
+    rdf = ScmDataFrame(tfile)
+
+    pd.testing.assert_frame_equal(tdf.timeseries(), rdf.timeseries())
+
+
+def test_read_datafile_chunked_index_col(test_pd_df, tmp_path):
+    tfile = str(tmp_path / "testfile.csv")
+    tdf = ScmDataFrame(test_pd_df)
+
+    test_pd_df.to_csv(tfile, index=False)
+
+    rdf = ScmDataFrame(tfile, chunksize=2, index_col=[0, 1, 2, 3, 4])
+
+    pd.testing.assert_frame_equal(tdf.timeseries(), rdf.timeseries())
+
+
+@pytest.mark.parametrize("chunksize", [1, 1000])
+def test_read_datafile_long_format_chunked(test_pd_df, tmp_path, chunksize):
+    tfile = str(tmp_path / "testfile.csv")
+    tdf = ScmDataFrame(test_pd_df)
+
+    test_pd_df.melt(
+        id_vars=["climate_model", "model", "scenario", "region", "variable", "unit"],
+        var_name="year",
+        value_name="value",
+    ).to_csv(tfile, index=False)
+
+    rdf = ScmDataFrame(tfile, chunksize=chunksize)
+
+    pd.testing.assert_frame_equal(tdf.timeseries(), rdf.timeseries())
+
+
+@pytest.mark.parametrize(
+    "drop,match",
+    [
+        ("unit", r"missing required columns `\['unit'\]`!"),
+        ([2005, 2010, 2015], "invalid column format"),
+    ],
+)
+def test_read_datafile_chunked_invalid(test_pd_df, tmp_path, drop, match):
+    tfile = str(tmp_path / "testfile.csv")
+    test_pd_df.drop(columns=drop).to_csv(tfile, index=False)
+
+    with pytest.raises(ValueError, match=match):
+        ScmDataFrame(tfile, chunksize=2)
+
+
+def test_write_datafile_float_format(test_pd_df, tmp_path):
+    tfile = str(tmp_path / "testfile.csv")
+    test_pd_df[2005] = [1 / 3, 2 / 3, 1]
+
+    ScmDataFrame(test_pd_df).to_csv(tfile, float_format="%.2f")
+
+    with open(tfile) as fh:
+        assert fh.readlines()[1].split(",")[-3:] == ["0.33", "6.00", "6.00\n"]
+
+
+def test_write_datafile_unsupported_compression(test_pd_df, tmp_path):
+    with pytest.raises(ValueError, match="unsupported compression `zip`"):
+        ScmDataFrame(test_pd_df).to_csv(
+            str(tmp_path / "testfile.csv"), compression="zip"
+        )
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(test_pd_df, tmp_path, mmap):
+    test_pd_df["run_id"] = [1, 2, np.nan]
+    test_pd_df["extra"] = ["a", np.nan, "b"]
+    tdf = ScmDataFrame(test_pd_df)
+
+    tdf.save(str(tmp_path / "saved"))
+    rdf = ScmDataFrame.load(str(tmp_path / "saved"), mmap=mmap)
+
+    assert isinstance(rdf, ScmDataFrame)
+    pd.testing.assert_frame_equal(tdf.timeseries(), rdf.timeseries())
+    pd.testing.assert_frame_equal(
+        tdf.filter(extra="a").timeseries(), rdf.filter(extra="a").timeseries()
+    )
+
+
+def test_save_load_meta_types(test_pd_df, tmp_path):
+    test_pd_df["run_id"] = np.array([1, 2, 3], dtype=np.int64)
+    test_pd_df["fraction"] = [0.5, np.nan, 0.25]
+    test_pd_df["date"] = pd.to_datetime(["2010-01-01", None, "2010-01-01"])
+    tdf = ScmDataFrame(test_pd_df)
+
+    tdf.save(str(tmp_path / "saved"))
+    rdf = ScmDataFrame.load(str(tmp_path / "saved"))
+
+    pd.testing.assert_frame_equal(tdf.meta, rdf.meta)
+    pd.testing.assert_frame_equal(
+        tdf.filter(run_id=2).timeseries(), rdf.filter(run_id=2).timeseries()
+    )
+
+
+def test_save_unsupported_meta_type(test_pd_df, tmp_path):
+    test_pd_df["extra"] = ["a", pd.Timestamp("2010-01-01"), np.int64(3)]
+
+    with pytest.raises(
+        TypeError,
+        match="cannot save meta column `extra` with values of type Timestamp, int64",
+    ):
+        ScmDataFrame(test_pd_df).save(str(tmp_path / "saved"))
+
+    assert not (tmp_path / "saved").exists()
+
+
+def test_load_mmap_not_written_back(test_pd_df, tmp_path):
+    tdf = ScmDataFrame(test_pd_df)
+    tdf.save(str(tmp_path / "saved"))
+
+    rdf = ScmDataFrame.load(str(tmp_path / "saved"))
+    rdf.convert_unit("PJ/yr", inplace=True)
+    np.testing.assert_allclose(rdf.values, tdf.values * 1000)
+
+    pd.testing.assert_frame_equal(
+        tdf.timeseries(), ScmDataFrame.load(str(tmp_path / "saved")).timeseries()
+    )
+
+
+def test_load_unsupported_version(test_pd_df, tmp_path):
+    ScmDataFrame(test_pd_df).save(str(tmp_path / "saved"))
+    with open(str(tmp_path / "saved" / "header.json")) as fh:
+        header = json.load(fh)
+    header["version"] = -1
+    with open(str(tmp_path / "saved" / "header.json"), "w") as fh:
+        json.dump(header, fh)
+
+    with pytest.raises(ValueError, match="unsupported binary format version `-1`"):
+        ScmDataFrame.load(str(tmp_path / "saved"))
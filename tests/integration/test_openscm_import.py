@@ -1,5 +1,38 @@
+import subprocess
+import sys
+
 import openscm
 
 
 def test_version():
     assert openscm.__version__
+
+
+def test_unit_registry_created_on_first_use():
+    code = (
+        "import openscm.core, openscm.scmdataframe, openscm.units; "
+        "assert openscm.units._unit_registry._registry is None; "
+        "openscm.units._unit_registry('CO2'); "
+        "assert openscm.units._unit_registry._registry is not None"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_unit_registry_created_once_with_threads():
+    code = """
+import sys
+import threading
+import openscm.units
+sys.setswitchinterval(1e-6)
+quantities = []
+def use_registry():
+    quantities.append(openscm.units._unit_registry("CO2"))
+threads = [threading.Thread(target=use_registry) for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert len(quantities) == 8
+assert len({id(q._REGISTRY) for q in quantities}) == 1
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
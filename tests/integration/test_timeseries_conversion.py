@@ -14,10 +14,12 @@ def test_conversion_to_same_timeseries(combo):
         combo.interpolation_type,
         combo.extrapolation_type,
     )
-    values = timeseriesconverter._convert(
-        combo.source_values, combo.source, combo.source
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_from(combo.source_values), combo.source_values
+    )
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_to(combo.source_values), combo.source_values
     )
-    np.testing.assert_allclose(values, combo.source_values)
     assert timeseriesconverter.source_length == len(combo.source) - (
         1 if combo.timeseries_type == ParameterType.AVERAGE_TIMESERIES else 0
     )
@@ -45,10 +47,15 @@ def test_conversion(combo):
         combo.interpolation_type,
         combo.extrapolation_type,
     )
-    values = timeseriesconverter._convert(
-        combo.source_values, combo.source, combo.target
+    # many timeseries at once
+    values = timeseriesconverter.convert_from(
+        np.stack([combo.source_values, 2 * combo.source_values])
+    )
+    np.testing.assert_allclose(
+        values,
+        np.stack([combo.target_values, 2 * combo.target_values]),
+        atol=1e-10 * values.max(),
     )
-    np.testing.assert_allclose(values, combo.target_values, atol=1e-10 * values.max())
 
 
 def test_timeseriesconverter(combo):
@@ -1,3 +1,7 @@
+from unittest.mock import patch
+
+import pytest
+
 from openscm.adapter import Adapter
 from openscm.core import ParameterSet
 
@@ -53,3 +57,39 @@ def test_adapter_base_class_run():
     assert adapter._current_time == start_time
     adapter.run()
     assert adapter.step() == start_time
+
+
+def test_adapter_base_class_initialize_model():
+    Adapter.__abstractmethods__ = set()
+    adapter = Adapter(  # pylint: disable=abstract-class-instantiated
+        ParameterSet(), ParameterSet()
+    )
+
+    assert not adapter._initialized
+    adapter.initialize_model()
+    assert adapter._initialized
+
+
+def test_adapter_base_class_shutdown():
+    Adapter.__abstractmethods__ = set()
+    adapter = Adapter(  # pylint: disable=abstract-class-instantiated
+        ParameterSet(), ParameterSet()
+    )
+
+    with patch.object(Adapter, "_shutdown") as shutdown:
+        adapter.shutdown()
+        adapter.shutdown()
+        del adapter
+        shutdown.assert_called_once_with()
+
+
+def test_adapter_base_class_run_batch():
+    Adapter.__abstractmethods__ = set()
+    adapter = Adapter(  # pylint: disable=abstract-class-instantiated
+        ParameterSet(), ParameterSet()
+    )
+
+    assert not adapter.supports_batch()
+    assert not Adapter.supports_batch()
+    with pytest.raises(NotImplementedError):
+        adapter.run_batch({}, [0, 1])
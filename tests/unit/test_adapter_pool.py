@@ -0,0 +1,243 @@
+import gc
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from openscm.adapter import Adapter
+from openscm.adapter_pool import AdapterPool
+from openscm.core import ParameterSet
+
+
+class _CountingAdapter(Adapter):
+    n_initialized = 0
+    n_shut_down = 0
+
+    def _initialize_model(self):
+        type(self).n_initialized += 1
+        self.healthy = True
+
+    def _initialize_model_input(self):
+        pass
+
+    def _initialize_run_parameters(self):
+        pass
+
+    def _reset(self):
+        pass
+
+    def _run(self):
+        self._output.get_writable_scalar_view(("ecs",), ("World",), "K").set(
+            self._parameters.get_scalar_view(("ecs",), ("World",), "K").get()
+        )
+
+    def _shutdown(self):
+        type(self).n_shut_down += 1
+
+    def _step(self):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def pool_factory():
+    # adapters of previous tests shut down when collected, which must not be counted
+    gc.collect()
+    _CountingAdapter.n_initialized = 0
+    _CountingAdapter.n_shut_down = 0
+    with patch("openscm.adapters._loaded_adapters", new={"stub": _CountingAdapter}):
+        yield lambda **kwargs: AdapterPool("stub", **kwargs)
+
+
+def do_run(pool, ecs=3.0):
+    parameters = ParameterSet()
+    parameters.get_writable_scalar_view(("ecs",), ("World",), "K").set(ecs)
+    output = ParameterSet()
+    with pool.adapter(parameters, output) as adapter:
+        adapter.initialize_model_input()
+        adapter.initialize_run_parameters(0, 10)
+        if not pool.n_runs(adapter):
+            adapter.reset()
+        adapter.run()
+
+    assert output.get_scalar_view(("ecs",), ("World",), "K").get() == ecs
+    return adapter
+
+
+def test_pool_reuses_adapters(pool_factory):
+    pool = pool_factory()
+    adapters = {id(do_run(pool, ecs)) for ecs in range(5)}
+
+    assert len(adapters) == 1
+    assert len(pool) == 1
+    assert _CountingAdapter.n_initialized == 1
+
+
+def test_pool_prewarm(pool_factory):
+    pool = pool_factory(max_size=3)
+    pool.prewarm(5)
+
+    assert len(pool) == 3
+    assert _CountingAdapter.n_initialized == 3
+    do_run(pool)
+    assert _CountingAdapter.n_initialized == 3
+
+
+def test_pool_max_runs(pool_factory):
+    pool = pool_factory(max_runs=2)
+    adapters = [id(do_run(pool)) for _ in range(4)]
+
+    assert adapters[0] == adapters[1]
+    assert _CountingAdapter.n_initialized == 2
+    assert _CountingAdapter.n_shut_down == 2
+    assert len(pool) == 0
+
+
+def test_pool_health_check(pool_factory):
+    pool = pool_factory(health_check=lambda adapter: adapter.healthy)
+    adapter = do_run(pool)
+    adapter.healthy = False
+    assert do_run(pool) is adapter
+    assert len(pool) == 0
+
+    do_run(pool)
+    assert _CountingAdapter.n_initialized == 2
+
+
+def test_pool_discards_failed(pool_factory):
+    pool = pool_factory()
+    with pytest.raises(ValueError, match="failed run"):
+        with pool.adapter(ParameterSet(), ParameterSet()):
+            raise ValueError("failed run")
+
+    assert len(pool) == 0
+    do_run(pool)
+    assert _CountingAdapter.n_initialized == 2
+
+
+def test_pool_max_size(pool_factory):
+    pool = pool_factory(max_size=1)
+    adapter = pool.checkout(ParameterSet(), ParameterSet())
+
+    with pytest.raises(TimeoutError, match="no adapter available"):
+        pool.checkout(ParameterSet(), ParameterSet(), timeout=0.01)
+
+    pool.checkin(adapter, healthy=False)
+    pool.checkout(ParameterSet(), ParameterSet(), timeout=0.01)
+
+
+def test_pool_threads(pool_factory):
+    pool = pool_factory(max_size=2)
+    errors = []
+
+    def do_runs():
+        try:
+            for ecs in range(20):
+                do_run(pool, ecs)
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    threads = [threading.Thread(target=do_runs) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(pool) <= 2
+    assert _CountingAdapter.n_initialized <= 2
+
+
+def test_pool_n_runs(pool_factory):
+    pool = pool_factory()
+    adapter = do_run(pool)
+    do_run(pool)
+
+    assert pool.checkout(ParameterSet(), ParameterSet()) is adapter
+    assert pool.n_runs(adapter) == 2
+    pool.checkin(adapter)
+
+    with pytest.raises(ValueError, match="adapter is not checked out from this pool"):
+        pool.n_runs(adapter)
+
+
+def test_pool_checkin_not_checked_out(pool_factory):
+    pool = pool_factory()
+    adapter = do_run(pool)
+
+    with pytest.raises(ValueError, match="adapter is not checked out from this pool"):
+        pool.checkin(adapter)
+    with pytest.raises(ValueError, match="adapter is not checked out from this pool"):
+        pool.checkin(_CountingAdapter(ParameterSet(), ParameterSet()))
+
+    assert len(pool) == 1
+    assert pool.checkout(ParameterSet(), ParameterSet()) is adapter
+
+
+def test_pool_close(pool_factory):
+    with pool_factory() as pool:
+        pool.prewarm(2)
+        adapter = pool.checkout(ParameterSet(), ParameterSet())
+
+    assert _CountingAdapter.n_shut_down == 1
+    assert len(pool) == 1
+    with pytest.raises(RuntimeError, match="adapter pool is closed"):
+        pool.checkout(ParameterSet(), ParameterSet())
+    with pytest.raises(RuntimeError, match="adapter pool is closed"):
+        pool.prewarm(1)
+
+    pool.checkin(adapter)
+    assert _CountingAdapter.n_shut_down == 2
+    assert len(pool) == 0
+
+
+def test_pool_create_fails(pool_factory):
+    pool = pool_factory(max_size=1)
+    with patch.object(
+        _CountingAdapter, "_initialize_model", side_effect=ValueError("no binary")
+    ):
+        with pytest.raises(ValueError, match="no binary"):
+            pool.prewarm(1)
+        with pytest.raises(ValueError, match="no binary"):
+            pool.checkout(ParameterSet(), ParameterSet())
+
+    # failed adapters do not count towards max_size
+    assert len(pool) == 0
+    pool.checkout(ParameterSet(), ParameterSet(), timeout=0.01)
+
+
+def test_pool_shutdown_fails(pool_factory):
+    pool = pool_factory()
+    with patch.object(_CountingAdapter, "_shutdown", side_effect=RuntimeError):
+        with pytest.raises(ValueError, match="failed run"):
+            with pool.adapter(ParameterSet(), ParameterSet()):
+                raise ValueError("failed run")
+
+    assert len(pool) == 0
+
+
+def test_pool_close_during_prewarm(pool_factory):
+    pool = pool_factory()
+    initialize_model = _CountingAdapter._initialize_model
+
+    def initialize_and_close(adapter):
+        initialize_model(adapter)
+        pool.close()
+
+    with patch.object(_CountingAdapter, "_initialize_model", initialize_and_close):
+        with pytest.raises(RuntimeError, match="adapter pool is closed"):
+            pool.prewarm(2)
+
+    assert _CountingAdapter.n_initialized == 1
+    assert _CountingAdapter.n_shut_down == 1
+    assert len(pool) == 0
+
+
+def test_pool_reset_fails(pool_factory):
+    pool = pool_factory()
+    adapter = pool.checkout(ParameterSet(), ParameterSet())
+    with patch.object(_CountingAdapter, "_reset", side_effect=ValueError):
+        pool.checkin(adapter)
+
+    assert _CountingAdapter.n_shut_down == 1
+    assert len(pool) == 0
+    assert pool.checkout(ParameterSet(), ParameterSet()) is not adapter
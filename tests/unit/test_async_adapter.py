@@ -0,0 +1,268 @@
+import asyncio
+import os
+import re
+import sys
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from openscm.async_adapter import (
+    AsyncAdapter,
+    SubprocessAdapter,
+    run_adapters,
+    run_sync,
+)
+from openscm.core import ParameterSet
+from openscm.errors import AdapterRunError
+from openscm.parameters import ParameterType
+
+TIME_POINTS = np.array([0, 10, 20, 30])
+
+STAND_IN_MODEL = """
+import sys
+
+ecs = float(sys.stdin.read())
+if ecs < 0:
+    sys.exit("negative ecs")
+print(" ".join(str(ecs * i) for i in range(4)))
+"""
+
+
+class _StandInModel(SubprocessAdapter):
+    def _get_command(self):
+        return [sys.executable, "-c", STAND_IN_MODEL]
+
+    def _get_input(self):
+        ecs = self._parameters.get_scalar_view(("ecs",), ("World",), "K").get()
+        return str(ecs).encode()
+
+    def _process_output(self, output):
+        self._output.get_writable_timeseries_view(
+            ("Surface Temperature",),
+            ("World",),
+            "K",
+            TIME_POINTS,
+            ParameterType.POINT_TIMESERIES,
+        ).set(np.array(output.split(), dtype=float))
+
+
+class _SleepingModel(AsyncAdapter):
+    in_flight = 0
+    max_in_flight = 0
+
+    def _initialize_model(self):
+        pass
+
+    def _initialize_model_input(self):
+        pass
+
+    def _initialize_run_parameters(self):
+        pass
+
+    def _reset(self):
+        pass
+
+    async def _run_async(self):
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+
+    async def _step_async(self):
+        self._current_time += 1
+
+    def _shutdown(self):
+        pass
+
+
+class _NoInputModel(_StandInModel):
+    _get_input = SubprocessAdapter._get_input
+
+    def _get_command(self):
+        return [sys.executable, "-c", "import sys; print(repr(sys.stdin.read()))"]
+
+    def _process_output(self, output):
+        self.stdin = output.decode().strip()
+
+
+class _HangingModel(_StandInModel):
+    def _get_command(self):
+        return [sys.executable, "-c", "import time; time.sleep(60)"]
+
+
+def get_stand_in(ecs):
+    parameters = ParameterSet()
+    parameters.get_writable_scalar_view(("ecs",), ("World",), "K").set(ecs)
+    adapter = _StandInModel(parameters, ParameterSet())
+    adapter.initialize_model_input()
+    adapter.initialize_run_parameters(0, 30)
+    adapter.reset()
+    return adapter
+
+
+def get_surface_temperature(adapter):
+    return adapter._output.get_timeseries_view(
+        ("Surface Temperature",),
+        ("World",),
+        "K",
+        TIME_POINTS,
+        ParameterType.POINT_TIMESERIES,
+    ).get()
+
+
+def test_subprocess_adapter_run():
+    adapter = get_stand_in(3.0)
+    adapter.run()
+
+    npt.assert_allclose(get_surface_temperature(adapter), [0, 3, 6, 9])
+
+
+def test_subprocess_adapter_run_error():
+    adapter = get_stand_in(-1.0)
+
+    error_msg = re.escape("model process exited with code 1: negative ecs")
+    with pytest.raises(AdapterRunError, match=error_msg):
+        adapter.run()
+
+
+def test_subprocess_adapter_no_input():
+    adapter = _NoInputModel(ParameterSet(), ParameterSet())
+    adapter.run()
+
+    assert adapter.stdin == "''"
+
+
+def test_subprocess_adapter_step():
+    with pytest.raises(NotImplementedError):
+        get_stand_in(3.0).step()
+
+
+def test_async_adapter_step():
+    adapter = _SleepingModel(ParameterSet(), ParameterSet())
+    adapter.initialize_run_parameters(0, 30)
+    adapter.reset()
+
+    assert adapter.step() == 1
+    assert run_sync(adapter.step_async()) == 2
+
+
+def test_run_adapters():
+    adapters = [get_stand_in(float(ecs)) for ecs in range(20)]
+
+    assert run_adapters(adapters, max_concurrency=8) == [None] * 20
+    for ecs, adapter in enumerate(adapters):
+        npt.assert_allclose(get_surface_temperature(adapter), np.arange(4) * ecs)
+
+
+def test_run_adapters_errors():
+    adapters = [get_stand_in(1.0), get_stand_in(-1.0)]
+
+    with pytest.raises(AdapterRunError):
+        run_adapters(adapters)
+
+    res = run_adapters(adapters, return_exceptions=True)
+    assert res[0] is None
+    assert isinstance(res[1], AdapterRunError)
+
+
+def test_run_adapters_max_concurrency():
+    _SleepingModel.max_in_flight = 0
+    adapters = [_SleepingModel(ParameterSet(), ParameterSet()) for _ in range(50)]
+
+    run_adapters(adapters, max_concurrency=5)
+
+    assert _SleepingModel.max_in_flight == 5
+
+
+def test_run_sync_unsets_event_loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        get_stand_in(3.0).run()
+        with pytest.raises(RuntimeError):
+            asyncio.get_event_loop()
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def test_run_sync_in_running_event_loop():
+    adapter = get_stand_in(3.0)
+
+    async def run_in_loop():
+        with pytest.raises(RuntimeError, match="await `AsyncAdapter.run_async`"):
+            adapter.run()
+        await adapter.run_async()
+
+    run_sync(run_in_loop())
+    npt.assert_allclose(get_surface_temperature(adapter), [0, 3, 6, 9])
+
+
+def test_subprocess_adapter_cancelled_kills_process(monkeypatch):
+    parameters = ParameterSet()
+    parameters.get_writable_scalar_view(("ecs",), ("World",), "K").set(3.0)
+    adapter = _HangingModel(parameters, ParameterSet())
+
+    processes = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def record_process(*args, **kwargs):
+        processes.append(await create_subprocess_exec(*args, **kwargs))
+        return processes[-1]
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", record_process)
+    with pytest.raises(asyncio.TimeoutError):
+        run_sync(asyncio.wait_for(adapter.run_async(), 1))
+
+    # the process has been killed and reaped
+    assert processes[0].returncode is not None
+    with pytest.raises(ProcessLookupError):
+        os.kill(processes[0].pid, 0)
+
+
+def test_subprocess_adapter_error_after_exit(monkeypatch):
+    adapter = get_stand_in(3.0)
+    processes = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def failing_communicate_process(*args, **kwargs):
+        process = await create_subprocess_exec(*args, **kwargs)
+        communicate = process.communicate
+
+        async def communicate_then_fail(*args, **kwargs):
+            await communicate(*args, **kwargs)
+            raise ValueError("output lost")
+
+        process.communicate = communicate_then_fail
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", failing_communicate_process)
+    with pytest.raises(ValueError, match="output lost"):
+        adapter.run()
+
+    # the process had exited already and is left alone
+    assert processes[0].returncode == 0
+
+
+async def _noop():
+    pass
+
+
+@pytest.fixture
+def fresh_event_loop_policy():
+    policy = asyncio.get_event_loop_policy()
+    yield
+    asyncio.set_event_loop_policy(policy)
+
+
+def test_run_sync_does_not_create_event_loop(fresh_event_loop_policy):
+    # a fresh default policy would create an event loop in the main thread on request
+    asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
+
+    run_sync(_noop())
+
+    with pytest.raises(RuntimeError):
+        asyncio.get_event_loop()
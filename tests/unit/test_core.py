@@ -1,3 +1,4 @@
+import pickle
 import warnings
 
 import numpy as np
@@ -94,6 +95,9 @@ def test_parameter(core):
     assert param_co2.get_subparameter(()) == param_co2
     for accessor in ["CO2", ("CO2"), ("CO2",), ["CO2"]]:
         assert param_co2.parent.get_subparameter(accessor) == param_co2
+    assert param_co2.parent.get_or_create_child_parameter("CO2") is param_co2
+    assert param_co2.parent.get_subparameter(("CH4",)) is None
+    assert param_co2.parent.get_subparameter(("CO2", "Coal")) is None
     assert region_ber.get_parameter(("Emissions", "CO2")) == param_co2
     assert param_co2.full_name == ("Emissions", "CO2")
     assert param_co2.info.region == ("World", "DEU", "BER")
@@ -165,6 +169,65 @@ def test_parameter(core):
         )
 
 
+def test_parameterset_index():
+    parameterset = ParameterSet()
+    name = ("Emissions", "CO2", "Energy", "Coal")
+    region = ("World", "R5ASIA", "CHN")
+    param = parameterset._get_or_create_parameter(
+        name, parameterset._get_or_create_region(region)
+    )
+
+    root = parameterset._root
+    assert root._region_index[region] is param.info._region
+    assert root._region_index[region].full_name is root._region_index[region].full_name
+    assert root._parameter_index[(region, name)] is param
+    assert root._parameter_index[(region, name[:2])] is param.parent.parent
+    assert param.full_name == name
+    assert param.full_name is param.full_name
+
+    # all regions and parameters are indexed, however they have been created
+    sub = root.get_or_create_subregion("R5LAM").get_or_create_parameter("Emissions")
+    sub.get_or_create_child_parameter("CH4")
+    assert parameterset._get_region(("World", "R5LAM")) is sub.info._region
+    assert (
+        parameterset.get_parameter_info(("Emissions", "CH4"), ("World", "R5LAM"))
+        is sub.get_subparameter(("CH4",)).info
+    )
+    assert parameterset._get_region(("World", "R5OECD")) is None
+
+    # existing regions and parameters are found by the region methods as well
+    region_lam = sub.info._region
+    assert root.get_or_create_subregion("R5LAM") is region_lam
+    assert region_lam.get_or_create_parameter("Emissions") is sub
+    assert root.get_subregion(()) is root
+    assert root.get_subregion(("R5ASIA", "CHN")) is param.info._region
+    assert root.get_subregion(("R5LAM", "BRA")) is None
+
+
+def test_parameterset_pickle():
+    parameterset = ParameterSet()
+    parameterset.get_writable_scalar_view(
+        ("Emissions", "CO2"), ("World", "DEU"), "GtC/a"
+    ).set(1.0)
+    param = parameterset._get_or_create_parameter(
+        ("Emissions", "CO2"), parameterset._get_or_create_region(("World", "DEU"))
+    )
+    # compact representation without instance dictionaries
+    assert not hasattr(param, "__dict__")
+    assert not hasattr(param.info._region, "__dict__")
+    assert param.info is param
+
+    res = pickle.loads(pickle.dumps(parameterset))
+    assert res.get_scalar_view(
+        ("Emissions", "CO2"), ("World", "DEU"), "MtC/a"
+    ).get() == pytest.approx(1000.0)
+    region = res._get_region(("World", "DEU"))
+    assert region._region_index is res._root._region_index
+    assert res._root._parameter_index[
+        (("World", "DEU"), ("Emissions", "CO2"))
+    ].parent is region.get_parameter(("Emissions",))
+
+
 def test_parameterset_default_initialization():
     paraset = ParameterSet()
 
@@ -506,3 +569,144 @@ def test_generic_parameter_view(core):
     assert cs_writable.get() == "enabled"
     assert not cs.is_empty
     assert cs.get() == "enabled"
+
+
+def test_parameterset_set_get_many():
+    parameterset = ParameterSet()
+    time_points = np.array([0, 10, 20, 30])
+    parameterset.set_many(
+        [
+            (
+                ("Emissions", "CO2", "Fossil"),
+                ("World",),
+                "GtC/a",
+                ParameterType.POINT_TIMESERIES,
+                np.array([1.0, 2.0, 3.0, 4.0]),
+            ),
+            (
+                ("Emissions", "CO2", "Land"),
+                ("World", "R5ASIA"),
+                "MtC/a",
+                ParameterType.POINT_TIMESERIES,
+                np.array([100.0, 200.0, 300.0, 400.0]),
+            ),
+            (
+                ("Climate Sensitivity",),
+                ("World",),
+                "delta_degC",
+                ParameterType.SCALAR,
+                3.0,
+            ),
+            (("Model Options", "Mode"), ("World",), None, ParameterType.GENERIC, "a"),
+        ],
+        time_points=time_points,
+    )
+
+    np.testing.assert_allclose(
+        parameterset.get_timeseries_view(
+            ("Emissions", "CO2", "Land"),
+            ("World", "R5ASIA"),
+            "GtC/a",
+            time_points,
+            ParameterType.POINT_TIMESERIES,
+        ).get(),
+        [0.1, 0.2, 0.3, 0.4],
+    )
+
+    res = parameterset.get_many(
+        [
+            (
+                ("Emissions", "CO2", "Fossil"),
+                ("World",),
+                "MtC/a",
+                ParameterType.POINT_TIMESERIES,
+            ),
+            # aggregated over child parameters
+            (("Emissions",), ("World",), "GtC/a", ParameterType.POINT_TIMESERIES),
+            (("Climate Sensitivity",), ("World",), "mK", ParameterType.SCALAR),
+            (("Model Options", "Mode"), ("World",), None, ParameterType.GENERIC),
+        ],
+        time_points=time_points[:2],
+    )
+    np.testing.assert_allclose(res[0], [1000.0, 2000.0])
+    np.testing.assert_allclose(res[1], [1.0, 2.0])
+    np.testing.assert_allclose(res[2], 3000.0)
+    assert res[3] == "a"
+
+    # scalars aggregated over child parameters, sharing a unit converter
+    parameterset.set_many(
+        [
+            (("Sensitivity", "A"), ("World",), "K", ParameterType.SCALAR, 1.0),
+            (("Sensitivity", "B"), ("World",), "K", ParameterType.SCALAR, 2.0),
+        ]
+    )
+    res = parameterset.get_many(
+        [
+            (("Sensitivity",), ("World",), "K", ParameterType.SCALAR),
+            (("Sensitivity", "A"), ("World",), "mK", ParameterType.SCALAR),
+            (("Sensitivity", "B"), ("World",), "mK", ParameterType.SCALAR),
+        ]
+    )
+    np.testing.assert_allclose(res, [3.0, 1000.0, 2000.0])
+
+
+def test_parameterset_set_get_many_errors():
+    parameterset = ParameterSet()
+    with pytest.raises(ValueError, match="No time points given"):
+        parameterset.set_many(
+            [(("Emissions",), ("World",), "GtC/a", ParameterType.POINT_TIMESERIES, [])]
+        )
+    with pytest.raises(ValueError, match="No time points given"):
+        parameterset.get_many(
+            [(("Emissions",), ("World",), "GtC/a", ParameterType.AVERAGE_TIMESERIES)]
+        )
+    with pytest.raises(TimeseriesPointsValuesMismatchError):
+        parameterset.set_many(
+            [
+                (
+                    ("Emissions", "CO2"),
+                    ("World",),
+                    "GtC/a",
+                    ParameterType.POINT_TIMESERIES,
+                    [1.0],
+                )
+            ],
+            time_points=[0, 10],
+        )
+    with pytest.raises(TimeseriesPointsValuesMismatchError):
+        # average timeseries have one value less than time points
+        parameterset.set_many(
+            [
+                (
+                    ("Emissions", "CH4"),
+                    ("World",),
+                    "MtCH4/a",
+                    ParameterType.AVERAGE_TIMESERIES,
+                    [1.0, 2.0],
+                )
+            ],
+            time_points=[0, 10],
+        )
+    with pytest.raises(ParameterEmptyError):
+        parameterset.get_many(
+            [(("Climate Sensitivity",), ("World",), "K", ParameterType.SCALAR)]
+        )
+    with pytest.raises(ParameterTypeError):
+        parameterset.get_many(
+            [(("Climate Sensitivity",), ("World",), None, ParameterType.GENERIC)]
+        )
+    with pytest.raises(ValueError, match="No parameter name given"):
+        parameterset.get_many([((), ("World",), "K", ParameterType.SCALAR)])
+    with pytest.raises(ValueError, match="Cannot access region"):
+        parameterset.get_many([(("A",), ("Earth",), "K", ParameterType.SCALAR)])
+    with pytest.raises(ValueError, match="No unit given"):
+        parameterset.set_many([(("A",), ("World",), None, ParameterType.SCALAR, 1.0)])
+    with pytest.raises(ValueError, match="No unit given"):
+        parameterset.get_many([(("A",), ("World",), None, ParameterType.SCALAR)])
+    with pytest.raises(ValueError, match="No unit given"):
+        parameterset.set_many(
+            [(("B",), ("World",), None, ParameterType.POINT_TIMESERIES, [1.0])],
+            time_points=[0],
+        )
+    # the failed write has not set a unitless value
+    assert parameterset.get_parameter_info(("A",), ("World",)).parameter_type is None
@@ -0,0 +1,464 @@
+import os
+import pickle
+import re
+from unittest.mock import patch
+
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+import pytest
+
+from openscm import ensemble
+from openscm.adapter import Adapter
+from openscm.core import ParameterSet
+from openscm.ensemble import run_ensemble
+from openscm.errors import EnsembleRunError
+from openscm.parameters import ParameterType
+
+TIME_POINTS = np.array([0, 10, 20, 30])
+
+
+class _LinearWarming(Adapter):
+    """
+    Adapter warming linearly at a rate of ``ecs`` per time step
+    """
+
+    def _initialize_model(self):
+        self._n_resets = 0
+
+    def _initialize_model_input(self):
+        pass
+
+    def _initialize_run_parameters(self):
+        pass
+
+    def _reset(self):
+        self._n_resets += 1
+
+    def _run(self):
+        ecs = self._parameters.get_scalar_view(("ecs",), ("World",), "K").get()
+        offset = self._parameters.get_scalar_view(("offset",), ("World",), "K").get()
+        self._output.get_writable_timeseries_view(
+            ("Surface Temperature",),
+            ("World",),
+            "K",
+            TIME_POINTS,
+            ParameterType.POINT_TIMESERIES,
+        ).set(offset + ecs * np.arange(len(TIME_POINTS)))
+        self._write_generic_outputs()
+
+    def _write_generic_outputs(self):
+        self._output.get_writable_generic_view(("adapter",), ("World",)).set(
+            "{}-{}".format(os.getpid(), id(self))
+        )
+        self._output.get_writable_generic_view(("n_resets",), ("World",)).set(
+            self._n_resets
+        )
+
+    def _shutdown(self):
+        pass
+
+    def _step(self):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def base_parameters():
+    parameters = ParameterSet()
+    parameters.get_writable_scalar_view(("ecs",), ("World",), "K").set(3)
+    parameters.get_writable_scalar_view(("offset",), ("World",), "K").set(0)
+    return parameters
+
+
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_run_ensemble(base_parameters, chunksize):
+    ecs = (("ecs",), ("World",), "K")
+    offset = (("offset",), ("World",), "K")
+    overrides = [
+        {ecs: 1.0},
+        {ecs: 2.0, offset: 10.0},
+        {offset: 20.0},
+        {ecs: 4000.0, offset: 20.0},
+        {ecs: 5.0},
+        {ecs: 6.0},
+    ]
+
+    res = run_ensemble(
+        _LinearWarming,
+        base_parameters,
+        overrides,
+        0,
+        30,
+        TIME_POINTS,
+        max_workers=2,
+        chunksize=chunksize,
+    )
+
+    assert res["run_id"].tolist() == list(range(len(overrides)))
+    assert res["climate_model"].unique().tolist() == ["_LinearWarming"]
+    assert res["variable"].unique().tolist() == ["Surface Temperature"]
+    npt.assert_allclose(
+        res.values,
+        [
+            [0, 1, 2, 3],
+            [10, 12, 14, 16],
+            [20, 23, 26, 29],
+            [20, 4020, 8020, 12020],
+            [0, 5, 10, 15],
+            [0, 6, 12, 18],
+        ],
+    )
+    # one adapter per worker, reset exactly once before every run
+    n_resets_by_adapter = res.meta.groupby("adapter")["n_resets"]
+    assert len(n_resets_by_adapter) <= 2
+    for _, n_resets in n_resets_by_adapter:
+        assert sorted(n_resets) == list(range(1, len(n_resets) + 1))
+
+    # base parameters are not touched
+    assert base_parameters.get_scalar_view(("offset",), ("World",), "K").get() == 0
+
+
+class _OffsetOutputWarming(_LinearWarming):
+    """
+    ``_LinearWarming`` which also outputs a positive ``offset``
+    """
+
+    def _run(self):
+        super()._run()
+        offset = self._parameters.get_scalar_view(("offset",), ("World",), "K").get()
+        if offset > 0:
+            self._output.get_writable_generic_view(("offset",), ("World",)).set(offset)
+
+
+def test_run_ensemble_outputs_not_kept_between_runs(base_parameters):
+    offset = (("offset",), ("World",), "K")
+
+    res = run_ensemble(
+        _OffsetOutputWarming,
+        base_parameters,
+        [{offset: 10.0}, {offset: 0.0}],
+        0,
+        30,
+        TIME_POINTS,
+        max_workers=1,
+        chunksize=2,
+    )
+
+    assert res["offset"].tolist()[0] == 10
+    assert pd.isnull(res["offset"].tolist()[1])
+
+
+class _FailingWarming(_LinearWarming):
+    """
+    ``_LinearWarming`` failing for negative ``ecs``
+    """
+
+    def _run(self):
+        if self._parameters.get_scalar_view(("ecs",), ("World",), "K").get() < 0:
+            raise ValueError("negative ecs")
+        super()._run()
+
+    def _shutdown(self):
+        # shutting down must not mask the error of the run
+        raise RuntimeError
+
+
+@pytest.mark.parametrize("chunksize", [1, 4])
+def test_run_ensemble_failing_runs(base_parameters, chunksize):
+    ecs = (("ecs",), ("World",), "K")
+    overrides = [{ecs: 1.0}, {ecs: -1.0}, {ecs: 2.0}, {ecs: -2.0}]
+
+    error_msg = re.escape("2 run(s) failed (run ids: 1, 3)")
+    with pytest.raises(EnsembleRunError, match=error_msg) as excinfo:
+        run_ensemble(
+            _FailingWarming,
+            base_parameters,
+            overrides,
+            0,
+            30,
+            TIME_POINTS,
+            max_workers=1,
+            chunksize=chunksize,
+        )
+
+    error = excinfo.value
+    assert sorted(error.failures) == [1, 3]
+    assert all("ValueError: negative ecs" in tb for tb in error.failures.values())
+    # the other runs are completed (with a new adapter after each failure)
+    assert error.results["run_id"].tolist() == [0, 2]
+    npt.assert_allclose(error.results.values, [[0, 1, 2, 3], [0, 2, 4, 6]])
+    assert sorted(error.results["n_resets"]) == [1, 1]
+
+
+def test_run_ensemble_all_runs_failing(base_parameters):
+    overrides = [{(("ecs",), ("World",), "K"): -1.0}]
+
+    with pytest.raises(EnsembleRunError) as excinfo:
+        run_ensemble(_FailingWarming, base_parameters, overrides, 0, 30, TIME_POINTS)
+
+    assert list(excinfo.value.failures) == [0]
+    assert excinfo.value.results is None
+
+
+def test_run_ensemble_missing_parameter(base_parameters):
+    junk = (("junk",), ("World",), "K")
+    error_msg = re.escape(
+        "{} is not overridden by all runs and not set in the base parameters".format(
+            junk
+        )
+    )
+    with pytest.raises(ValueError, match=error_msg):
+        run_ensemble(
+            _LinearWarming, base_parameters, [{junk: 1.0}, {}], 0, 30, TIME_POINTS
+        )
+
+
+def test_run_ensemble_no_runs(base_parameters):
+    with pytest.raises(ValueError, match="no runs given"):
+        run_ensemble(_LinearWarming, base_parameters, [], 0, 30, TIME_POINTS)
+
+
+class _BatchLinearWarming(_LinearWarming):
+    """
+    ``_LinearWarming`` vectorised across ensemble members
+    """
+
+    def _run_batch(self, inputs, time_points):
+        ecs = inputs[(("ecs",), ("World",), "K")]
+        offset = inputs.get(
+            (("offset",), ("World",), "K"),
+            self._parameters.get_scalar_view(("offset",), ("World",), "K").get(),
+        )
+        self._write_generic_outputs()
+        return {
+            (("Surface Temperature",), ("World",), "K"): np.reshape(offset, (-1, 1))
+            + ecs[:, np.newaxis] * np.arange(len(time_points))
+        }
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 2])
+def test_run_ensemble_batch(base_parameters, chunksize):
+    ecs = (("ecs",), ("World",), "K")
+    overrides = [{ecs: float(v)} for v in range(5)]
+
+    res = run_ensemble(
+        _BatchLinearWarming,
+        base_parameters,
+        overrides,
+        0,
+        30,
+        TIME_POINTS,
+        max_workers=2,
+        chunksize=chunksize,
+    )
+
+    # generic outputs are kept as for single runs, adapters being reset once per batch
+    n_resets_by_adapter = res.meta.groupby("adapter")["n_resets"]
+    assert len(n_resets_by_adapter) <= 2
+    for _, n_resets in n_resets_by_adapter:
+        assert sorted(n_resets.unique()) == list(range(1, n_resets.nunique() + 1))
+    assert res["run_id"].tolist() == list(range(len(overrides)))
+    assert res["climate_model"].unique().tolist() == ["_BatchLinearWarming"]
+    assert res["variable"].unique().tolist() == ["Surface Temperature"]
+    npt.assert_allclose(res.values, np.arange(5)[:, np.newaxis] * np.arange(4))
+
+
+def test_run_ensemble_batch_matches_single_runs(base_parameters):
+    ecs = (("ecs",), ("World",), "K")
+    offset = (("offset",), ("World",), "K")
+    overrides = [{ecs: float(v), offset: 10.0 * v} for v in range(5)]
+
+    res = {
+        adapter_cls: run_ensemble(
+            adapter_cls,
+            base_parameters,
+            overrides,
+            0,
+            30,
+            TIME_POINTS,
+            max_workers=2,
+            chunksize=2,
+        ).timeseries()
+        for adapter_cls in [_LinearWarming, _BatchLinearWarming]
+    }
+
+    # only the values of the generic outputs differ
+    pd.testing.assert_frame_equal(
+        res[_LinearWarming].reset_index(["adapter", "n_resets"], drop=True),
+        res[_BatchLinearWarming]
+        .reset_index(["adapter", "n_resets"], drop=True)
+        .rename(index={"_BatchLinearWarming": "_LinearWarming"}),
+    )
+
+
+def test_run_ensemble_batch_generic_override(base_parameters):
+    overrides = [
+        {(("ecs",), ("World",), "K"): 2.0, (("source",), ("World",), None): "a"},
+        {(("ecs",), ("World",), "K"): 3.0, (("source",), ("World",), None): "b"},
+    ]
+
+    res = run_ensemble(
+        _BatchLinearWarming, base_parameters, overrides, 0, 30, TIME_POINTS
+    )
+
+    # generic overrides cannot be stacked so runs are done one by one
+    assert "adapter" in res.meta
+    npt.assert_allclose(res.values, [[0, 2, 4, 6], [0, 3, 6, 9]])
+
+
+class _FailingBatchLinearWarming(_BatchLinearWarming):
+    """
+    ``_BatchLinearWarming`` failing for negative ``ecs``
+    """
+
+    def _run_batch(self, inputs, time_points):
+        if (inputs[(("ecs",), ("World",), "K")] < 0).any():
+            raise ValueError("negative ecs")
+        return super()._run_batch(inputs, time_points)
+
+
+def test_run_ensemble_failing_batch(base_parameters):
+    ecs = (("ecs",), ("World",), "K")
+    overrides = [{ecs: 1.0}, {ecs: -1.0}, {ecs: 2.0}, {ecs: 3.0}]
+
+    with pytest.raises(EnsembleRunError) as excinfo:
+        run_ensemble(
+            _FailingBatchLinearWarming,
+            base_parameters,
+            overrides,
+            0,
+            30,
+            TIME_POINTS,
+            max_workers=1,
+            chunksize=2,
+        )
+
+    # all runs of the failing batch fail
+    assert sorted(excinfo.value.failures) == [0, 1]
+    assert excinfo.value.results["run_id"].tolist() == [2, 3]
+
+
+def test_complete_overrides_generic_default(base_parameters):
+    source = (("source",), ("World",), None)
+    base_parameters.get_writable_generic_view(*source[:2]).set("base")
+
+    res = ensemble._complete_overrides(base_parameters, [{source: "a"}, {}])
+
+    assert res == [{source: "a"}, {source: "base"}]
+
+
+@pytest.fixture
+def worker_state():
+    yield ensemble._worker_state
+    if "pool" in ensemble._worker_state:
+        ensemble._worker_state["pool"].close()
+    ensemble._worker_state.clear()
+
+
+def _make_ensemble(parameters, tmpdir, ensemble_id, model=_LinearWarming, batch=False):
+    parameters_file = str(tmpdir.join("{}.pickle".format(ensemble_id)))
+    with open(parameters_file, "wb") as f:
+        pickle.dump(parameters, f)
+    return ensemble._Ensemble(
+        ensemble_id=ensemble_id,
+        model=model,
+        batch=batch,
+        parameters_file=parameters_file,
+        start_time=0,
+        stop_time=30,
+        time_points=TIME_POINTS,
+        climate_model=model.__name__,
+    )
+
+
+def test_worker_state(base_parameters, tmpdir, worker_state):
+    first = _make_ensemble(base_parameters, tmpdir, "first")
+    second = _make_ensemble(base_parameters, tmpdir, "second")
+
+    pool = ensemble._get_worker_pool(first)
+    parameters = worker_state["parameters"]
+    pool.prewarm(1)
+
+    # the base parameter set is loaded once per ensemble
+    os.remove(first.parameters_file)
+    assert ensemble._get_worker_pool(first) is pool
+    assert worker_state["parameters"] is parameters
+
+    # the adapter of the previous ensemble is shut down
+    with patch.object(_LinearWarming, "_shutdown") as shutdown:
+        new_pool = ensemble._get_worker_pool(second)
+        shutdown.assert_called_once_with()
+    assert new_pool is not pool
+    assert len(pool) == 0
+    assert worker_state["parameters"] is not parameters
+
+
+def test_run_in_worker(base_parameters, tmpdir, worker_state):
+    ecs = (("ecs",), ("World",), "K")
+    source = (("source",), ("World",), None)
+    runs = [(3, {ecs: 1.0, source: "a"}), (5, {ecs: 2.0, source: "b"})]
+
+    res, failures = ensemble._run_in_worker(
+        runs, _make_ensemble(base_parameters, tmpdir, "single")
+    )
+
+    assert failures == {}
+    assert [r["run_id"].tolist() for r in res] == [[3], [5]]
+    npt.assert_allclose([r.values[0] for r in res], [[0, 1, 2, 3], [0, 2, 4, 6]])
+    # the adapter is re-used and the overrides are written into the base parameters
+    assert len({r["adapter"].iloc[0] for r in res}) == 1
+    parameters = worker_state["parameters"]
+    assert parameters.get_scalar_view(*ecs).get() == 2
+    assert parameters.get_generic_view(*source[:2]).get() == "b"
+
+
+def test_run_in_worker_failing_runs(base_parameters, tmpdir, worker_state):
+    ecs = (("ecs",), ("World",), "K")
+    runs = [(0, {ecs: 1.0}), (1, {ecs: -1.0}), (2, {ecs: 2.0})]
+
+    res, failures = ensemble._run_in_worker(
+        runs, _make_ensemble(base_parameters, tmpdir, "failing", model=_FailingWarming)
+    )
+
+    assert list(failures) == [1]
+    assert "ValueError: negative ecs" in failures[1]
+    assert [r["run_id"].tolist() for r in res] == [[0], [2]]
+    # the adapter of the failed run is replaced
+    assert len({r["adapter"].iloc[0] for r in res}) == 2
+
+
+def test_run_in_worker_missing_parameters_file(base_parameters, tmpdir, worker_state):
+    ens = _make_ensemble(base_parameters, tmpdir, "missing")
+    os.remove(ens.parameters_file)
+
+    res, failures = ensemble._run_in_worker([(0, {}), (1, {})], ens)
+
+    assert res == []
+    assert sorted(failures) == [0, 1]
+    assert all("FileNotFoundError" in tb for tb in failures.values())
+
+
+@pytest.mark.parametrize(
+    "model,n_failures", [(_BatchLinearWarming, 0), (_FailingBatchLinearWarming, 3)]
+)
+def test_run_in_worker_batch(base_parameters, tmpdir, worker_state, model, n_failures):
+    ecs = (("ecs",), ("World",), "K")
+    runs = [(0, {ecs: 1.0}), (1, {ecs: -1.0}), (2, {ecs: 2.0})]
+
+    ens = _make_ensemble(base_parameters, tmpdir, "batch", model=model, batch=True)
+    res, failures = ensemble._run_in_worker(runs, ens)
+
+    assert len(failures) == n_failures
+    if n_failures:
+        assert res == []
+        assert all("ValueError: negative ecs" in tb for tb in failures.values())
+    else:
+        assert [r["run_id"].tolist() for r in res] == [[0], [1], [2]]
+        npt.assert_allclose(
+            [r.values[0] for r in res], [[0, 1, 2, 3], [0, -1, -2, -3], [0, 2, 4, 6]]
+        )
+        assert res[0]["n_resets"].tolist() == [1]
+
+        # the adapter is re-used for the next batch, having been reset once between
+        res, _ = ensemble._run_in_worker(runs, ens)
+        assert res[0]["n_resets"].tolist() == [2]
@@ -0,0 +1,80 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from openscm.scmdataframe import ScmDataFrame, ScmDataFrameBuilder, df_append
+
+
+def get_run(run_id, times=(2005, 2010, 2015)):
+    return ScmDataFrame(
+        np.random.random((len(times), 2)),
+        index=list(times),
+        columns={
+            "model": ["a_iam"],
+            "scenario": ["a_scenario"],
+            "region": ["World"],
+            "variable": ["Primary Energy", "Primary Energy|Coal"],
+            "unit": ["EJ/yr"],
+            "run_id": [run_id],
+        },
+    )
+
+
+def test_build():
+    runs = [get_run(i) for i in range(50)]
+    builder = ScmDataFrameBuilder(capacity=1)
+    for run in runs:
+        builder.append(run)
+
+    assert len(builder) == 100
+    res = builder.build()
+
+    assert isinstance(res, ScmDataFrame)
+    pd.testing.assert_frame_equal(res.timeseries(), df_append(runs).timeseries())
+
+
+def test_build_different_times():
+    runs = [get_run(0), get_run(1, times=(2000, 2010)), get_run(2)]
+    builder = ScmDataFrameBuilder()
+    for run in runs:
+        builder.append(run)
+
+    pd.testing.assert_frame_equal(
+        builder.build().timeseries(), df_append(runs).timeseries()
+    )
+
+
+def test_build_duplicates():
+    run = get_run(0)
+    builder = ScmDataFrameBuilder()
+    builder.append(run)
+    builder.append(run.timeseries() * 3)
+
+    with pytest.warns(UserWarning, match="Duplicate time points detected"):
+        res = builder.build()
+
+    np.testing.assert_allclose(res.values, run.values * 2)
+
+
+def test_append_copies():
+    run = get_run(0)
+    expected = run.timeseries()
+    builder = ScmDataFrameBuilder()
+    builder.append(run)
+
+    run._data *= 2
+    run.set_meta(1, name="run_id")
+
+    pd.testing.assert_frame_equal(builder.build().timeseries(), expected)
+
+
+def test_build_empties_builder():
+    builder = ScmDataFrameBuilder()
+    builder.append(get_run(0))
+    builder.build()
+
+    assert len(builder) == 0
+    with pytest.raises(ValueError, match=re.escape("no timeseries appended")):
+        builder.build()
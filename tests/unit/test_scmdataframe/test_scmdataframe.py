@@ -14,6 +14,7 @@ from numpy import testing as npt
 from pandas.errors import UnsupportedFunctionCall
 
 from openscm.scmdataframe import ScmDataFrame, convert_core_to_scmdataframe, df_append
+from openscm.scmdataframe.base import _format_chunks, _is_time_col
 from openscm.units import DimensionalityError, UndefinedUnitError
 from openscm.utils import (
     convert_datetime_to_openscm_time,
@@ -198,6 +199,32 @@ def test_init_ts_col_string(test_ts):
     npt.assert_array_equal(res["unit"].unique(), "EJ/yr")
 
 
+@pytest.mark.parametrize("order", ["C", "F"])
+@pytest.mark.parametrize("n_series", [1, 3])
+def test_init_ts_not_aliased(test_ts, order, n_series):
+    data = np.array(test_ts[:, :n_series], order=order)
+    exp = data.copy()
+    res = ScmDataFrame(
+        data,
+        columns={
+            "model": "an_iam",
+            "climate_model": "a_model",
+            "scenario": "a_scenario",
+            "region": "World",
+            "variable": ["Primary Energy|{}".format(i) for i in range(n_series)],
+            "unit": "EJ/yr",
+        },
+        index=[2005, 2010, 2015],
+    )
+    assert not np.shares_memory(res._values, data)
+
+    res.convert_unit("MJ/yr", inplace=True)
+    npt.assert_array_equal(data, exp)
+
+    data[:] = -1
+    npt.assert_allclose(res.values, exp.T * 10 ** 12)
+
+
 @pytest.mark.parametrize("fail_setting", [["a_iam", "a_iam"]])
 def test_init_ts_col_wrong_length_error(test_ts, fail_setting):
     correct_scenarios = ["a_scenario", "a_scenario", "a_scenario2"]
@@ -294,6 +321,30 @@ def test_init_with_year_columns(test_pd_df):
     pd.testing.assert_frame_equal(df.timeseries().reset_index(), tdf, check_like=True)
 
 
+@pytest.mark.parametrize(
+    "col,exp",
+    [
+        (2005, True),
+        (2005.5, True),
+        ("2005", True),
+        (" 2005.25 ", True),
+        ("1e3", True),
+        ("nan", True),
+        (datetime.datetime(2005, 1, 1), True),
+        ("2005-01-01 12:00:00", True),
+        ("2005-01-01", True),
+        ("2005-1-1 12:00:00", True),
+        ("2005-13-01", False),
+        ("1 Jan 2005", True),
+        ("2005-01-01T12:00:00", True),
+        ("climate_model", False),
+        ("todo", False),
+    ],
+)
+def test_is_time_col(col, exp):
+    assert _is_time_col(col) == exp
+
+
 def test_init_with_decimal_years():
     inp_array = [2.0, 1.2, 7.9]
     d = pd.Series(inp_array, index=[1765.0, 1765.083, 1765.167])
@@ -405,6 +456,26 @@ def test_get_item(test_scm_df):
     assert test_scm_df["model"].unique() == ["a_iam"]
 
 
+def test_get_item_time_year_copies(test_scm_df):
+    derived = test_scm_df.filter(variable="Primary Energy")
+
+    year = test_scm_df["year"]
+    year[:] = 1900
+    time = test_scm_df["time"]
+    time[:] = None
+
+    assert test_scm_df["year"].tolist() == [2005, 2010, 2015]
+    assert test_scm_df["time"].tolist() == [
+        datetime.datetime(2005, 1, 1),
+        datetime.datetime(2010, 1, 1),
+        datetime.datetime(2015, 1, 1),
+    ]
+    assert test_scm_df["time"].name == "time"
+    assert not test_scm_df.filter(year=2010).timeseries().empty
+    # frames sharing the time index are not affected either
+    assert derived["year"].tolist() == [2005, 2010, 2015]
+
+
 def test_get_item_not_in_meta(test_scm_df):
     dud_key = 0
     error_msg = re.escape("I don't know what to do with key: {}".format(dud_key))
@@ -441,6 +512,38 @@ def test_values(test_scm_df):
     npt.assert_array_equal(test_scm_df.values, test_scm_df.timeseries().values)
 
 
+def test_values_and_timeseries_are_copies(test_scm_df):
+    exp = test_scm_df.values
+
+    test_scm_df.values[0, 0] = -1
+    test_scm_df.timeseries().iloc[0, 0] = -1
+
+    npt.assert_array_equal(test_scm_df.values, exp)
+
+
+def test_values_duplicated_meta(test_pd_df):
+    test_pd_df["variable"] = "Primary Energy"
+
+    with pytest.raises(ValueError, match="Duplicated meta values"):
+        ScmDataFrame(test_pd_df).values
+
+
+def test_filter_keep_false_masks_values(test_scm_df):
+    obs = test_scm_df.filter(scenario="a_scenario2", year=2015, keep=False)
+
+    exp = test_scm_df.timeseries()
+    exp.iloc[2, 2] = np.nan
+    pd.testing.assert_frame_equal(obs.timeseries(), exp)
+
+
+def test_filter_keep_false_drops_time_points(test_scm_df):
+    obs = test_scm_df.filter(year=2010, keep=False)
+
+    pd.testing.assert_frame_equal(
+        obs.timeseries(), test_scm_df.timeseries().iloc[:, [0, 2]]
+    )
+
+
 def test_variable_depth_0(test_scm_df):
     obs = list(test_scm_df.filter(level=0)["variable"].unique())
     exp = ["Primary Energy"]
@@ -1175,6 +1278,59 @@ def test_append_inplace(test_scm_df):
     npt.assert_almost_equal(obs, exp)
 
 
+def test_append_averages_only_collisions(test_scm_df):
+    test_scm_df.set_meta(np.nan, name="junk")
+    other = test_scm_df.filter(scenario="a_scenario2")
+    other["time"] = [2005, 2010, 2020]
+    other._data *= 2
+    original_ts = test_scm_df.timeseries().copy()
+
+    res = test_scm_df.append(other, duplicate_msg=False)
+
+    pd.testing.assert_frame_equal(original_ts, test_scm_df.timeseries())
+    pd.testing.assert_frame_equal(res.meta, test_scm_df.meta.reset_index(drop=True))
+    npt.assert_array_equal(
+        res.values,
+        [
+            [1.0, 6.0, 6.0, np.nan],
+            [0.5, 3.0, 3.0, np.nan],
+            [(2.0 + 4.0) / 2, (7.0 + 14.0) / 2, 7.0, 14.0],
+        ],
+    )
+
+
+def test_append_permuted_time_axis():
+    columns = {
+        "model": "a_model",
+        "scenario": "a_scenario",
+        "region": "World",
+        "variable": "A",
+        "unit": "EJ/yr",
+    }
+    base = ScmDataFrame(np.array([0.0, 5.0]), index=[2000, 2005], columns=columns)
+    other = ScmDataFrame(
+        np.array([15.0, 10.0]), index=[2005, 2000], columns={**columns, "variable": "B"}
+    )
+
+    res = df_append([base, other])
+
+    npt.assert_array_equal(res["year"], [2000, 2005])
+    npt.assert_array_equal(res.filter(variable="A").values, [[0.0, 5.0]])
+    npt.assert_array_equal(res.filter(variable="B").values, [[10.0, 15.0]])
+
+
+def test_append_duplicates_compare_meta_values(test_scm_df):
+    base = test_scm_df.filter(scenario="a_scenario2")
+    base.set_meta(1, name="run_id")
+    other = base.copy()
+    other.set_meta("1", name="run_id")
+
+    res = df_append([base, other, base], duplicate_msg=False)
+
+    assert res.meta["run_id"].tolist() == [1, "1"]
+    npt.assert_array_equal(res.values, np.concatenate([base.values, other.values]))
+
+
 def get_append_col_order_time_dfs(base):
     other_2 = base.filter(variable="Primary Energy|Coal")
     base.set_meta("co2_only", name="runmodus")
@@ -1620,6 +1776,45 @@ def test_filter_by_int(test_scm_df):
     assert obs["scenario"].unique() == "a_scenario"
 
 
+def test_filter_copy_on_write(test_scm_df):
+    orig = test_scm_df.timeseries()
+    obs = test_scm_df.filter(year=[2010, 2015])
+    assert np.shares_memory(obs._values, test_scm_df._values)
+
+    obs.convert_unit("PJ/yr", inplace=True)
+    pd.testing.assert_frame_equal(test_scm_df.timeseries(), orig)
+
+    obs = test_scm_df.filter(year=[2010, 2015])
+    test_scm_df.convert_unit("PJ/yr", inplace=True)
+    npt.assert_array_equal(obs.values, orig.values[:, 1:])
+
+
+def test_filter_meta_index(test_scm_df):
+    assert len(test_scm_df.filter(scenario="a_scenario")) == 2
+    assert "scenario" in test_scm_df._meta_index
+    distinct, codes = test_scm_df._meta_index["scenario"]
+    assert len(distinct) == 2
+    npt.assert_array_equal(codes, [0, 0, 1])
+
+    assert len(test_scm_df.filter(variable="Primary Energy|Gas")) == 0
+    test_scm_df.rename(
+        {"variable": {"Primary Energy|Coal": "Primary Energy|Gas"}}, inplace=True
+    )
+    assert len(test_scm_df.filter(variable="Primary Energy|Gas")) == 1
+
+    test_scm_df.set_meta(["x", "y", "y"], name="scenario")
+    assert len(test_scm_df.filter(scenario="y")) == 2
+
+    test_scm_df.convert_unit("PJ/yr", variable="Primary Energy|Gas", inplace=True)
+    assert len(test_scm_df.filter(unit="PJ/yr")) == 1
+
+    test_scm_df._set_meta_column("scenario", "w", [0])
+    assert len(test_scm_df.filter(scenario="w")) == 1
+
+    test_scm_df._meta = test_scm_df._meta.assign(scenario="z")
+    assert len(test_scm_df.filter(scenario="z")) == 3
+
+
 def test_rename_variable(test_scm_df):
     mapping = {
         "variable": {
@@ -1702,6 +1897,15 @@ def test_convert_unit(
     assert (test_scm_df["unit"] == input_units).all()
 
 
+def test_convert_unit_no_match(test_scm_df, caplog):
+    obs = test_scm_df.convert_unit("PJ/yr", variable="junk")
+
+    assert "Filtered ScmDataFrame is empty!" in caplog.text
+    pd.testing.assert_frame_equal(
+        obs.timeseries().droplevel("unit_context"), test_scm_df.timeseries()
+    )
+
+
 def test_convert_unit_unknown_unit(test_scm_df):
     unknown_unit = "Unknown"
     test_scm_df["unit"] = unknown_unit
@@ -1719,6 +1923,15 @@ def test_convert_unit_dimensionality(test_scm_df):
         test_scm_df.convert_unit("kelvin")
 
 
+def test_convert_unit_dimensionality_sorted_units(test_scm_df):
+    test_scm_df["unit"] = ["Mt CO2 / yr", "EJ/yr", "EJ/yr"]
+
+    # units are tried in sorted order
+    error_msg = "Cannot convert from 'exajoule / a' .* to 'kelvin'"
+    with pytest.raises(DimensionalityError, match=error_msg):
+        test_scm_df.convert_unit("kelvin")
+
+
 def test_convert_unit_inplace(test_scm_df):
     units = test_scm_df["unit"].copy()
 
@@ -1766,6 +1979,37 @@ def test_convert_existing_unit_context(test_scm_df):
     # TODO: warning if unit_context is different
 
 
+def test_convert_unit_mixed_units_context(test_scm_df):
+    test_scm_df["unit"] = ["Mt CO2 / yr", "kt CH4 / yr", "Mt CH4 / yr"]
+    test_scm_df["variable"] = ["Emissions|CO2", "Emissions|CH4", "Emissions|CH4"]
+
+    obs = test_scm_df.convert_unit("Mt CO2 / yr", context="AR4GWP100")
+
+    assert (obs["unit"] == "Mt CO2 / yr").all()
+    assert (obs["unit_context"] == "AR4GWP100").all()
+    npt.assert_array_almost_equal(
+        obs.filter(year=2005).values.squeeze(), [1.0, 0.5 * 25 * 1e-3, 2.0 * 25]
+    )
+    npt.assert_array_almost_equal(
+        obs.timeseries().values, test_scm_df.timeseries().values * [[1], [0.025], [25]]
+    )
+
+
+def test_convert_unit_nan_unit(test_scm_df):
+    test_scm_df["unit"] = ["Mt CO2 / yr", np.nan, "kt CO2 / yr"]
+    original = test_scm_df.values
+
+    obs = test_scm_df.convert_unit("Gt CO2 / yr")
+
+    pd.testing.assert_series_equal(
+        obs["unit"], pd.Series(["Gt CO2 / yr", np.nan, "Gt CO2 / yr"], name="unit")
+    )
+    npt.assert_array_almost_equal(obs.values[1], original[1])
+    npt.assert_array_almost_equal(
+        obs.values[[0, 2]], original[[0, 2]] * [[1e-3], [1e-6]]
+    )
+
+
 def test_scmdataframe_to_core(rcp26, assert_core):
     tdata = rcp26
 
@@ -1991,6 +2235,68 @@ def test_read_from_disk(test_file, test_kwargs):
     )
 
 
+@pytest.mark.parametrize("chunksize", [1, 7, 1000])
+def test_read_from_disk_chunked(test_data_path, chunksize):
+    fname = os.path.join(test_data_path, "rcp26_emissions.csv")
+    loaded = ScmDataFrame(fname, chunksize=chunksize)
+
+    pd.testing.assert_frame_equal(loaded.timeseries(), ScmDataFrame(fname).timeseries())
+
+
+def test_read_from_disk_chunked_values_not_copied(test_data_path):
+    fname = os.path.join(test_data_path, "rcp26_emissions.csv")
+    formatted = []
+
+    def format_chunks(*args, **kwargs):
+        formatted.append(_format_chunks(*args, **kwargs))
+        return formatted[-1]
+
+    with mock.patch(
+        "openscm.scmdataframe.base._format_chunks", side_effect=format_chunks
+    ):
+        loaded = ScmDataFrame(fname, chunksize=7)
+
+    assert np.shares_memory(loaded._values, formatted[0][0].values)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"variable": "Emissions|C*"},
+        {"variable": "Emissions|*", "level": 1},
+        {"variable": "Emissions|N2O", "region": "World"},
+        {"variable": r"^Emissions\|N.*$", "regexp": True},
+        {"level": 0},
+        {"scenario": "junk"},
+    ],
+)
+def test_read_from_disk_filters(test_data_path, filters):
+    fname = os.path.join(test_data_path, "rcp26_emissions.csv")
+    loaded = ScmDataFrame(fname, chunksize=5, filters=filters)
+    expected = ScmDataFrame(fname).filter(**filters)
+
+    if expected.timeseries().empty:
+        assert loaded.timeseries().empty
+    else:
+        pd.testing.assert_frame_equal(loaded.timeseries(), expected.timeseries())
+
+
+def test_read_from_disk_filters_excel(test_data_path):
+    fname = os.path.join(test_data_path, "rcp26_emissions.xls")
+    loaded = ScmDataFrame(fname, chunksize=5, filters={"variable": "Emissions|N2O"})
+
+    pd.testing.assert_frame_equal(
+        loaded.timeseries(),
+        ScmDataFrame(fname).filter(variable="Emissions|N2O").timeseries(),
+    )
+
+
+def test_read_from_disk_filters_unsupported(test_data_path):
+    fname = os.path.join(test_data_path, "rcp26_emissions.csv")
+    with pytest.raises(ValueError, match="filter by `year` not supported"):
+        ScmDataFrame(fname, filters={"year": 2010})
+
+
 @pytest.mark.parametrize("separator", ["|", "__", "/", "~", "_", "-"])
 def test_separator_changes(test_scm_df, separator):
     variable = test_scm_df["variable"]
@@ -2009,3 +2315,31 @@ def test_separator_changes(test_scm_df, separator):
             ["Primary Energy{}Coal".format(separator)], index=[1], name="variable"
         ),
     )
+
+
+def test_interpolate_mixed_parameter_types():
+    source_times = [datetime.datetime(y, 1, 1) for y in range(2000, 2006)]
+    df = ScmDataFrame(
+        np.array([[1.0, 2.0, 4.0, 3.0, 5.0, 6.0]] * 4).T * np.arange(1, 5),
+        columns={
+            "scenario": ["a_scenario"],
+            "model": ["a_model"],
+            "region": ["World"],
+            "variable": ["Emissions|BC", "Emissions|CO2", "Surface Temperature", "a"],
+            "unit": ["Mg /yr"],
+            "parameter_type": ["average", "average", "point", "point"],
+        },
+        index=source_times,
+    )
+    target_times = [
+        datetime.datetime(y, m, 1) for y in range(2000, 2005) for m in (1, 7)
+    ]
+
+    res = df.interpolate(target_times)
+
+    assert res["parameter_type"].tolist() == ["average", "average", "point", "point"]
+    for (_, row), (_, res_row) in zip(
+        df.timeseries().iterrows(), res.timeseries().iterrows()
+    ):
+        single = df.filter(variable=row.name[3]).interpolate(target_times)
+        npt.assert_allclose(res_row.values, single.values.squeeze())
@@ -5,7 +5,13 @@ import numpy as np
 import numpy.testing as npt
 import pytest
 
-from openscm.scmdataframe.timeindex import TimeIndex, to_int
+from openscm.scmdataframe.timeindex import (
+    TimeIndex,
+    _format_datetime,
+    datetimes_to_openscm,
+    to_int,
+)
+from openscm.utils import convert_datetime_to_openscm_time
 
 
 def test_to_int_value_error():
@@ -62,3 +68,146 @@ def test_timeindex_item_assignment():
     error_msg = re.escape("'TimeIndex' object does not support item assignment")
     with pytest.raises(TypeError, match=error_msg):
         idx["openscm"] = inp
+
+
+def test_timeindex_getitem():
+    idx = TimeIndex(openscm_dt=[0, 10, 20, 30])
+    obs = idx[1:3]
+
+    assert len(obs) == 2
+    npt.assert_array_equal(obs.as_openscm(), [10, 20])
+    npt.assert_array_equal(
+        obs.as_py(),
+        [dt.datetime(1970, 1, 1, 0, 0, 10), dt.datetime(1970, 1, 1, 0, 0, 20)],
+    )
+
+
+@pytest.mark.parametrize(
+    "idx",
+    [
+        TimeIndex(openscm_dt=[0, 10, 20, 30]),
+        TimeIndex(py_dt=[2000, 2010, 2020, 2030]),
+        TimeIndex(py_dt=["2000-01-01", "2010-01-01", "2020-01-01", "2030-01-01"]),
+        TimeIndex(openscm_dt=[0, 10, 20, 30])[[1, 2]],
+    ],
+)
+def test_timeindex_arrays_read_only(idx):
+    for arr in [
+        idx.as_openscm(),
+        idx.as_py(),
+        idx.years(),
+        idx.months(),
+        idx.days(),
+        idx.hours(),
+        idx.weekdays(),
+    ]:
+        with pytest.raises(ValueError, match="read-only"):
+            arr[0] = 0
+
+
+def test_timeindex_openscm_dt_not_aliased():
+    inp = np.array([0, 10], dtype=np.int64)
+    TimeIndex(openscm_dt=inp)
+    inp[0] = 5  # the input stays writable
+
+
+def test_timeindex_calendar_fields():
+    np.random.seed(0)
+    openscm_dt = np.concatenate(
+        [
+            np.random.randint(-62135596800, 253402300799, size=1000),
+            [0, -1, 86399, 86400, 951782400, -62135596800, 253402300799],
+        ]
+    )
+    idx = TimeIndex(openscm_dt=openscm_dt)
+    exp = [dt.datetime(1970, 1, 1) + dt.timedelta(seconds=int(s)) for s in openscm_dt]
+
+    npt.assert_array_equal(idx.as_py(), exp)
+    npt.assert_array_equal(idx.years(), [d.year for d in exp])
+    npt.assert_array_equal(idx.months(), [d.month for d in exp])
+    npt.assert_array_equal(idx.days(), [d.day for d in exp])
+    npt.assert_array_equal(idx.hours(), [d.hour for d in exp])
+    npt.assert_array_equal(idx.weekdays(), [d.weekday() for d in exp])
+
+    npt.assert_array_equal(TimeIndex(py_dt=exp).as_openscm(), openscm_dt)
+
+
+def test_timeindex_calendar_fields_sub_second():
+    exp = [
+        dt.datetime(1969, 12, 31, 23, 59, 59, 999999),
+        dt.datetime(1899, 12, 31, 0, 0, 0, 500000),
+        dt.datetime(1970, 1, 1, 0, 0, 0, 1),
+    ]
+    idx = TimeIndex(py_dt=exp)
+
+    npt.assert_array_equal(idx.as_py(), exp)
+    npt.assert_array_equal(idx.years(), [d.year for d in exp])
+    npt.assert_array_equal(idx.months(), [d.month for d in exp])
+    npt.assert_array_equal(idx.days(), [d.day for d in exp])
+    npt.assert_array_equal(idx.hours(), [d.hour for d in exp])
+    npt.assert_array_equal(idx.weekdays(), [d.weekday() for d in exp])
+
+
+def test_timeindex_calendar_fields_outside_datetime_range():
+    idx = TimeIndex(openscm_dt=[-62135596800 - 86400, 253402300800 + 3600])
+
+    npt.assert_array_equal(idx.years(), [0, 10000])
+    npt.assert_array_equal(idx.months(), [12, 1])
+    npt.assert_array_equal(idx.days(), [31, 1])
+    npt.assert_array_equal(idx.hours(), [0, 1])
+    with pytest.raises(OverflowError):
+        idx.as_py()
+
+
+@pytest.mark.parametrize(
+    "years",
+    [
+        np.arange(1, 9999),
+        np.arange(1, 9999).astype(object),
+        np.random.RandomState(0).uniform(1, 9998, size=2000),
+        np.random.RandomState(0).uniform(1, 9998, size=2000).astype(object),
+        np.array([1765.0, 1765.083, 1765.167, 2000.5, 2100]),
+    ],
+)
+def test_timeindex_years(years):
+    idx = TimeIndex(py_dt=years)
+    exp_py = _format_datetime(years)
+
+    npt.assert_array_equal(idx.as_py(), exp_py)
+    npt.assert_array_equal(
+        idx.as_openscm(), [convert_datetime_to_openscm_time(d) for d in exp_py]
+    )
+
+
+@pytest.mark.parametrize(
+    "years",
+    [
+        np.array([2000, 2001.5], dtype=object),
+        np.array([0.5, 10000.5]),
+        np.array([2000.0, np.nan]),
+    ],
+)
+def test_timeindex_years_fallback(years):
+    with pytest.raises(ValueError):
+        TimeIndex(py_dt=years)
+
+
+@pytest.mark.parametrize("py_dt", [[], np.array([]), np.array([], dtype=object)])
+def test_timeindex_empty(py_dt):
+    idx = TimeIndex(py_dt=py_dt)
+
+    assert idx.as_openscm().dtype == np.int64
+    assert len(idx.as_openscm()) == 0
+    assert len(idx.as_py()) == 0
+
+
+def test_datetimes_to_openscm():
+    dts = [
+        dt.datetime(1765, 1, 1, 0, 0, 0, 500000),
+        dt.datetime(1970, 1, 1),
+        dt.datetime(2100, 6, 30, 12, 0, 0, 999999),
+    ]
+
+    npt.assert_array_equal(
+        datetimes_to_openscm(dts), [convert_datetime_to_openscm_time(d) for d in dts]
+    )
@@ -1,23 +1,69 @@
 import re
+import sys
+import threading
+import tracemalloc
 
 import numpy as np
 import pytest
+import scipy.integrate as integrate
+import scipy.interpolate as interpolate
 
 from openscm import timeseries_converter
-from openscm.errors import InsufficientDataError
+from openscm.errors import InsufficientDataError, TimeseriesPointsValuesMismatchError
+from openscm.parameters import ParameterType
+
+
+def _convert_numerically(source, target, values, timeseries_type, extrapolation_type):
+    """
+    Convert with scipy's interpolation and numerical integration as reference
+    """
+    res = []
+    for row in np.atleast_2d(values):
+        if timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+            x = timeseries_converter._calc_linearization_points(source)
+            y = timeseries_converter._calc_integral_preserving_linear_interpolation(row)
+        else:
+            x, y = source, row
+        if extrapolation_type == timeseries_converter.ExtrapolationType.LINEAR:
+            kwargs = {"fill_value": "extrapolate"}
+        elif extrapolation_type == timeseries_converter.ExtrapolationType.CONSTANT:
+            kwargs = {"fill_value": (row[0], row[-1]), "bounds_error": False}
+        else:
+            kwargs = {}
+        continuous_representation = interpolate.interp1d(x, y, **kwargs)
+
+        if timeseries_type == ParameterType.POINT_TIMESERIES:
+            res.append(continuous_representation(target))
+        else:
+            res.append(
+                [
+                    integrate.quad(
+                        continuous_representation,
+                        lower,
+                        upper,
+                        points=x[(x > lower) & (x < upper)],
+                        limit=len(x) + 50,
+                    )[0]
+                    / (upper - lower)
+                    for lower, upper in zip(target[:-1], target[1:])
+                ]
+            )
+
+    return np.reshape(res, np.shape(values)[:-1] + (-1,))
 
 
 def test_short_data(combo):
-    timeseriesconverter = timeseries_converter.TimeseriesConverter(
-        combo.source,
-        combo.target,
-        combo.timeseries_type,
-        combo.interpolation_type,
-        combo.extrapolation_type,
-    )
-    for a in [[], [0], [0, 1]]:
+    extra = 1 if combo.timeseries_type == ParameterType.AVERAGE_TIMESERIES else 0
+    for length in [1, 2]:
+        timeseriesconverter = timeseries_converter.TimeseriesConverter(
+            combo.source[: length + extra],
+            combo.target,
+            combo.timeseries_type,
+            combo.interpolation_type,
+            combo.extrapolation_type,
+        )
         with pytest.raises(InsufficientDataError):
-            timeseriesconverter._convert(np.array(a), combo.source, combo.target)
+            timeseriesconverter.convert_from(np.zeros(length))
 
 
 def test_none_extrapolation_error(combo):
@@ -34,4 +80,231 @@ def test_none_extrapolation_error(combo):
         "extrapolation type other than None"
     )
     with pytest.raises(InsufficientDataError, match=error_msg):
-        timeseriesconverter._convert(combo.source_values, combo.source, target)
+        timeseriesconverter.convert_from(combo.source_values)
+
+
+@pytest.mark.parametrize(
+    "extrapolation_type",
+    [
+        timeseries_converter.ExtrapolationType.CONSTANT,
+        timeseries_converter.ExtrapolationType.LINEAR,
+    ],
+)
+def test_linear_interval_averages_match_numerical_integration(extrapolation_type):
+    np.random.seed(0)
+    source = np.cumsum(np.random.uniform(1, 10, 21)) * 1e5
+    values = np.random.uniform(-5, 5, 20)
+    target = np.concatenate(
+        ([source[0] - 1e6], np.sort(np.random.uniform(source[0], source[-1] + 1e6, 49)))
+    )
+
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        source,
+        target,
+        ParameterType.AVERAGE_TIMESERIES,
+        timeseries_converter.InterpolationType.LINEAR,
+        extrapolation_type,
+    )
+    expected = _convert_numerically(
+        source, target, values, ParameterType.AVERAGE_TIMESERIES, extrapolation_type
+    )
+    res = timeseriesconverter.convert_from(values)
+
+    np.testing.assert_allclose(res, expected, rtol=1e-8, atol=1e-8)
+
+
+@pytest.mark.parametrize(
+    "timeseries_type",
+    [ParameterType.AVERAGE_TIMESERIES, ParameterType.POINT_TIMESERIES],
+)
+@pytest.mark.parametrize(
+    "extrapolation_type",
+    [
+        timeseries_converter.ExtrapolationType.NONE,
+        timeseries_converter.ExtrapolationType.CONSTANT,
+        timeseries_converter.ExtrapolationType.LINEAR,
+    ],
+)
+def test_conversion_operators_match_numerical_conversion(
+    timeseries_type, extrapolation_type
+):
+    np.random.seed(0)
+    source = np.cumsum(np.random.uniform(1, 10, 31)) * 1e5
+    values = np.random.uniform(-5, 5, (3, 31))
+    if timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+        values = values[:, :-1]
+    if extrapolation_type == timeseries_converter.ExtrapolationType.NONE:
+        target = np.random.uniform(source[0], source[-1], 10)
+    else:
+        target = np.random.uniform(source[0], source[-1], 10)
+        target[[0, -1]] = [source[0] - 5e6, source[-1] + 5e6]
+    # include time points coinciding with the source and a very long interval
+    target = np.unique(np.concatenate((target, source[5:8], [source[-1]])))
+
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        source,
+        target,
+        timeseries_type,
+        timeseries_converter.InterpolationType.LINEAR,
+        extrapolation_type,
+    )
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_from(values),
+        _convert_numerically(
+            source, target, values, timeseries_type, extrapolation_type
+        ),
+        rtol=1e-8,
+        atol=1e-8,
+    )
+
+
+def test_conversion_operator_long_timeseries():
+    # monthly averages over 500 years to annual averages
+    source = np.arange(6001) * 2629800.0
+    target = np.arange(501) * 31557600.0
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        source,
+        target,
+        ParameterType.AVERAGE_TIMESERIES,
+        timeseries_converter.InterpolationType.LINEAR,
+        timeseries_converter.ExtrapolationType.CONSTANT,
+    )
+
+    tracemalloc.start()
+    try:
+        res = timeseriesconverter.convert_from(np.ones(6000))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    np.testing.assert_allclose(res, 1)
+    # linear in the length rather than a dense (6000 x 6000 floats = 288 MB) array
+    assert peak < 1000 * 6000
+    assert timeseriesconverter._convert_from_operator.nnz < 10 * 6000
+
+
+def test_conversion_operators_are_reused(combo):
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        combo.source,
+        combo.target,
+        combo.timeseries_type,
+        combo.interpolation_type,
+        combo.extrapolation_type,
+    )
+    assert timeseriesconverter._convert_from_operator is None
+    assert timeseriesconverter._convert_to_operator is None
+
+    timeseriesconverter.convert_from(combo.source_values)
+    operator = timeseriesconverter._convert_from_operator
+    assert operator.shape == (
+        timeseriesconverter.target_length,
+        timeseriesconverter.source_length,
+    )
+    assert timeseriesconverter._convert_to_operator is None
+
+    values = timeseriesconverter.convert_from(combo.source_values)
+    assert timeseriesconverter._convert_from_operator is operator
+    np.testing.assert_allclose(values, combo.target_values, atol=1e-10 * values.max())
+
+    with pytest.raises(TimeseriesPointsValuesMismatchError):
+        timeseriesconverter.convert_from(combo.source_values[:-1])
+
+
+def test_convert_many_timeseries(combo):
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        combo.source,
+        combo.target,
+        combo.timeseries_type,
+        combo.interpolation_type,
+        combo.extrapolation_type,
+    )
+    source_values = np.array([combo.source_values, 2 * combo.source_values])
+    target_values = np.array([combo.target_values, 2 * combo.target_values])
+
+    values = timeseriesconverter.convert_from(source_values)
+    assert values.shape == target_values.shape
+    np.testing.assert_allclose(values, target_values, atol=1e-10 * values.max())
+
+    values = timeseriesconverter.convert_to(target_values)
+    expected = np.array([timeseriesconverter.convert_to(v) for v in target_values])
+    np.testing.assert_allclose(values, expected)
+
+    with pytest.raises(TimeseriesPointsValuesMismatchError):
+        timeseriesconverter.convert_from(source_values[:, :-1])
+
+
+def test_timeseries_converter_cache(combo):
+    cache = timeseries_converter.TimeseriesConverterCache(maxsize=2)
+    args = (combo.timeseries_type, combo.interpolation_type, combo.extrapolation_type)
+
+    first = cache.get(combo.source, combo.target, *args)
+    assert cache.info() == (0, 1, 2, 1)
+    assert cache.get(combo.source.copy(), combo.target.copy(), *args) is first
+    assert cache.info() == (1, 1, 2, 1)
+
+    reverse = cache.get(combo.target, combo.source, *args)
+    assert reverse is not first
+    assert cache.get(combo.source, combo.target, *args) is first
+    assert cache.info() == (2, 2, 2, 2)
+
+    # least recently used converter (``reverse``) is evicted
+    cache.get(combo.source - 1, combo.target, *args)
+    assert cache.info().currsize == 2
+    assert cache.get(combo.source, combo.target, *args) is first
+    assert cache.get(combo.target, combo.source, *args) is not reverse
+
+    cache.clear()
+    assert cache.info() == (0, 0, 2, 0)
+
+
+def test_timeseries_converter_cache_threads(combo):
+    cache = timeseries_converter.TimeseriesConverterCache(maxsize=2)
+    args = (combo.timeseries_type, combo.interpolation_type, combo.extrapolation_type)
+    errors = []
+
+    def do_gets():
+        try:
+            for i in range(200):
+                cache.get(combo.source - i % 4, combo.target, *args)
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    # switch threads often to provoke interleaved lookups and evictions
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=do_gets) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert not errors
+    info = cache.info()
+    assert info.hits + info.misses == 8 * 200
+    assert info.currsize == 2
+
+
+def test_timeseries_converter_cache_disabled(combo):
+    cache = timeseries_converter.TimeseriesConverterCache(maxsize=0)
+    args = (
+        combo.source,
+        combo.target,
+        combo.timeseries_type,
+        combo.interpolation_type,
+        combo.extrapolation_type,
+    )
+
+    assert cache.get(*args) is not cache.get(*args)
+    assert cache.info() == (0, 2, 0, 0)
+
+
+def test_timeseries_converter_cache_unlimited(combo):
+    cache = timeseries_converter.TimeseriesConverterCache(maxsize=None)
+    args = (combo.timeseries_type, combo.interpolation_type, combo.extrapolation_type)
+
+    converters = [cache.get(combo.source - i, combo.target, *args) for i in range(3)]
+    assert cache.info() == (0, 3, None, 3)
+    assert cache.get(combo.source, combo.target, *args) is converters[0]
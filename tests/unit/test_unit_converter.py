@@ -7,10 +7,22 @@ from openscm.units import (
     DimensionalityError,
     UndefinedUnitError,
     UnitConverter,
+    _calc_scaling_and_offset,
+    _unit_conversion_factors,
     _unit_registry,
+    precompute_unit_conversions,
 )
 
 
+@pytest.fixture(autouse=True)
+def restore_unit_conversion_factors():
+    # keep entries added or changed by a test out of the process-wide table
+    saved = dict(_unit_conversion_factors)
+    yield
+    _unit_conversion_factors.clear()
+    _unit_conversion_factors.update(saved)
+
+
 def test_conversion_without_offset():
     uc = UnitConverter("kg", "t")
     assert uc._source == "kg"
@@ -64,3 +76,61 @@ def test_metric_conversion_unit_converter_nan():
 def test_properties():
     assert UnitConverter("CO2", "C").contexts
     assert UnitConverter("CO2", "C").unit_registry
+
+
+def test_conversion_factors_memoised():
+    _unit_conversion_factors.pop(("Mt CO2 / yr", "kt C / yr", None), None)
+    uc = UnitConverter("Mt CO2 / yr", "kt C / yr")
+    assert _unit_conversion_factors[("Mt CO2 / yr", "kt C / yr", None)] == (
+        uc._scaling,
+        uc._offset,
+    )
+
+    _unit_conversion_factors[("Mt CO2 / yr", "kt C / yr", None)] = (2, 1)
+    uc = UnitConverter("Mt CO2 / yr", "kt C / yr")
+    assert uc.convert_from(3) == 7
+
+    del _unit_conversion_factors[("Mt CO2 / yr", "kt C / yr", None)]
+    np.testing.assert_allclose(
+        UnitConverter("Mt CO2 / yr", "kt C / yr").convert_from(1), 12 / 44 * 1000
+    )
+
+
+def test_conversion_factors_not_memoised_with_registry_context():
+    _unit_conversion_factors.pop(("kg CH4", "kg CO2", None), None)
+    with _unit_registry.context("AR4GWP100"):
+        uc = UnitConverter("kg CH4", "kg CO2")
+    assert uc.convert_from(1) == 25
+    assert ("kg CH4", "kg CO2", None) not in _unit_conversion_factors
+
+
+def test_precompute_unit_conversions_registry_context():
+    _unit_conversion_factors.clear()
+    with _unit_registry.context("AR4GWP100"):
+        precompute_unit_conversions(mass_units=("kg", "t"))
+    assert not _unit_conversion_factors
+
+
+@pytest.mark.parametrize("context", [None, "AR4GWP100"])
+def test_precompute_unit_conversions(context):
+    precompute_unit_conversions(context=context, mass_units=("kg", "Mt", "t"))
+
+    for source, target in [
+        ("kg CH4", "t CH4"),
+        ("Mt N2O / yr", "kg N2O / yr"),
+        ("t HFC4310mee / yr", "Mt HFC4310mee / yr"),
+    ]:
+        np.testing.assert_allclose(
+            _unit_conversion_factors[(source, target, context)],
+            _calc_scaling_and_offset(source, target, context),
+            rtol=1e-12,
+        )
+    assert ("kg S", "t S", context) not in _unit_conversion_factors
+
+    if context is None:
+        assert ("Mt CH4 / yr", "kg CO2 / yr", context) not in _unit_conversion_factors
+    else:
+        np.testing.assert_allclose(
+            _unit_conversion_factors[("Mt CH4 / yr", "kg CO2 / yr", context)],
+            (25 * 10 ** 9, 0),
+        )
@@ -1,7 +1,15 @@
+import pickle
+
 import numpy as np
 import pytest
 
-from openscm.units import DimensionalityError, _unit_registry
+from openscm.units import (
+    DimensionalityError,
+    ScmUnitRegistry,
+    _load_parsed_definitions,
+    _unit_registry,
+    write_unit_registry_cache,
+)
 
 
 def test_unit_registry():
@@ -151,3 +159,54 @@ def test_metric_conversion(metric_name, species, conversion):
         with _unit_registry.context(metric_name):
             np.testing.assert_allclose(base.to(dest).magnitude, conversion)
             np.testing.assert_allclose(dest.to(base).magnitude, 1 / conversion)
+
+
+def test_unit_registry_cache(tmp_path):
+    cache_file = str(tmp_path / "standard_definitions.pickle")
+    write_unit_registry_cache(cache_file)
+
+    registry = ScmUnitRegistry()
+    registry.add_standards(cache_file=cache_file)
+    np.testing.assert_allclose(
+        (1 * registry("Mt CO2 / yr")).to("kt C / yr").magnitude, 12 / 44 * 1000
+    )
+    assert registry("HFC4310MEE") == registry("HFC4310mee")
+
+
+def test_unit_registry_cache_mismatch(tmp_path):
+    cache_file = str(tmp_path / "standard_definitions.pickle")
+    with open(cache_file, "wb") as f:
+        pickle.dump(("other definitions", []), f)
+
+    registry = ScmUnitRegistry()
+    registry.add_standards(cache_file=cache_file)
+    assert registry("tC") == registry("t * C")
+
+    registry = ScmUnitRegistry()
+    registry.add_standards(cache_file=str(tmp_path / "missing.pickle"))
+    assert registry("tC") == registry("t * C")
+
+
+@pytest.mark.parametrize("content", [b"", b"not a pickle"])
+def test_unit_registry_cache_regenerated(tmp_path, content):
+    cache_file = str(tmp_path / "standard_definitions.pickle")
+    with open(cache_file, "wb") as f:
+        f.write(content)
+    definitions = ScmUnitRegistry.get_standard_definitions()
+
+    assert _load_parsed_definitions(cache_file, definitions) is None
+    registry = ScmUnitRegistry()
+    registry.add_standards(cache_file=cache_file)
+    assert registry("tC") == registry("t * C")
+
+    write_unit_registry_cache(cache_file)
+    parsed_definitions = _load_parsed_definitions(cache_file, definitions)
+    assert [d.name for d in parsed_definitions] == [
+        d.split("=")[0].strip() for d in definitions
+    ]
+
+
+def test_unit_registry_without_cache():
+    registry = ScmUnitRegistry()
+    registry.add_standards()
+    assert registry("HFC4310MEE") == registry("HFC4310mee")